@@ -8,6 +8,7 @@ from flask_cors import CORS
 from src.routes.config import config_bp
 from src.routes.display import display_bp
 from src.routes.backgrounds import backgrounds_bp
+from src.routes.verses import verses_bp
 
 app = Flask(__name__, static_folder=os.path.join(os.path.dirname(__file__), 'static'))
 app.config['SECRET_KEY'] = 'bible-clock-secret-key-2025'
@@ -19,6 +20,7 @@ CORS(app)
 app.register_blueprint(config_bp, url_prefix='/api')
 app.register_blueprint(display_bp, url_prefix='/api')
 app.register_blueprint(backgrounds_bp, url_prefix='/api')
+app.register_blueprint(verses_bp, url_prefix='/api')
 
 @app.route('/', defaults={'path': ''})
 @app.route('/<path:path>')
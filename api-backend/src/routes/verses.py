@@ -0,0 +1,129 @@
+from flask import Blueprint, request, jsonify
+import os
+import sys
+
+verses_bp = Blueprint('verses', __name__)
+
+# Path to the Bible Clock (its src/ modules are shared with the clock service)
+BIBLE_CLOCK_PATH = '/home/ubuntu/bible-clock-enhanced'
+VERSE_CACHE_FILE = os.path.join(BIBLE_CLOCK_PATH, 'data', 'cache', 'verses.db')
+VERSE_STORE_DIR = os.path.join(BIBLE_CLOCK_PATH, 'data', 'bible')
+MAX_PAGE_SIZE = 100
+
+sys.path.insert(0, os.path.join(BIBLE_CLOCK_PATH, 'src'))
+
+_verse_cache = None
+_verse_store = None  # (reference index mtime or None, VerseStore)
+_search_indexes = {}  # version -> (index file mtime or None, SearchIndex)
+
+def get_verse_cache():
+    """Open the clock's persistent verse cache on first use"""
+    global _verse_cache
+    if _verse_cache is None:
+        from verse_cache import PersistentVerseCache
+        _verse_cache = PersistentVerseCache(VERSE_CACHE_FILE)
+    return _verse_cache
+
+def get_verse_store():
+    """Open the clock's local verse store, reopening it when its reference index changes"""
+    global _verse_store
+    
+    # build_verse_store.py rewrites refs.idx for every translation it adds, and
+    # the open store keeps the old index and any translation it could not map
+    if _verse_store is None or _file_mtime(_verse_store[1].index_file) != _verse_store[0]:
+        from verse_store import VerseStore
+        store = VerseStore(VERSE_STORE_DIR, 'kjv')
+        _verse_store = (_file_mtime(store.index_file), store)
+    
+    return _verse_store[1]
+
+def _file_mtime(path):
+    """Modification time of a file, or None if it does not exist"""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+def get_search_index(version):
+    """Open the search index for a translation, reopening it when the index file changes"""
+    from search_index import SearchIndex
+    entry = _search_indexes.get(version)
+    
+    # Reopen when the index was built, rebuilt or removed since it was opened.
+    # The old handle is left for garbage collection, as a search may still be
+    # using it.
+    if entry is None or _file_mtime(entry[1].index_file) != entry[0]:
+        index = SearchIndex(VERSE_STORE_DIR, version)
+        entry = _search_indexes[version] = (_file_mtime(index.index_file), index)
+    
+    return entry[1]
+
+@verses_bp.route('/verses/cache', methods=['GET'])
+def get_cache_stats():
+    """Get persistent verse cache statistics"""
+    try:
+        cache = get_verse_cache()
+        version = request.args.get('version')
+        
+        return jsonify({
+            'path': VERSE_CACHE_FILE,
+            'entries': cache.count(version),
+            'version': version
+        })
+        
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@verses_bp.route('/verses/lookup', methods=['GET'])
+def lookup_verse():
+    """Look up a verse in the persistent verse cache"""
+    try:
+        reference = request.args.get('reference', '').strip()
+        version = request.args.get('version', 'kjv')
+        
+        if not reference:
+            return jsonify({'error': 'reference is required'}), 400
+        
+        # Cache keys are canonical references ("Psalms 23:1" for "Ps 23:1")
+        from canon import normalize_reference
+        reference = normalize_reference(reference) or reference
+        
+        verse_data = get_verse_cache().get(version, reference)
+        if not verse_data:
+            return jsonify({'error': f'{reference} not cached'}), 404
+        
+        return jsonify(verse_data)
+        
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@verses_bp.route('/verses/search', methods=['GET'])
+def search_verses():
+    """Full-text verse search, ranked and paginated"""
+    try:
+        query = request.args.get('q', '').strip()
+        version = request.args.get('version', 'kjv').lower()
+        page = max(1, request.args.get('page', 1, type=int))
+        per_page = min(max(1, request.args.get('per_page', 20, type=int)), MAX_PAGE_SIZE)
+        
+        if not query:
+            return jsonify({'error': 'q is required'}), 400
+        
+        index = get_search_index(version)
+        if not index.available:
+            return jsonify({'error': f'No search index for {version}'}), 404
+        
+        results = index.search(query, page=page, per_page=per_page)
+        
+        # Attach verse text from the local store
+        from canon import book_number
+        store = get_verse_store()
+        for result in results['results']:
+            result['text'] = store.get_text(book_number(result['book']), result['chapter'],
+                                            result['verse'], version)
+        
+        results['version'] = version
+        return jsonify(results)
+        
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Verse Resolution Benchmark
+
+This script drives VerseManager.get_verse_for_time across all 1440 minutes
+of a day and reports latency percentiles, API requests per minute and cache
+hit ratios. By default it runs against the local bible-api stand-in with a
+fresh persistent cache, so results are repeatable and never touch the
+public service.
+"""
+
+import sys
+import os
+import time
+import random
+import argparse
+import logging
+import tempfile
+from collections import Counter
+
+# Add src directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from config import config
+from bible_api import BibleAPI
+from verse_manager import VerseManager
+from bible_api_standin import start_standin
+
+
+def percentile(samples, fraction):
+    """Nearest-rank percentile of pre-sorted samples"""
+    if not samples:
+        return 0.0
+    rank = max(1, int(round(fraction * len(samples))))
+    return samples[min(rank, len(samples)) - 1]
+
+
+def run_day(verse_manager, bible_api):
+    """Resolve every minute of the day once and collect per-minute results"""
+    latencies = []
+    requests_per_minute = []
+    sources = Counter()
+    missing = 0
+
+    for hour in range(24):
+        for minute in range(60):
+            requests_before = bible_api.api_requests
+            start = time.perf_counter()
+            verse_data = verse_manager.get_verse_for_time(hour, minute)
+            latencies.append(time.perf_counter() - start)
+            requests_per_minute.append(bible_api.api_requests - requests_before)
+
+            if verse_data:
+                sources[verse_data.get('source', 'unknown')] += 1
+            else:
+                missing += 1
+
+    return latencies, requests_per_minute, sources, missing
+
+
+def report(label, latencies, requests_per_minute, sources, missing, stats):
+    """Print a summary for one pass over the day"""
+    ordered = sorted(latencies)
+    minutes = len(latencies)
+    offline = sum(1 for count in requests_per_minute if count == 0)
+    memory_cache = stats['memory_cache']
+    persistent_cache = stats['persistent_cache']
+
+    print(f"\n=== {label} ===")
+    print(f"  Minutes resolved: {minutes - missing}/{minutes}")
+    print(f"  Latency p50: {percentile(ordered, 0.50) * 1000:.2f} ms")
+    print(f"  Latency p95: {percentile(ordered, 0.95) * 1000:.2f} ms")
+    print(f"  Latency p99: {percentile(ordered, 0.99) * 1000:.2f} ms")
+    print(f"  Latency max: {ordered[-1] * 1000:.2f} ms")
+    print(f"  API requests: {sum(requests_per_minute)} "
+          f"({sum(requests_per_minute) / minutes:.2f}/minute, max {max(requests_per_minute)})")
+    print(f"  Minutes served without a request: {offline / minutes:.1%}")
+    print(f"  Memory cache hit rate: {memory_cache['hit_rate']:.1%}")
+    print(f"  Persistent cache hit rate: {persistent_cache['hit_rate']:.1%}")
+    print(f"  Circuit breaker: {stats['circuit_breaker']['state']} "
+          f"(opened {stats['circuit_breaker']['times_opened']} times)")
+    print(f"  Rate limiter: {stats['rate_limiter']['throttled']} throttles, "
+          f"{stats['rate_limiter']['rejected']} rejected, {stats['rate_limiter']['total_wait']:.1f}s waited")
+    print(f"  Sources: {dict(sources)}")
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description='Benchmark verse resolution over a full day')
+    parser.add_argument('--api-url', help='Benchmark against this API instead of the local stand-in')
+    parser.add_argument('--latency', type=float, default=0.05, help='Stand-in mean response delay in seconds')
+    parser.add_argument('--jitter', type=float, default=0.02, help='Stand-in delay jitter in seconds')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Stand-in fraction of 500 responses')
+    parser.add_argument('--missing-rate', type=float, default=0.0, help='Stand-in fraction of 404 responses')
+    parser.add_argument('--throttle-rate', type=float, default=0.0, help='Stand-in fraction of 429 responses')
+    parser.add_argument('--rate-limit', type=float, default=0.0,
+                        help='Client requests per second (default: 0, unlimited; use RATE_LIMIT for real APIs)')
+    parser.add_argument('--passes', type=int, default=2, help='Passes over the day (later passes are warm)')
+    parser.add_argument('--store', action='store_true', help='Use the configured local verse store')
+    parser.add_argument('--seed', type=int, default=1, help='Random seed for verse selection')
+
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.ERROR)
+    random.seed(args.seed)
+
+    server = None
+    api_url = args.api_url
+    if not api_url:
+        server, api_url = start_standin(latency=args.latency, jitter=args.jitter,
+                                        error_rate=args.error_rate, missing_rate=args.missing_rate,
+                                        throttle_rate=args.throttle_rate, seed=args.seed)
+        print(f"Started bible-api stand-in at {api_url}")
+
+    with tempfile.TemporaryDirectory(prefix='bible-clock-bench-') as work_dir:
+        bible_api = BibleAPI(
+            api_url=api_url,
+            version=config.BIBLE_VERSION,
+            fallback_enabled=config.FALLBACK_ENABLED,
+            store_path=config.VERSE_STORE_PATH if args.store else os.path.join(work_dir, 'bible'),
+            cache_path=os.path.join(work_dir, 'verses.db'),
+            cache_size=config.CACHE_SIZE,
+            cache_ttl=config.CACHE_TTL,
+            bulk_fetch=config.BULK_FETCH,
+            negative_cache_ttl=config.NEGATIVE_CACHE_TTL,
+            probe_concurrency=config.PROBE_CONCURRENCY,
+            retry_attempts=config.RETRY_ATTEMPTS,
+            retry_backoff=config.RETRY_BACKOFF,
+            circuit_failure_threshold=config.CIRCUIT_FAILURE_THRESHOLD,
+            circuit_reset_timeout=config.CIRCUIT_RESET_TIMEOUT,
+            circuit_max_reset_timeout=config.CIRCUIT_MAX_RESET_TIMEOUT,
+            rate_limit=args.rate_limit,
+            rate_burst=config.RATE_BURST,
+            rate_limit_wait=config.RATE_LIMIT_WAIT
+        )
+        verse_manager = VerseManager(bible_api)
+
+        for number in range(1, args.passes + 1):
+            results = run_day(verse_manager, bible_api)
+            label = 'Pass 1 (cold cache)' if number == 1 else f"Pass {number} (warm cache)"
+            report(label, *results, bible_api.get_cache_stats())
+
+        bible_api.persistent_cache.close()
+
+    if server:
+        server.shutdown()
+        print(f"\nStand-in: {server.state.get_stats()}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Local bible-api.com Stand-in
+
+This script serves a local imitation of bible-api.com for benchmarking and
+testing without touching the public service. It answers the same URL scheme
+("/John%203:16" for a verse, "/John%203" for a chapter) with the same
+response shape, using canonical verse counts to decide what exists. Verse
+text is synthetic. Latency, error rate, 404 and 429 behaviour are
+configurable.
+"""
+
+import sys
+import os
+import re
+import json
+import time
+import random
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlsplit
+
+# Add src directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from canon import book_number, book_name, verse_count
+
+_PATH_PATTERN = re.compile(r'^\s*(.+?)\s+(\d+)(?::(\d+))?\s*$')
+
+TRANSLATION_NAMES = {
+    'kjv': 'King James Version',
+    'web': 'World English Bible',
+    'asv': 'American Standard Version (1901)',
+    'bbe': 'Bible in Basic English',
+}
+
+_FILLER = ("and the word of the Lord came unto them saying walk in my ways "
+           "and keep my statutes that it may be well with thee").split()
+
+
+def synthetic_text(book: int, chapter: int, verse: int) -> str:
+    """Deterministic placeholder text with a realistic spread of lengths"""
+    rng = random.Random((book << 16) ^ (chapter << 8) ^ verse)
+    words = [rng.choice(_FILLER) for _ in range(rng.randint(8, 60))]
+    return f"{book_name(book)} {chapter}:{verse} " + ' '.join(words) + '.'
+
+
+class StandinState:
+    """Behaviour settings and request counters shared by all handlers"""
+
+    def __init__(self, latency: float = 0.05, jitter: float = 0.02,
+                 error_rate: float = 0.0, missing_rate: float = 0.0,
+                 throttle_rate: float = 0.0, retry_after: int = 2, seed: int = None):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.missing_rate = missing_rate
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+
+        self.requests = 0
+        self.errors = 0
+        self.not_found = 0
+        self.throttled = 0
+
+    def draw(self):
+        """Pick this request's delay and failure mode"""
+        with self.lock:
+            self.requests += 1
+            delay = max(0.0, self.latency + self.rng.uniform(-self.jitter, self.jitter))
+            fail = self.rng.random() < self.error_rate
+            drop = self.rng.random() < self.missing_rate
+            throttle = self.rng.random() < self.throttle_rate
+            if fail:
+                self.errors += 1
+            elif throttle:
+                self.throttled += 1
+        return delay, fail, drop, throttle
+
+    def get_stats(self):
+        """Get request counters"""
+        with self.lock:
+            return {'requests': self.requests, 'errors': self.errors, 'not_found': self.not_found,
+                    'throttled': self.throttled}
+
+
+class StandinHandler(BaseHTTPRequestHandler):
+    """Request handler mimicking bible-api.com"""
+
+    server_version = 'BibleApiStandin/1.0'
+
+    def do_GET(self):
+        state = self.server.state
+        delay, fail, drop, throttle = state.draw()
+        time.sleep(delay)
+
+        if fail:
+            self._send(500, {'error': 'internal server error'})
+            return
+        if throttle:
+            self._send(429, {'error': 'too many requests'}, {'Retry-After': str(state.retry_after)})
+            return
+
+        url = urlsplit(self.path)
+        translation = parse_qs(url.query).get('translation', ['web'])[0].lower()
+        body = self._lookup(unquote(url.path.lstrip('/')), translation, drop)
+        if body is None:
+            with state.lock:
+                state.not_found += 1
+            self._send(404, {'error': 'not found'})
+        else:
+            self._send(200, body)
+
+    def _lookup(self, reference, translation, drop):
+        """Build a verse or chapter response, or None if it does not exist"""
+        match = _PATH_PATTERN.match(reference)
+        if not match:
+            return None
+
+        number = book_number(match.group(1))
+        if number is None:
+            return None
+
+        chapter = int(match.group(2))
+        count = verse_count(number, chapter)
+        if match.group(3):
+            first = last = int(match.group(3))
+        else:
+            first, last = 1, count
+
+        # missing_rate simulates verses the service cannot find
+        if not 1 <= first <= last <= count or drop:
+            return None
+
+        name = book_name(number)
+        verses = [{
+            'book_id': name[:3].upper().replace(' ', ''),
+            'book_name': name,
+            'chapter': chapter,
+            'verse': verse,
+            'text': synthetic_text(number, chapter, verse) + '\n'
+        } for verse in range(first, last + 1)]
+
+        return {
+            'reference': f"{name} {chapter}:{first}" if first == last else f"{name} {chapter}",
+            'verses': verses,
+            'text': ''.join(v['text'] for v in verses),
+            'translation_id': translation,
+            'translation_name': TRANSLATION_NAMES.get(translation, translation.upper()),
+            'translation_note': 'Public Domain'
+        }
+
+    def _send(self, status, body, headers=None):
+        payload = json.dumps(body).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        # Keep benchmark output clean
+        pass
+
+
+def start_standin(host: str = '127.0.0.1', port: int = 0, **settings):
+    """
+    Start the stand-in server on a background thread
+
+    Args:
+        host: Interface to bind
+        port: Port to bind (0 picks a free port)
+        settings: StandinState keyword arguments
+
+    Returns:
+        Tuple of (server, base URL)
+    """
+    server = ThreadingHTTPServer((host, port), StandinHandler)
+    server.daemon_threads = True
+    server.state = StandinState(**settings)
+
+    thread = threading.Thread(target=server.serve_forever, name='bible-api-standin', daemon=True)
+    thread.start()
+
+    return server, f"http://{host}:{server.server_address[1]}"
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description='Local bible-api.com stand-in server')
+    parser.add_argument('--host', default='127.0.0.1', help='Interface to bind (default: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=8765, help='Port to bind (default: 8765)')
+    parser.add_argument('--latency', type=float, default=0.05, help='Mean response delay in seconds')
+    parser.add_argument('--jitter', type=float, default=0.02, help='Uniform delay jitter in seconds')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Fraction of requests answered with 500')
+    parser.add_argument('--missing-rate', type=float, default=0.0, help='Fraction of requests answered with 404')
+    parser.add_argument('--throttle-rate', type=float, default=0.0, help='Fraction of requests answered with 429')
+    parser.add_argument('--retry-after', type=int, default=2, help='Retry-After seconds sent with 429 responses')
+    parser.add_argument('--seed', type=int, help='Random seed for reproducible behaviour')
+
+    args = parser.parse_args()
+
+    server, url = start_standin(args.host, args.port, latency=args.latency, jitter=args.jitter,
+                                error_rate=args.error_rate, missing_rate=args.missing_rate,
+                                throttle_rate=args.throttle_rate, retry_after=args.retry_after,
+                                seed=args.seed)
+    print(f"Serving bible-api stand-in at {url} (BIBLE_API_URL={url})")
+
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.shutdown()
+        print(f"Stats: {server.state.get_stats()}")
+
+
+if __name__ == '__main__':
+    main()
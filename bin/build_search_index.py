@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Build Verse Search Index
+
+This script builds the inverted full-text search index for translations in
+the local verse store. The web backend uses it to answer /api/verses/search.
+Rebuild it whenever a translation in the store is rebuilt.
+"""
+
+import sys
+import os
+import argparse
+
+# Add src directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from verse_store import VerseStore
+from search_index import build_search_index
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description='Build the verse search index')
+    parser.add_argument('--version', action='append',
+                        help='Translation to index (repeatable; default: every translation in the store)')
+    parser.add_argument('--store', default='data/bible', help='Verse store directory (default: data/bible)')
+
+    args = parser.parse_args()
+
+    versions = args.version or VerseStore(args.store, 'kjv').translations()
+    if not versions:
+        print(f"No translations found in {args.store}; build the verse store first")
+        sys.exit(1)
+
+    for version in versions:
+        verses, terms = build_search_index(args.store, version)
+        print(f"Indexed {verses} verses ({terms} terms) for {version}")
+
+
+if __name__ == '__main__':
+    main()
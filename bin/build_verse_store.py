@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Build Local Verse Store
+
+This script converts a JSON verse dump into the compact on-disk verse store
+used by BibleAPI for offline lookups. With --compress the translation is
+written as zlib-compressed blocks of verses, which is much smaller on disk
+and reads only one block per lookup.
+
+Accepted input shapes:
+  - a list of {"book_name"|"book", "chapter", "verse", "text"} objects
+  - a bible-api.com style response with a "verses" list
+  - a mapping of "Book chapter:verse" references to {"text": ...} objects
+    (the data/fallback_verses.json format)
+"""
+
+import sys
+import os
+import json
+import argparse
+
+# Add src directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from canon import book_number, parse_reference
+from verse_store import build_store, DEFAULT_BLOCK_SIZE
+
+
+def iter_verses(data):
+    """Yield (book number, chapter, verse, text) tuples from loaded JSON"""
+    if isinstance(data, dict) and isinstance(data.get('verses'), list):
+        data = data['verses']
+
+    if isinstance(data, list):
+        for item in data:
+            book = item.get('book_name') or item.get('book', '')
+            number = book_number(book)
+            if number is None:
+                print(f"  Skipping unknown book: {book}")
+                continue
+            yield number, int(item['chapter']), int(item['verse']), item.get('text', '')
+
+    elif isinstance(data, dict):
+        for reference, item in data.items():
+            parsed = parse_reference(reference)
+            if parsed is None:
+                print(f"  Skipping unparseable reference: {reference}")
+                continue
+            text = item.get('text', '') if isinstance(item, dict) else str(item)
+            yield parsed + (text,)
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description='Build the local Bible verse store')
+    parser.add_argument('inputs', nargs='+', help='JSON verse files to import')
+    parser.add_argument('--version', default='kjv', help='Translation identifier (default: kjv)')
+    parser.add_argument('--output', default='data/bible', help='Store directory (default: data/bible)')
+    parser.add_argument('--compress', action='store_true',
+                        help='Store the translation as compressed verse blocks (smaller, for SD cards)')
+    parser.add_argument('--block-size', type=int, default=DEFAULT_BLOCK_SIZE,
+                        help=f'Verses per compressed block (default: {DEFAULT_BLOCK_SIZE})')
+
+    args = parser.parse_args()
+
+    verses = []
+    for input_file in args.inputs:
+        print(f"Reading {input_file}")
+        with open(input_file, 'r', encoding='utf-8') as f:
+            verses.extend(v for v in iter_verses(json.load(f)) if v[3].strip())
+
+    count = build_store(args.output, args.version, verses,
+                        compress=args.compress, block_size=args.block_size)
+    print(f"Wrote {count} verses for {args.version} to {args.output}"
+          f"{' (compressed)' if args.compress else ''}")
+
+
+if __name__ == '__main__':
+    main()
@@ -22,6 +22,7 @@ from bible_api import BibleAPI
 from verse_manager import VerseManager, VerseScheduler
 from display import display_manager
 from service_manager import ServiceManager
+from cache_warmer import CacheWarmer
 
 class BibleClockApp:
     """Enhanced Bible Clock Application"""
@@ -56,13 +57,44 @@ class BibleClockApp:
             self.bible_api = BibleAPI(
                 api_url=config.BIBLE_API_URL,
                 version=config.BIBLE_VERSION,
-                fallback_enabled=config.FALLBACK_ENABLED
+                fallback_enabled=config.FALLBACK_ENABLED,
+                store_path=config.VERSE_STORE_PATH,
+                cache_path=config.VERSE_CACHE_PATH,
+                cache_size=config.CACHE_SIZE,
+                cache_ttl=config.CACHE_TTL,
+                bulk_fetch=config.BULK_FETCH,
+                negative_cache_ttl=config.NEGATIVE_CACHE_TTL,
+                probe_concurrency=config.PROBE_CONCURRENCY,
+                retry_attempts=config.RETRY_ATTEMPTS,
+                retry_backoff=config.RETRY_BACKOFF,
+                circuit_failure_threshold=config.CIRCUIT_FAILURE_THRESHOLD,
+                circuit_reset_timeout=config.CIRCUIT_RESET_TIMEOUT,
+                circuit_max_reset_timeout=config.CIRCUIT_MAX_RESET_TIMEOUT,
+                rate_limit=config.RATE_LIMIT,
+                rate_burst=config.RATE_BURST,
+                rate_limit_wait=config.RATE_LIMIT_WAIT
             )
             self.logger.info("Bible API initialized")
             
-            # Initialize verse manager
-            self.verse_manager = VerseManager(self.bible_api)
-            self.verse_scheduler = VerseScheduler(self.verse_manager)
+            # Initialize verse manager, preferring verses that fit the panel
+            text_capacity = None
+            if display_manager and display_manager.image_generator:
+                text_capacity = display_manager.image_generator.estimate_verse_capacity()
+            
+            self.verse_manager = VerseManager(
+                self.bible_api,
+                plan_dir=config.DAY_PLAN_PATH if config.DAY_PLAN_ENABLED else None,
+                fleet_seed=config.FLEET_SEED,
+                text_capacity=text_capacity,
+                rules_path=config.TIME_RULES_PATH
+            )
+            self.verse_manager.prepare_day_plan()
+            self.verse_scheduler = VerseScheduler(
+                self.verse_manager,
+                prefetch_minutes=config.PREFETCH_MINUTES,
+                prefetch_workers=config.PREFETCH_WORKERS,
+                prefetch_interval=config.PREFETCH_INTERVAL
+            )
             self.logger.info("Verse manager initialized")
             
             # Initialize service manager
@@ -84,6 +116,9 @@ class BibleClockApp:
     def update_display(self) -> bool:
         """Update the display with current verse"""
         try:
+            # Pick up settings changed from the web interface
+            self.apply_config_changes()
+            
             # Get current verse
             verse_data = self.verse_scheduler.get_current_verse()
             
@@ -108,6 +143,17 @@ class BibleClockApp:
             display_manager.display_error(f"Update failed: {str(e)[:50]}")
             return False
     
+    def apply_config_changes(self):
+        """Apply settings that can change without a restart"""
+        try:
+            changed = config.reload_runtime_settings()
+        except Exception as e:
+            self.logger.warning(f"Could not reload configuration: {e}")
+            return
+        
+        if 'BIBLE_VERSION' in changed and self.bible_api:
+            self.bible_api.set_version(changed['BIBLE_VERSION'])
+    
     def run_once(self) -> bool:
         """Run a single update cycle"""
         if not self.initialized:
@@ -126,6 +172,9 @@ class BibleClockApp:
         self.logger.info("Starting Bible Clock service")
         
         try:
+            # Resolve upcoming minutes in the background
+            self.verse_scheduler.start_prefetch()
+            
             # Start service manager
             if self.service_manager.start():
                 # Keep main thread alive
@@ -229,6 +278,9 @@ class BibleClockApp:
         if self.verse_manager:
             status['verse_stats'] = self.verse_manager.get_verse_statistics()
         
+        if self.verse_scheduler:
+            status['prefetch'] = self.verse_scheduler.get_prefetch_stats()
+        
         return status
     
     def shutdown(self):
@@ -239,6 +291,9 @@ class BibleClockApp:
             if self.service_manager:
                 self.service_manager.stop()
             
+            if self.verse_scheduler:
+                self.verse_scheduler.stop_prefetch()
+            
             if display_manager:
                 display_manager.shutdown()
             
@@ -256,6 +311,11 @@ def main():
     parser.add_argument('--test', action='store_true', help='Run component tests')
     parser.add_argument('--status', action='store_true', help='Show status and exit')
     parser.add_argument('--simulate', action='store_true', help='Run in simulation mode')
+    parser.add_argument('--warm-cache', action='store_true',
+                        help='Fetch every minute slot into the persistent verse cache and exit')
+    parser.add_argument('--warm-workers', type=int, default=2, help='Concurrent requests when warming (default: 2)')
+    parser.add_argument('--warm-rate', type=float, default=1.0, help='Requests per second when warming (default: 1.0)')
+    parser.add_argument('--warm-limit', type=int, help='Maximum chapters to fetch this run')
     
     args = parser.parse_args()
     
@@ -304,10 +364,52 @@ def main():
                     print(f"  Service Running: {service_status['running']}")
                     print(f"  Updates: {service_status['update_count']}")
                     print(f"  Errors: {service_status['error_count']}")
+                
+                if 'verse_stats' in status:
+                    memory_cache = status['verse_stats']['cache_stats']['memory_cache']
+                    print(f"  Cache: {memory_cache['size']}/{memory_cache['capacity']} entries, "
+                          f"hit rate {memory_cache['hit_rate']:.1%} "
+                          f"({memory_cache['evictions']} evictions, {memory_cache['expirations']} expirations)")
+                    circuit = status['verse_stats']['cache_stats']['circuit_breaker']
+                    print(f"  API Circuit: {circuit['state']} "
+                          f"({circuit['consecutive_failures']} consecutive failures, "
+                          f"opened {circuit['times_opened']} times)")
+                    rate_limiter = status['verse_stats']['cache_stats']['rate_limiter']
+                    print(f"  API Rate Limit: {rate_limiter['rate']}/s, burst {rate_limiter['burst']} "
+                          f"({rate_limiter['throttled']} throttles, {rate_limiter['rejected']} rejected)")
+                    day_plan = status['verse_stats']['day_plan']
+                    if day_plan:
+                        print(f"  Day Plan: {', '.join(day_plan['days'])} "
+                              f"(fleet seed '{day_plan['fleet_seed']}')")
             else:
                 print("Failed to initialize application")
                 sys.exit(1)
         
+        elif args.warm_cache:
+            # Warm the persistent cache (resumable; cached chapters are skipped)
+            if not app.initialize():
+                print("Failed to initialize application")
+                sys.exit(1)
+            
+            warmer = CacheWarmer(
+                app.bible_api,
+                workers=args.warm_workers,
+                rate=args.warm_rate,
+                progress=lambda done, total, item: print(f"  [{done}/{total}] {item}")
+            )
+            
+            print(f"Warming verse cache for {app.bible_api.version.upper()}...")
+            results = warmer.run(limit=args.warm_limit)
+            print(f"Chapters fetched: {results['fetched']}, failed: {results['failed']}, "
+                  f"already cached: {results['skipped']} ({results['api_requests']} API requests)")
+            
+            coverage = warmer.coverage()
+            print(f"Minute coverage: {coverage['slots_covered']}/{coverage['slots_possible']} "
+                  f"({coverage['slot_coverage']:.1%})")
+            print(f"Verse coverage: {coverage['verses_cached']}/{coverage['verses_needed']} "
+                  f"({coverage['verse_coverage']:.1%})")
+            sys.exit(0 if results['failed'] == 0 else 1)
+        
         elif args.once:
             # Run once
             success = app.run_once()
@@ -9,26 +9,75 @@ import requests
 import json
 import logging
 import time
-from typing import Optional, Dict, Any, List
-from pathlib import Path
+from typing import Optional, Dict, Any, List, Sequence, Tuple
 import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from canon import (book_number, book_name, books_for_time, canonical_book, normalize_reference,
+                   parse_reference, reference_key, MINUTE_SLOTS)
+from verse_store import VerseStore, resolve_data_path
+from verse_cache import PersistentVerseCache
+from lru_cache import LRUCache
+from circuit_breaker import CircuitBreaker, CircuitOpenError, RetryBudget, RetryBudgetExhausted
+from rate_limiter import (TokenBucket, RateLimited, parse_retry_after,
+                          DEFAULT_RETRY_AFTER, BACKGROUND_MAX_WAIT)
 
 class BibleAPI:
     """Enhanced Bible API interface with fallback and caching"""
     
     def __init__(self, api_url: str = "https://bible-api.com", 
-                 version: str = "kjv", fallback_enabled: bool = True):
+                 version: str = "kjv", fallback_enabled: bool = True,
+                 store_path: str = "data/bible",
+                 cache_path: str = "data/cache/verses.db",
+                 cache_size: int = 100, cache_ttl: int = 3600,
+                 bulk_fetch: bool = True, negative_cache_ttl: int = 2592000,
+                 probe_concurrency: int = 4, retry_attempts: int = 3,
+                 retry_backoff: float = 0.5, circuit_failure_threshold: int = 3,
+                 circuit_reset_timeout: float = 30, circuit_max_reset_timeout: float = 900,
+                 rate_limit: float = 0.3, rate_burst: int = 5, rate_limit_wait: float = 5,
+                 fallback_path: str = "data/fallback_verses.json"):
         self.api_url = api_url.rstrip('/')
-        self.version = version
+        self.version = version.lower()
         self.fallback_enabled = fallback_enabled
         self.logger = logging.getLogger(__name__)
         
+        # Local verse store, shared by all translations (opened lazily on first lookup)
+        self.verse_store = VerseStore(store_path, version)
+        
         # Cache for API responses
-        self.cache = {}
-        self.cache_timeout = 3600  # 1 hour
+        self.cache = LRUCache(capacity=cache_size, ttl=cache_ttl)
+        self.cache_timeout = cache_ttl
+        
+        # Persistent cache shared across restarts (no expiry, text is immutable)
+        self.persistent_cache = PersistentVerseCache(cache_path, negative_ttl=negative_cache_ttl)
+        
+        # Bulk mode fetches whole chapters and caches every verse in them
+        self.bulk_fetch = bulk_fetch
+        self.fetched_chapters = set()
+        self.api_requests = 0
+        
+        # Concurrent candidate probing (executor created on first use)
+        self.probe_concurrency = max(1, probe_concurrency)
+        self.probe_executor = None
         
-        # Load fallback data
-        self.fallback_verses = self._load_fallback_verses()
+        # Circuit breaker and per-update retry budget for API requests
+        self.circuit_breaker = CircuitBreaker(
+            failure_threshold=circuit_failure_threshold,
+            reset_timeout=circuit_reset_timeout,
+            max_reset_timeout=circuit_max_reset_timeout
+        )
+        self.retry_attempts = max(0, retry_attempts)
+        self.retry_backoff = retry_backoff
+        self._update_state = threading.local()
+        
+        # Shared token bucket for every request; the minute on screen goes first
+        self.rate_limiter = TokenBucket(rate=rate_limit, burst=rate_burst)
+        self.rate_limit_wait = rate_limit_wait
+        
+        # Load fallback data and precompute one fallback verse per clock minute
+        self.fallback_path = resolve_data_path(fallback_path)
+        self.fallback_verses = self._canonicalize_fallback(self._load_fallback_verses())
+        self.fallback_table = self._build_fallback_table()
         
         # Request session for connection pooling
         self.session = requests.Session()
@@ -49,27 +98,219 @@ class BibleAPI:
         Returns:
             Dict containing verse data or None if not found
         """
-        reference = f"{book} {chapter}:{verse}"
+        book = canonical_book(book) or book
+        reference = reference_key(book, chapter, verse)
+        
+        verse_data = self._get_local_verse(reference, book, chapter, verse)
+        if verse_data:
+            return verse_data
+        
+        verse_data = self._get_remote_verse(reference, book, chapter, verse)
+        if verse_data:
+            return verse_data
+        
+        # Fallback to local data
+        if self.fallback_enabled:
+            return self._get_from_fallback(book, chapter, verse)
+        
+        return None
+    
+    def set_version(self, version: str):
+        """
+        Switch the active translation
+        
+        Cache entries are keyed by translation, so verses already held for
+        either translation stay valid and nothing is refetched.
+        """
+        version = version.lower()
+        if version == self.version:
+            return
+        
+        self.logger.info(f"Switching translation from {self.version} to {version}")
+        self.version = version
+        self.verse_store.set_version(version)
+    
+    def get_text_length(self, book: str, chapter: int, verse: int) -> Optional[int]:
+        """
+        Get a verse's text length from the local store, persistent cache or
+        fallback data, without going to the API
+        
+        Returns:
+            Length in characters, or None if the verse is not held locally
+        """
+        number = book_number(book)
+        if number is not None:
+            length = self.verse_store.get_length(number, chapter, verse)
+            if length is not None:
+                return length
+        
+        length = self.persistent_cache.get_length(self.version, reference_key(book, chapter, verse))
+        if length is not None:
+            return length
+        
+        fallback = self.fallback_verses.get(reference_key(book, chapter, verse))
+        return len(fallback['text']) if fallback and fallback.get('text') else None
+    
+    def begin_update(self, foreground: bool = True):
+        """
+        Start a new display update on the calling thread
+        
+        Every request made by this thread (and the probes it starts) until the
+        next call gets one attempt; retries after a failure or a 429 draw on a
+        shared budget of retry_attempts. Requests run at foreground (minute on
+        screen) or background (prefetch) priority.
+        Threads that never start an update, such as the cache warmer, are
+        background traffic.
+        """
+        self._update_state.retry_budget = RetryBudget(self.retry_attempts)
+        self._update_state.foreground = foreground
+    
+    def get_first_verse(self, candidates: Sequence[Tuple[str, int, int]]) -> Optional[Dict[str, Any]]:
+        """
+        Get the first available verse from candidates in preference order
+        
+        Leading candidates already held locally are returned without I/O. From
+        the first candidate that would need a request, up to probe_concurrency
+        candidates are fetched concurrently and the first one in preference
+        order that resolves wins, so the worst case is one request timeout
+        rather than the sum of them. A later candidate is never chosen just
+        because it happens to be cached.
         
+        Args:
+            candidates: (book, chapter, verse) tuples in preference order
+            
+        Returns:
+            Dict containing verse data or None if no candidate could be retrieved
+        """
+        candidates = [(canonical_book(book) or book, chapter, verse)
+                      for book, chapter, verse in candidates]
+        
+        # Anything already cached or in the local store costs no I/O, but only
+        # up to the first candidate that is not (known-missing ones are skipped)
+        remote = []
+        for index, (book, chapter, verse) in enumerate(candidates):
+            reference = reference_key(book, chapter, verse)
+            verse_data = self._get_local_verse(reference, book, chapter, verse)
+            if verse_data and verse_data.get('text'):
+                return verse_data
+            if not self.persistent_cache.is_missing(self.version, reference):
+                remote = candidates[index:]
+                break
+        
+        remote = [(reference_key(book, chapter, verse), book, chapter, verse)
+                  for book, chapter, verse in remote]
+        remote = [c for c in remote if not self.persistent_cache.is_missing(self.version, c[0])]
+        verse_data = self._probe_remote(remote[:self.probe_concurrency])
+        if verse_data:
+            return verse_data
+        
+        # Fallback to local data, still in preference order
+        if self.fallback_enabled:
+            for book, chapter, verse in candidates:
+                verse_data = self._get_from_fallback(book, chapter, verse)
+                if verse_data:
+                    return verse_data
+        
+        return None
+    
+    def _probe_remote(self, remote: List[Tuple[str, str, int, int]]) -> Optional[Dict[str, Any]]:
+        """Fetch candidates concurrently and return the first success in order"""
+        if not remote:
+            return None
+        
+        if len(remote) == 1:
+            return self._get_local_or_remote_verse(*remote[0])
+        
+        if self.probe_executor is None:
+            self.probe_executor = ThreadPoolExecutor(
+                max_workers=self.probe_concurrency, thread_name_prefix='verse-probe'
+            )
+        
+        # Probes share the caller's retry budget and priority
+        budget = getattr(self._update_state, 'retry_budget', None)
+        foreground = getattr(self._update_state, 'foreground', False)
+        futures = [self.probe_executor.submit(self._probe_in_update, budget, foreground, *c)
+                   for c in remote]
+        
+        try:
+            for future in futures:
+                verse_data = future.result()
+                if verse_data and verse_data.get('text'):
+                    return verse_data
+        finally:
+            # Drop probes that have not started; running ones still fill the cache
+            for future in futures:
+                future.cancel()
+        
+        return None
+    
+    def _probe_in_update(self, budget: Optional[RetryBudget], foreground: bool, reference: str,
+                         book: str, chapter: int, verse: int) -> Optional[Dict[str, Any]]:
+        """Run a remote lookup on a probe thread under the caller's budget and priority"""
+        self._update_state.retry_budget = budget
+        self._update_state.foreground = foreground
+        try:
+            return self._get_local_or_remote_verse(reference, book, chapter, verse)
+        finally:
+            self._update_state.retry_budget = None
+            self._update_state.foreground = False
+    
+    def _get_local_or_remote_verse(self, reference: str, book: str, chapter: int,
+                                   verse: int) -> Optional[Dict[str, Any]]:
+        """Look a verse up locally, then from the API"""
+        return (self._get_local_verse(reference, book, chapter, verse)
+                or self._get_remote_verse(reference, book, chapter, verse))
+    
+    def _get_local_verse(self, reference: str, book: str, chapter: int, 
+                         verse: int) -> Optional[Dict[str, Any]]:
+        """Look a verse up in the memory cache, local store and persistent cache"""
         # Check cache first
         cached_verse = self._get_from_cache(reference)
         if cached_verse:
             self.logger.debug(f"Retrieved from cache: {reference}")
             return cached_verse
         
-        # Try API
+        # Try local verse store
+        verse_data = self._get_from_store(book, chapter, verse)
+        if verse_data:
+            return verse_data
+        
+        # Try persistent cache
+        stored_verse = self.persistent_cache.get(self.version, reference)
+        if stored_verse:
+            self.logger.debug(f"Retrieved from persistent cache: {reference}")
+            self._add_to_cache(reference, stored_verse)
+            return stored_verse
+        
+        return None
+    
+    def _get_remote_verse(self, reference: str, book: str, chapter: int, 
+                          verse: int) -> Optional[Dict[str, Any]]:
+        """Fetch a verse from the API, recording references that do not exist"""
+        # Skip the API for references already known not to exist
+        if self.persistent_cache.is_missing(self.version, reference):
+            self.logger.debug(f"Known missing reference: {reference}")
+            return None
+        
+        # Try API (None means the reference does not exist, errors raise)
         try:
-            verse_data = self._fetch_from_api(reference)
+            if self.bulk_fetch:
+                verse_data = self._fetch_verse_via_chapter(book, chapter, verse)
+            else:
+                verse_data = self._fetch_from_api(reference)
+                if verse_data:
+                    self.persistent_cache.put(self.version, reference, verse_data)
+            
             if verse_data:
                 self._add_to_cache(reference, verse_data)
                 return verse_data
+            
+            self.persistent_cache.mark_missing(self.version, reference)
+        except (CircuitOpenError, RetryBudgetExhausted, RateLimited) as e:
+            self.logger.debug(f"Skipped API request for {reference}: {e}")
         except Exception as e:
             self.logger.warning(f"API request failed for {reference}: {e}")
         
-        # Fallback to local data
-        if self.fallback_enabled:
-            return self._get_from_fallback(book, chapter, verse)
-        
         return None
     
     def get_random_verse_for_time(self, hour: int, minute: int) -> Optional[Dict[str, Any]]:
@@ -88,42 +329,181 @@ class BibleAPI:
         if display_hour == 0:
             display_hour = 12
             
-        # Find books that have the required chapter
-        suitable_books = self._find_books_with_chapter(display_hour)
+        # Look up every book whose chapter:verse matches this minute
+        suitable_books = books_for_time(display_hour, minute)
         
         if not suitable_books:
-            self.logger.warning(f"No books found with chapter {display_hour}")
-            return self._get_fallback_verse_for_time(display_hour, minute)
+            # No book has this chapter:verse (e.g. minute 0), use the closest one
+            return self._get_nearby_verse(display_hour, minute)
         
-        # Try each book until we find a verse
-        random.shuffle(suitable_books)
+        verse_data = self._get_verse_from_books(suitable_books, display_hour, minute)
+        if verse_data:
+            return verse_data
         
-        for book in suitable_books:
-            verse_data = self.get_verse(book, display_hour, minute)
-            if verse_data and verse_data.get('text'):
-                return verse_data
+        return self.get_fallback_verse_for_time(display_hour, minute)
+    
+    def _get_verse_from_books(self, books: Sequence[str], chapter: int, 
+                              verse: int) -> Optional[Dict[str, Any]]:
+        """Try candidate books in random order until one returns the verse"""
+        candidates = list(books)
+        random.shuffle(candidates)
         
-        # If no exact match, try nearby verses
-        return self._get_nearby_verse(suitable_books[0], display_hour, minute)
+        return self.get_first_verse([(book, chapter, verse) for book in candidates])
     
-    def _fetch_from_api(self, reference: str) -> Optional[Dict[str, Any]]:
-        """Fetch verse from API"""
+    def fetch_chapter(self, book: str, chapter: int) -> Dict[int, Dict[str, Any]]:
+        """
+        Fetch a whole chapter in one request and store every verse
+        
+        Args:
+            book: Book name (e.g., "John", "Genesis")
+            chapter: Chapter number
+            
+        Returns:
+            Dict mapping verse number to verse data (empty if the chapter does not exist)
+        """
+        book = canonical_book(book) or book
+        reference = f"{book} {chapter}"
+        
         try:
-            # Format reference for API
-            formatted_ref = reference.replace(' ', '%20')
-            url = f"{self.api_url}/{formatted_ref}"
+            data = self._request_reference(reference)
+        except requests.exceptions.HTTPError as e:
+            if e.response is not None and e.response.status_code == 404:
+                self.logger.info(f"Chapter not found: {reference}")
+                self.fetched_chapters.add((self.version, book, chapter))
+                return {}
+            self.logger.error(f"HTTP error fetching {reference}: {e}")
+            raise
+        except requests.exceptions.RequestException as e:
+            self.logger.error(f"Network error fetching {reference}: {e}")
+            raise
+        except json.JSONDecodeError as e:
+            self.logger.error(f"JSON decode error for {reference}: {e}")
+            raise
+        
+        translation_name = data.get('translation_name', self.version.upper())
+        timestamp = time.time()
+        verses = {}
+        
+        for item in data.get('verses', []):
+            if int(item.get('chapter', chapter)) != chapter or not item.get('text'):
+                continue
             
-            self.logger.debug(f"Fetching from API: {url}")
+            number = int(item['verse'])
+            verses[number] = {
+                'reference': reference_key(book, chapter, number),
+                'text': item['text'].strip(),
+                'translation_name': translation_name,
+                'source': 'api',
+                'timestamp': timestamp
+            }
+        
+        # Store every verse under the same key get_verse uses. Only a stored
+        # chapter counts as fetched; otherwise its other verses would be
+        # reported missing instead of being fetched again.
+        if self.persistent_cache.put_many(self.version, {
+            verse_data['reference']: verse_data for verse_data in verses.values()
+        }):
+            self.fetched_chapters.add((self.version, book, chapter))
+        
+        self.logger.info(f"Fetched {len(verses)} verses for {reference}")
+        return verses
+    
+    def _fetch_verse_via_chapter(self, book: str, chapter: int, verse: int) -> Optional[Dict[str, Any]]:
+        """Fetch a verse by pulling its whole chapter (once per chapter)"""
+        book = canonical_book(book) or book
+        if (self.version, book, chapter) in self.fetched_chapters:
+            # Chapter already fetched, so the verse is not in it
+            return None
+        
+        return self.fetch_chapter(book, chapter).get(verse)
+    
+    def _request_reference(self, reference: str) -> Dict[str, Any]:
+        """Request a verse, range or chapter reference and return the decoded response"""
+        # Format reference for API
+        formatted_ref = reference.replace(' ', '%20')
+        url = f"{self.api_url}/{formatted_ref}?translation={self.version}"
+        
+        self.logger.debug(f"Fetching from API: {url}")
+        
+        budget = getattr(self._update_state, 'retry_budget', None) or RetryBudget(self.retry_attempts)
+        foreground = getattr(self._update_state, 'foreground', False)
+        attempt = 0
+        retrying = False
+        
+        while True:
+            if not self.circuit_breaker.allow_request():
+                raise CircuitOpenError(f"circuit open, not requesting {reference}")
+            # The first attempt is free; only retries are limited per update
+            if retrying and not budget.consume():
+                self.circuit_breaker.release()
+                raise RetryBudgetExhausted(f"retry budget exhausted, not retrying {reference}")
+            if not self.rate_limiter.acquire(foreground, self.rate_limit_wait if foreground
+                                             else BACKGROUND_MAX_WAIT):
+                self.circuit_breaker.release()
+                raise RateLimited(f"rate limited, not requesting {reference}")
             
-            response = self.session.get(url, timeout=10)
-            response.raise_for_status()
+            try:
+                self.api_requests += 1
+                response = self.session.get(url, timeout=10)
+                response.raise_for_status()
+                data = response.json()
+            except Exception as e:
+                if self._is_rate_limit_response(e):
+                    # Throttled, not failing: the service answered, which also
+                    # settles a half-open trial. Pause all traffic for as long as asked.
+                    self.circuit_breaker.record_success()
+                    retry_after = parse_retry_after(e.response.headers.get('Retry-After'))
+                    self.rate_limiter.throttle(DEFAULT_RETRY_AFTER if retry_after is None else retry_after)
+                    self.logger.warning(f"API rate limit hit, pausing requests for "
+                                        f"{self.rate_limiter.get_stats()['blocked_for']}s")
+                    if budget.remaining <= 0:
+                        raise RateLimited(f"rate limited, not retrying {reference}")
+                    retrying = True
+                    continue
+                
+                if not self._is_transient_error(e):
+                    # The service answered (e.g. 404), so it is healthy
+                    self.circuit_breaker.record_success()
+                    raise
+                
+                self.circuit_breaker.record_failure()
+                if budget.remaining <= 0 or self.circuit_breaker.is_open:
+                    raise
+                
+                # Exponential backoff before retrying
+                delay = self.retry_backoff * (2 ** attempt)
+                attempt += 1
+                retrying = True
+                self.logger.debug(f"Retrying {reference} in {delay:.1f}s after error: {e}")
+                time.sleep(delay)
+                continue
             
-            data = response.json()
+            self.circuit_breaker.record_success()
+            return data
+    
+    @staticmethod
+    def _is_rate_limit_response(error: Exception) -> bool:
+        """Whether an error is a 429 Too Many Requests response"""
+        return (isinstance(error, requests.exceptions.HTTPError) and error.response is not None
+                and error.response.status_code == 429)
+    
+    @staticmethod
+    def _is_transient_error(error: Exception) -> bool:
+        """Whether an error means the service is unreachable or failing"""
+        if isinstance(error, requests.exceptions.HTTPError):
+            status = error.response.status_code if error.response is not None else 0
+            return status >= 500
+        return isinstance(error, (requests.exceptions.RequestException, ValueError))
+    
+    def _fetch_from_api(self, reference: str) -> Optional[Dict[str, Any]]:
+        """Fetch verse from API"""
+        try:
+            data = self._request_reference(reference)
             
             # Validate response
             if 'text' in data and data['text']:
                 return {
-                    'reference': data.get('reference', reference),
+                    'reference': reference,
                     'text': data['text'].strip(),
                     'translation_name': data.get('translation_name', self.version.upper()),
                     'source': 'api',
@@ -133,41 +513,53 @@ class BibleAPI:
                 self.logger.warning(f"Empty or invalid response for {reference}")
                 return None
                 
+        except requests.exceptions.HTTPError as e:
+            if e.response is not None and e.response.status_code == 404:
+                self.logger.info(f"Verse not found: {reference}")
+                return None
+            self.logger.error(f"HTTP error fetching {reference}: {e}")
+            raise
         except requests.exceptions.RequestException as e:
             self.logger.error(f"Network error fetching {reference}: {e}")
             raise
         except json.JSONDecodeError as e:
             self.logger.error(f"JSON decode error for {reference}: {e}")
             raise
+        except (CircuitOpenError, RetryBudgetExhausted, RateLimited):
+            raise
         except Exception as e:
             self.logger.error(f"Unexpected error fetching {reference}: {e}")
             raise
     
+    def _get_from_store(self, book: str, chapter: int, verse: int) -> Optional[Dict[str, Any]]:
+        """Get verse from the local verse store"""
+        number = book_number(book)
+        if number is None:
+            return None
+        
+        text = self.verse_store.get_text(number, chapter, verse)
+        if not text:
+            return None
+        
+        return {
+            'reference': f"{book_name(number)} {chapter}:{verse}",
+            'text': text,
+            'translation_name': self.version.upper(),
+            'source': 'local',
+            'timestamp': time.time()
+        }
+    
     def _get_from_cache(self, reference: str) -> Optional[Dict[str, Any]]:
         """Get verse from cache if not expired"""
-        if reference in self.cache:
-            cached_data = self.cache[reference]
-            if time.time() - cached_data['timestamp'] < self.cache_timeout:
-                return cached_data
-            else:
-                # Remove expired entry
-                del self.cache[reference]
-        return None
+        return self.cache.get((self.version, reference))
     
     def _add_to_cache(self, reference: str, verse_data: Dict[str, Any]):
-        """Add verse to cache"""
-        self.cache[reference] = verse_data
-        
-        # Limit cache size
-        if len(self.cache) > 100:
-            # Remove oldest entries
-            oldest_ref = min(self.cache.keys(), 
-                           key=lambda k: self.cache[k]['timestamp'])
-            del self.cache[oldest_ref]
+        """Add verse to cache (least recently used entry is evicted when full)"""
+        self.cache.put((self.version, reference), verse_data)
     
     def _load_fallback_verses(self) -> Dict[str, Any]:
         """Load fallback verses from local file"""
-        fallback_file = Path("data/fallback_verses.json")
+        fallback_file = self.fallback_path
         
         if fallback_file.exists():
             try:
@@ -177,10 +569,20 @@ class BibleAPI:
                     return data
             except Exception as e:
                 self.logger.error(f"Error loading fallback verses: {e}")
+        else:
+            self.logger.warning(f"Fallback verse file not found: {fallback_file}")
         
         # Return minimal fallback data
         return self._get_minimal_fallback()
     
+    def _canonicalize_fallback(self, verses: Dict[str, Any]) -> Dict[str, Any]:
+        """Key fallback verses by canonical reference so any book spelling finds them"""
+        canonical = {}
+        for reference, verse_data in verses.items():
+            key = normalize_reference(reference) or reference
+            canonical[key] = dict(verse_data, reference=key) if key != reference else verse_data
+        return canonical
+    
     def _get_minimal_fallback(self) -> Dict[str, Any]:
         """Get minimal fallback verses for common times"""
         return {
@@ -206,7 +608,7 @@ class BibleAPI:
     
     def _get_from_fallback(self, book: str, chapter: int, verse: int) -> Optional[Dict[str, Any]]:
         """Get verse from fallback data"""
-        reference = f"{book} {chapter}:{verse}"
+        reference = reference_key(book, chapter, verse)
         
         if reference in self.fallback_verses:
             verse_data = self.fallback_verses[reference].copy()
@@ -216,66 +618,71 @@ class BibleAPI:
         
         return None
     
-    def _find_books_with_chapter(self, chapter: int) -> List[str]:
-        """Find Bible books that have the specified chapter"""
-        # Common books with many chapters
-        books_with_many_chapters = [
-            "Genesis", "Exodus", "Leviticus", "Numbers", "Deuteronomy",
-            "Joshua", "Judges", "1 Samuel", "2 Samuel", "1 Kings", "2 Kings",
-            "1 Chronicles", "2 Chronicles", "Ezra", "Nehemiah", "Job",
-            "Psalms", "Proverbs", "Ecclesiastes", "Isaiah", "Jeremiah",
-            "Ezekiel", "Daniel", "Matthew", "Mark", "Luke", "John",
-            "Acts", "Romans", "1 Corinthians", "2 Corinthians"
-        ]
-        
-        # Filter based on known chapter counts (simplified)
-        suitable_books = []
-        
-        for book in books_with_many_chapters:
-            if self._book_has_chapter(book, chapter):
-                suitable_books.append(book)
-        
-        return suitable_books
-    
-    def _book_has_chapter(self, book: str, chapter: int) -> bool:
-        """Check if a book has the specified chapter (simplified logic)"""
-        # Simplified chapter count mapping
-        chapter_counts = {
-            "Genesis": 50, "Exodus": 40, "Psalms": 150, "Proverbs": 31,
-            "Isaiah": 66, "Jeremiah": 52, "Matthew": 28, "Luke": 24,
-            "John": 21, "Acts": 28, "Romans": 16, "1 Corinthians": 16
-        }
+    def _get_nearby_verse(self, chapter: int, verse: int) -> Optional[Dict[str, Any]]:
+        """Get the closest existing verse in the same chapter if exact match not found"""
+        # Walk outwards from the target to the nearest verse that exists in any book
+        for distance in range(1, 60):
+            for try_verse in (verse - distance, verse + distance):
+                candidates = books_for_time(chapter, try_verse)
+                if candidates:
+                    verse_data = self._get_verse_from_books(candidates, chapter, try_verse)
+                    return verse_data or self.get_fallback_verse_for_time(chapter, verse)
         
-        return chapter <= chapter_counts.get(book, 25)  # Default to 25 chapters
+        return self.get_fallback_verse_for_time(chapter, verse)
     
-    def _get_nearby_verse(self, book: str, chapter: int, verse: int) -> Optional[Dict[str, Any]]:
-        """Get a nearby verse if exact match not found"""
-        # Try verses around the target
-        for offset in [0, -1, 1, -2, 2]:
-            try_verse = verse + offset
-            if try_verse > 0:
-                verse_data = self.get_verse(book, chapter, try_verse)
-                if verse_data:
-                    return verse_data
+    def _build_fallback_table(self) -> Tuple[Optional[Dict[str, Any]], ...]:
+        """
+        Assign a fallback verse to every minute of the 12-hour clock face
         
-        return None
+        Slot (hour - 1) * 60 + minute gets a verse whose chapter:verse is
+        hour:minute when one exists, else the nearest verse in chapter hour,
+        else a verse spread evenly over the rest of the fallback set.
+        """
+        verses = list(self.fallback_verses.values())
+        if not verses:
+            return (None,) * MINUTE_SLOTS
+        
+        by_chapter = {}
+        for key, verse_data in self.fallback_verses.items():
+            parsed = parse_reference(key)
+            if parsed:
+                by_chapter.setdefault(parsed[1], []).append((parsed[2], verse_data))
+        
+        table = []
+        for slot in range(MINUTE_SLOTS):
+            hour, minute = slot // 60 + 1, slot % 60
+            in_chapter = by_chapter.get(hour)
+            if in_chapter:
+                # Exact chapter:verse match first, then the closest verse
+                table.append(min(in_chapter, key=lambda item: abs(item[0] - minute))[1])
+            else:
+                table.append(verses[slot % len(verses)])
+        
+        return tuple(table)
     
-    def _get_fallback_verse_for_time(self, hour: int, minute: int) -> Optional[Dict[str, Any]]:
+    def get_fallback_verse_for_time(self, hour: int, minute: int) -> Optional[Dict[str, Any]]:
         """Get a fallback verse for specific time"""
-        # Use a simple hash to select from available fallback verses
-        verse_keys = list(self.fallback_verses.keys())
-        if verse_keys:
-            index = (hour * 60 + minute) % len(verse_keys)
-            selected_key = verse_keys[index]
-            return self.fallback_verses[selected_key].copy()
+        verse_data = self.fallback_table[((hour - 1) % 12) * 60 + minute % 60]
+        if verse_data is None:
+            return None
         
-        return None
+        return dict(verse_data, source='fallback', timestamp=time.time())
     
     def get_cache_stats(self) -> Dict[str, Any]:
         """Get cache statistics"""
         return {
             'cache_size': len(self.cache),
             'cache_timeout': self.cache_timeout,
-            'fallback_verses': len(self.fallback_verses)
+            'memory_cache': self.cache.get_stats(),
+            'api_requests': self.api_requests,
+            'bulk_fetch': self.bulk_fetch,
+            'fetched_chapters': len(self.fetched_chapters),
+            'probe_concurrency': self.probe_concurrency,
+            'retry_attempts': self.retry_attempts,
+            'circuit_breaker': self.circuit_breaker.get_stats(),
+            'rate_limiter': self.rate_limiter.get_stats(),
+            'fallback_verses': len(self.fallback_verses),
+            'verse_store': self.verse_store.get_stats(),
+            'persistent_cache': self.persistent_cache.get_stats()
         }
 
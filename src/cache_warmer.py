@@ -0,0 +1,155 @@
+"""
+Verse Cache Warmer
+
+This module walks every display-hour:minute slot of the clock face and
+fetches each candidate book's chapter into the persistent verse cache, so a
+unit can be fully warmed before it ships. Work is grouped by chapter (one
+request covers every slot in it), runs with bounded concurrency and a
+request rate limit, and is resumable: chapters whose verses are already
+cached or known missing are skipped.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from canon import MINUTE_INDEX, MINUTE_SLOTS, book_number, reference_key
+from bible_api import BibleAPI
+
+
+class CacheWarmer:
+    """Fill the persistent verse cache for every minute slot"""
+
+    def __init__(self, bible_api: BibleAPI, workers: int = 2, rate: float = 1.0,
+                 progress: Optional[Callable[[int, int, str], None]] = None):
+        self.bible_api = bible_api
+        self.workers = max(1, workers)
+        self.min_interval = 1.0 / rate if rate > 0 else 0.0
+        self.progress = progress
+        self.logger = logging.getLogger(__name__)
+
+        self._pace_lock = threading.Lock()
+        self._next_request = 0.0
+        self._stop = threading.Event()
+
+    def plan(self) -> List[Tuple[str, int, Tuple[int, ...]]]:
+        """Group the minute index into (book, chapter, verses needed) work items"""
+        chapters = {}
+        for slot, books in enumerate(MINUTE_INDEX):
+            chapter, verse = slot // 60 + 1, slot % 60
+            for book in books:
+                chapters.setdefault((book, chapter), []).append(verse)
+
+        return [(book, chapter, tuple(verses)) for (book, chapter), verses in chapters.items()]
+
+    def is_cached(self, book: str, chapter: int, verse: int) -> bool:
+        """Check whether a verse is available without the network, or known missing"""
+        reference = reference_key(book, chapter, verse)
+        version = self.bible_api.version
+        return (self.bible_api.verse_store.get_text(book_number(book), chapter, verse) is not None
+                or self.bible_api.persistent_cache.contains(version, reference)
+                or self.bible_api.persistent_cache.is_missing(version, reference))
+
+    def pending(self) -> List[Tuple[str, int, Tuple[int, ...]]]:
+        """Work items with at least one verse still to fetch"""
+        return [(book, chapter, verses) for book, chapter, verses in self.plan()
+                if not all(self.is_cached(book, chapter, verse) for verse in verses)]
+
+    def coverage(self) -> Dict[str, Any]:
+        """Report how much of the clock face can be served without the network"""
+        verses_needed = verses_cached = slots_covered = 0
+        slots_possible = sum(1 for books in MINUTE_INDEX if books)
+
+        for slot, books in enumerate(MINUTE_INDEX):
+            chapter, verse = slot // 60 + 1, slot % 60
+            cached = [book for book in books if self.is_cached(book, chapter, verse)]
+            verses_needed += len(books)
+            verses_cached += len(cached)
+            if books and cached:
+                slots_covered += 1
+
+        return {
+            'version': self.bible_api.version,
+            'slots': MINUTE_SLOTS,
+            'slots_possible': slots_possible,
+            'slots_covered': slots_covered,
+            'slot_coverage': slots_covered / slots_possible if slots_possible else 0,
+            'verses_needed': verses_needed,
+            'verses_cached': verses_cached,
+            'verse_coverage': verses_cached / verses_needed if verses_needed else 0
+        }
+
+    def run(self, limit: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Fetch every pending chapter into the persistent cache
+
+        Args:
+            limit: Maximum number of chapters to fetch this run
+
+        Returns:
+            Dict with counts of chapters fetched, failed and skipped
+        """
+        work = self.pending()
+        skipped = len(self.plan()) - len(work)
+        if limit is not None:
+            work = work[:limit]
+
+        self.logger.info(f"Warming {len(work)} chapters ({skipped} already cached)")
+        results = {'chapters': len(work), 'fetched': 0, 'failed': 0, 'skipped': skipped,
+                   'missing_verses': 0, 'api_requests': 0}
+        requests_before = self.bible_api.api_requests
+        self._stop.clear()
+
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='cache-warm') as executor:
+            futures = {executor.submit(self._warm_chapter, *item): item for item in work}
+
+            try:
+                for done, future in enumerate(as_completed(futures), start=1):
+                    book, chapter, _ = futures[future]
+                    missing = future.result()
+                    if missing is None:
+                        results['failed'] += 1
+                    else:
+                        results['fetched'] += 1
+                        results['missing_verses'] += missing
+
+                    if self.progress:
+                        self.progress(done, len(work), f"{book} {chapter}")
+            except KeyboardInterrupt:
+                # Fetched chapters are already committed, so the next run resumes
+                self._stop.set()
+                for future in futures:
+                    future.cancel()
+                raise
+
+        results['api_requests'] = self.bible_api.api_requests - requests_before
+        return results
+
+    def _warm_chapter(self, book: str, chapter: int, verses: Tuple[int, ...]) -> Optional[int]:
+        """Fetch one chapter, returning how many needed verses it lacked (None on failure)"""
+        if not self._pace():
+            return None
+
+        try:
+            fetched = self.bible_api.fetch_chapter(book, chapter)
+        except Exception as e:
+            self.logger.warning(f"Could not warm {book} {chapter}: {e}")
+            return None
+
+        # Record needed verses the chapter does not have so later runs skip them
+        missing = [verse for verse in verses if verse not in fetched]
+        for verse in missing:
+            self.bible_api.persistent_cache.mark_missing(self.bible_api.version,
+                                                        reference_key(book, chapter, verse))
+
+        return len(missing)
+
+    def _pace(self) -> bool:
+        """Space out requests to stay under the rate limit"""
+        with self._pace_lock:
+            now = time.monotonic()
+            start = max(now, self._next_request)
+            self._next_request = start + self.min_interval
+
+        return not self._stop.wait(start - now)
@@ -0,0 +1,432 @@
+"""
+Bible Canon Reference Data
+
+This module provides the canonical list of Bible books in Protestant order,
+canonical chapter and verse counts, a reference normalizer that maps book
+aliases, abbreviations and numbered-book spellings to stable book numbers
+and interned canonical cache keys, and a precomputed index of which books
+have a chapter:verse for every minute of the 12-hour clock face.
+"""
+
+import re
+import sys
+from typing import Optional, Dict, Tuple, List
+
+# Canonical book names as used by bible-api.com, in canonical order.
+# Book numbers are 1-based positions in this tuple.
+BOOKS = (
+    "Genesis", "Exodus", "Leviticus", "Numbers", "Deuteronomy",
+    "Joshua", "Judges", "Ruth", "1 Samuel", "2 Samuel",
+    "1 Kings", "2 Kings", "1 Chronicles", "2 Chronicles", "Ezra",
+    "Nehemiah", "Esther", "Job", "Psalms", "Proverbs",
+    "Ecclesiastes", "Song of Solomon", "Isaiah", "Jeremiah", "Lamentations",
+    "Ezekiel", "Daniel", "Hosea", "Joel", "Amos",
+    "Obadiah", "Jonah", "Micah", "Nahum", "Habakkuk",
+    "Zephaniah", "Haggai", "Zechariah", "Malachi",
+    "Matthew", "Mark", "Luke", "John", "Acts",
+    "Romans", "1 Corinthians", "2 Corinthians", "Galatians", "Ephesians",
+    "Philippians", "Colossians", "1 Thessalonians", "2 Thessalonians", "1 Timothy",
+    "2 Timothy", "Titus", "Philemon", "Hebrews", "James",
+    "1 Peter", "2 Peter", "1 John", "2 John", "3 John",
+    "Jude", "Revelation"
+)
+
+# Verses per chapter for each book (KJV versification), in canonical order
+VERSE_COUNTS = (
+    # Genesis
+    (31, 25, 24, 26, 32, 22, 24, 22, 29, 32, 32, 20, 18, 24, 21, 16, 27, 33, 38, 18,
+     34, 24, 20, 67, 34, 35, 46, 22, 35, 43, 55, 32, 20, 31, 29, 43, 36, 30, 23, 23,
+     57, 38, 34, 34, 28, 34, 31, 22, 33, 26),
+    # Exodus
+    (22, 25, 22, 31, 23, 30, 25, 32, 35, 29, 10, 51, 22, 31, 27, 36, 16, 27, 25, 26,
+     36, 31, 33, 18, 40, 37, 21, 43, 46, 38, 18, 35, 23, 35, 35, 38, 29, 31, 43, 38),
+    # Leviticus
+    (17, 16, 17, 35, 19, 30, 38, 36, 24, 20, 47, 8, 59, 57, 33, 34, 16, 30, 37, 27,
+     24, 33, 44, 23, 55, 46, 34),
+    # Numbers
+    (54, 34, 51, 49, 31, 27, 89, 26, 23, 36, 35, 16, 33, 45, 41, 50, 13, 32, 22, 29,
+     35, 41, 30, 25, 18, 65, 23, 31, 40, 16, 54, 42, 56, 29, 34, 13),
+    # Deuteronomy
+    (46, 37, 29, 49, 33, 25, 26, 20, 29, 22, 32, 32, 18, 29, 23, 22, 20, 22, 21, 20,
+     23, 30, 25, 22, 19, 19, 26, 68, 29, 20, 30, 52, 29, 12),
+    # Joshua
+    (18, 24, 17, 24, 15, 27, 26, 35, 27, 43, 23, 24, 33, 15, 63, 10, 18, 28, 51, 9,
+     45, 34, 16, 33),
+    # Judges
+    (36, 23, 31, 24, 31, 40, 25, 35, 57, 18, 40, 15, 25, 20, 20, 31, 13, 31, 30, 48,
+     25),
+    # Ruth
+    (22, 23, 18, 22),
+    # 1 Samuel
+    (28, 36, 21, 22, 12, 21, 17, 22, 27, 27, 15, 25, 23, 52, 35, 23, 58, 30, 24, 42,
+     15, 23, 29, 22, 44, 25, 12, 25, 11, 31, 13),
+    # 2 Samuel
+    (27, 32, 39, 12, 25, 23, 29, 18, 13, 19, 27, 31, 39, 33, 37, 23, 29, 33, 43, 26,
+     22, 51, 39, 25),
+    # 1 Kings
+    (53, 46, 28, 34, 18, 38, 51, 66, 28, 29, 43, 33, 34, 31, 34, 34, 24, 46, 21, 43,
+     29, 53),
+    # 2 Kings
+    (18, 25, 27, 44, 27, 33, 20, 29, 37, 36, 21, 21, 25, 29, 38, 20, 41, 37, 37, 21,
+     26, 20, 37, 20, 30),
+    # 1 Chronicles
+    (54, 55, 24, 43, 26, 81, 40, 40, 44, 14, 47, 40, 14, 17, 29, 43, 27, 17, 19, 8,
+     30, 19, 32, 31, 31, 32, 34, 21, 30),
+    # 2 Chronicles
+    (17, 18, 17, 22, 14, 42, 22, 18, 31, 19, 23, 16, 22, 15, 19, 14, 19, 34, 11, 37,
+     20, 12, 21, 27, 28, 23, 9, 27, 36, 27, 21, 33, 25, 33, 27, 23),
+    # Ezra
+    (11, 70, 13, 24, 17, 22, 28, 36, 15, 44),
+    # Nehemiah
+    (11, 20, 32, 23, 19, 19, 73, 18, 38, 39, 36, 47, 31),
+    # Esther
+    (22, 23, 15, 17, 14, 14, 10, 17, 32, 3),
+    # Job
+    (22, 13, 26, 21, 27, 30, 21, 22, 35, 22, 20, 25, 28, 22, 35, 22, 16, 21, 29, 29,
+     34, 30, 17, 25, 6, 14, 23, 28, 25, 31, 40, 22, 33, 37, 16, 33, 24, 41, 30, 24,
+     34, 17),
+    # Psalms
+    (6, 12, 8, 8, 12, 10, 17, 9, 20, 18, 7, 8, 6, 7, 5, 11, 15, 50, 14, 9,
+     13, 31, 6, 10, 22, 12, 14, 9, 11, 12, 24, 11, 22, 22, 28, 12, 40, 22, 13, 17,
+     13, 11, 5, 26, 17, 11, 9, 14, 20, 23, 19, 9, 6, 7, 23, 13, 11, 11, 17, 12,
+     8, 12, 11, 10, 13, 20, 7, 35, 36, 5, 24, 20, 28, 23, 10, 12, 20, 72, 13, 19,
+     16, 8, 18, 12, 13, 17, 7, 18, 52, 17, 16, 15, 5, 23, 11, 13, 12, 9, 9, 5,
+     8, 28, 22, 35, 45, 48, 43, 13, 31, 7, 10, 10, 9, 8, 18, 19, 2, 29, 176, 7,
+     8, 9, 4, 8, 5, 6, 5, 6, 8, 8, 3, 18, 3, 3, 21, 26, 9, 8, 24, 13,
+     10, 7, 12, 15, 21, 10, 20, 14, 9, 6),
+    # Proverbs
+    (33, 22, 35, 27, 23, 35, 27, 36, 18, 32, 31, 28, 25, 35, 33, 33, 28, 24, 29, 30,
+     31, 29, 35, 34, 28, 28, 27, 28, 27, 33, 31),
+    # Ecclesiastes
+    (18, 26, 22, 16, 20, 12, 29, 17, 18, 20, 10, 14),
+    # Song of Solomon
+    (17, 17, 11, 16, 16, 13, 13, 14),
+    # Isaiah
+    (31, 22, 26, 6, 30, 13, 25, 22, 21, 34, 16, 6, 22, 32, 9, 14, 14, 7, 25, 6,
+     17, 25, 18, 23, 12, 21, 13, 29, 24, 33, 9, 20, 24, 17, 10, 22, 38, 22, 8, 31,
+     29, 25, 28, 28, 25, 13, 15, 22, 26, 11, 23, 15, 12, 17, 13, 12, 21, 14, 21, 22,
+     11, 12, 19, 12, 25, 24),
+    # Jeremiah
+    (19, 37, 25, 31, 31, 30, 34, 22, 26, 25, 23, 17, 27, 22, 21, 21, 27, 23, 15, 18,
+     14, 30, 40, 10, 38, 24, 22, 17, 32, 24, 40, 44, 26, 22, 19, 32, 21, 28, 18, 16,
+     18, 22, 13, 30, 5, 28, 7, 47, 39, 46, 64, 34),
+    # Lamentations
+    (22, 22, 66, 22, 22),
+    # Ezekiel
+    (28, 10, 27, 17, 17, 14, 27, 18, 11, 22, 25, 28, 23, 23, 8, 63, 24, 32, 14, 49,
+     32, 31, 49, 27, 17, 21, 36, 26, 21, 26, 18, 32, 33, 31, 15, 38, 28, 23, 29, 49,
+     26, 20, 27, 31, 25, 24, 23, 35),
+    # Daniel
+    (21, 49, 30, 37, 31, 28, 28, 27, 27, 21, 45, 13),
+    # Hosea
+    (11, 23, 5, 19, 15, 11, 16, 14, 17, 15, 12, 14, 16, 9),
+    # Joel
+    (20, 32, 21),
+    # Amos
+    (15, 16, 15, 13, 27, 14, 17, 14, 15),
+    # Obadiah
+    (21,),
+    # Jonah
+    (17, 10, 10, 11),
+    # Micah
+    (16, 13, 12, 13, 15, 16, 20),
+    # Nahum
+    (15, 13, 19),
+    # Habakkuk
+    (17, 20, 19),
+    # Zephaniah
+    (18, 15, 20),
+    # Haggai
+    (15, 23),
+    # Zechariah
+    (21, 13, 10, 14, 11, 15, 14, 23, 17, 12, 17, 14, 9, 21),
+    # Malachi
+    (14, 17, 18, 6),
+    # Matthew
+    (25, 23, 17, 25, 48, 34, 29, 34, 38, 42, 30, 50, 58, 36, 39, 28, 27, 35, 30, 34,
+     46, 46, 39, 51, 46, 75, 66, 20),
+    # Mark
+    (45, 28, 35, 41, 43, 56, 37, 38, 50, 52, 33, 44, 37, 72, 47, 20),
+    # Luke
+    (80, 52, 38, 44, 39, 49, 50, 56, 62, 42, 54, 59, 35, 35, 32, 31, 37, 43, 48, 47,
+     38, 71, 56, 53),
+    # John
+    (51, 25, 36, 54, 47, 71, 53, 59, 41, 42, 57, 50, 38, 31, 27, 33, 26, 40, 42, 31,
+     25),
+    # Acts
+    (26, 47, 26, 37, 42, 15, 60, 40, 43, 48, 30, 25, 52, 28, 41, 40, 34, 28, 41, 38,
+     40, 30, 35, 27, 27, 32, 44, 31),
+    # Romans
+    (32, 29, 31, 25, 21, 23, 25, 39, 33, 21, 36, 21, 14, 23, 33, 27),
+    # 1 Corinthians
+    (31, 16, 23, 21, 13, 20, 40, 13, 27, 33, 34, 31, 13, 40, 58, 24),
+    # 2 Corinthians
+    (24, 17, 18, 18, 21, 18, 16, 24, 15, 18, 33, 21, 14),
+    # Galatians
+    (24, 21, 29, 31, 26, 18),
+    # Ephesians
+    (23, 22, 21, 32, 33, 24),
+    # Philippians
+    (30, 30, 21, 23),
+    # Colossians
+    (29, 23, 25, 18),
+    # 1 Thessalonians
+    (10, 20, 13, 18, 28),
+    # 2 Thessalonians
+    (12, 17, 18),
+    # 1 Timothy
+    (20, 15, 16, 16, 25, 21),
+    # 2 Timothy
+    (18, 26, 17, 22),
+    # Titus
+    (16, 15, 15),
+    # Philemon
+    (25,),
+    # Hebrews
+    (14, 18, 19, 16, 14, 20, 28, 13, 28, 39, 40, 29, 25),
+    # James
+    (27, 26, 18, 17, 20),
+    # 1 Peter
+    (25, 25, 22, 19, 14),
+    # 2 Peter
+    (21, 22, 18),
+    # 1 John
+    (10, 29, 24, 21, 21),
+    # 2 John
+    (13,),
+    # 3 John
+    (14,),
+    # Jude
+    (25,),
+    # Revelation
+    (20, 29, 22, 11, 14, 17, 17, 13, 21, 11, 19, 17, 18, 20, 8, 21, 18, 24, 21, 15,
+     27, 21),
+)
+
+# Abbreviations and alternate names for each book (matched case-insensitively,
+# ignoring periods). Ambiguous short forms such as "Jo" or "Ju" are left out.
+_BOOK_ALIASES = {
+    "Genesis": ("gen", "ge", "gn"),
+    "Exodus": ("exod", "exo", "ex"),
+    "Leviticus": ("lev", "le", "lv"),
+    "Numbers": ("num", "nu", "nm", "nb"),
+    "Deuteronomy": ("deut", "de", "dt"),
+    "Joshua": ("josh", "jos", "jsh"),
+    "Judges": ("judg", "jdg", "jg", "jdgs"),
+    "Ruth": ("rth", "ru"),
+    "1 Samuel": ("sam", "sa", "sm", "samuel"),
+    "2 Samuel": ("sam", "sa", "sm", "samuel"),
+    "1 Kings": ("kgs", "ki", "kin", "kings"),
+    "2 Kings": ("kgs", "ki", "kin", "kings"),
+    "1 Chronicles": ("chr", "chron", "ch", "chronicles"),
+    "2 Chronicles": ("chr", "chron", "ch", "chronicles"),
+    "Ezra": ("ezr", "ez"),
+    "Nehemiah": ("neh", "ne"),
+    "Esther": ("esth", "est", "es"),
+    "Job": ("jb",),
+    "Psalms": ("psalm", "ps", "psa", "psm", "pss"),
+    "Proverbs": ("prov", "pro", "prv", "pr"),
+    "Ecclesiastes": ("eccles", "eccl", "ecc", "ec", "qoh", "qoheleth"),
+    "Song of Solomon": ("song", "song of songs", "sos", "so", "canticles", "canticle of canticles"),
+    "Isaiah": ("isa", "is"),
+    "Jeremiah": ("jer", "je", "jr"),
+    "Lamentations": ("lam", "la"),
+    "Ezekiel": ("ezek", "eze", "ezk"),
+    "Daniel": ("dan", "da", "dn"),
+    "Hosea": ("hos", "ho"),
+    "Joel": ("jl",),
+    "Amos": ("am",),
+    "Obadiah": ("obad", "ob"),
+    "Jonah": ("jnh", "jon"),
+    "Micah": ("mic", "mc"),
+    "Nahum": ("nah", "na"),
+    "Habakkuk": ("hab", "hb"),
+    "Zephaniah": ("zeph", "zep", "zp"),
+    "Haggai": ("hag", "hg"),
+    "Zechariah": ("zech", "zec", "zc"),
+    "Malachi": ("mal", "ml"),
+    "Matthew": ("matt", "mat", "mt"),
+    "Mark": ("mrk", "mar", "mk", "mr"),
+    "Luke": ("luk", "lk"),
+    "John": ("joh", "jhn", "jn"),
+    "Acts": ("act", "ac", "acts of the apostles"),
+    "Romans": ("rom", "ro", "rm"),
+    "1 Corinthians": ("cor", "co", "corinthians"),
+    "2 Corinthians": ("cor", "co", "corinthians"),
+    "Galatians": ("gal", "ga"),
+    "Ephesians": ("eph", "ephes"),
+    "Philippians": ("phil", "php", "pp"),
+    "Colossians": ("col",),
+    "1 Thessalonians": ("thess", "thes", "th", "thessalonians"),
+    "2 Thessalonians": ("thess", "thes", "th", "thessalonians"),
+    "1 Timothy": ("tim", "ti", "timothy"),
+    "2 Timothy": ("tim", "ti", "timothy"),
+    "Titus": ("tit",),
+    "Philemon": ("philem", "phm", "pm"),
+    "Hebrews": ("heb",),
+    "James": ("jas", "jm"),
+    "1 Peter": ("pet", "pe", "pt", "peter"),
+    "2 Peter": ("pet", "pe", "pt", "peter"),
+    "1 John": ("jn", "jhn", "joh", "jo", "john"),
+    "2 John": ("jn", "jhn", "joh", "jo", "john"),
+    "3 John": ("jn", "jhn", "joh", "jo", "john"),
+    "Jude": ("jud", "jd"),
+    "Revelation": ("rev", "re", "rv", "revelations", "apocalypse", "revelation of john"),
+}
+
+# Spellings of the number in front of numbered books
+_ORDINALS = {
+    "1": "1", "i": "1", "first": "1", "1st": "1",
+    "2": "2", "ii": "2", "second": "2", "2nd": "2",
+    "3": "3", "iii": "3", "third": "3", "3rd": "3",
+}
+
+_ORDINAL_PATTERN = re.compile(r'^(1st|2nd|3rd|first|second|third|iii|ii|i|[123])\s*(?=[a-z])')
+
+
+def _normalize_book(book: str) -> str:
+    """Lowercase a book name, drop periods and unify the leading number"""
+    key = ' '.join(book.replace('.', ' ').split()).lower()
+    match = _ORDINAL_PATTERN.match(key)
+    if match and (match.group(1).isdigit() or key[match.end(1):match.end(1) + 1] == ' '):
+        # Roman numerals and ordinals must be followed by a space ("I Kings", not "Isaiah")
+        key = f"{_ORDINALS[match.group(1)]} {key[match.end():]}"
+    return key
+
+
+def _build_book_numbers() -> Dict[str, int]:
+    """Map every normalized spelling of every book to its number"""
+    numbers = {}
+    for number, name in enumerate(BOOKS, start=1):
+        numbers[_normalize_book(name)] = number
+        prefix = name[:2] if name[0].isdigit() else ''
+        for alias in _BOOK_ALIASES.get(name, ()):
+            numbers[_normalize_book(prefix + alias)] = number
+    return numbers
+
+
+_BOOK_NUMBERS = _build_book_numbers()
+
+_REFERENCE_PATTERN = re.compile(r'^\s*(.+?)\s*(\d+)\s*[:.]\s*(\d+)\s*$')
+
+
+def book_number(book: str) -> Optional[int]:
+    """
+    Get the 1-based canonical number for a book name, or None if unknown
+
+    Accepts full names, common abbreviations ("Gen", "Ps", "Rev") and
+    numbered books written with digits, Roman numerals or ordinals
+    ("1 Sam", "1Sam", "I Samuel", "First Samuel").
+    """
+    return _BOOK_NUMBERS.get(_normalize_book(book))
+
+
+def book_name(number: int) -> Optional[str]:
+    """Get the canonical name for a 1-based book number"""
+    if 1 <= number <= len(BOOKS):
+        return BOOKS[number - 1]
+    return None
+
+
+def canonical_book(book: str) -> Optional[str]:
+    """Get the canonical name for any spelling of a book, or None if unknown"""
+    number = book_number(book)
+    return BOOKS[number - 1] if number is not None else None
+
+
+def reference_key(book: str, chapter: int, verse: int) -> str:
+    """
+    Build the canonical cache key for a verse
+
+    Every spelling of a book yields the same interned "Book chapter:verse"
+    string, so the same verse never occupies several cache entries. Unknown
+    book names are passed through unchanged.
+    """
+    return sys.intern(f"{canonical_book(book) or book} {chapter}:{verse}")
+
+
+def parse_reference(reference: str) -> Optional[Tuple[int, int, int]]:
+    """
+    Parse a simple "Book chapter:verse" reference
+
+    Args:
+        reference: Reference string (e.g., "John 3:16", "Jn 3:16", "1 Cor 13.4")
+
+    Returns:
+        Tuple of (book number, chapter, verse) or None if not parseable
+    """
+    match = _REFERENCE_PATTERN.match(reference)
+    if not match:
+        return None
+
+    number = book_number(match.group(1))
+    if number is None:
+        return None
+
+    return number, int(match.group(2)), int(match.group(3))
+
+
+def normalize_reference(reference: str) -> Optional[str]:
+    """Get the canonical cache key for a reference string, or None if not parseable"""
+    parsed = parse_reference(reference)
+    if parsed is None:
+        return None
+
+    number, chapter, verse = parsed
+    return sys.intern(f"{BOOKS[number - 1]} {chapter}:{verse}")
+
+
+def chapter_count(book: int) -> int:
+    """Get the number of chapters in a book"""
+    if 1 <= book <= len(VERSE_COUNTS):
+        return len(VERSE_COUNTS[book - 1])
+    return 0
+
+
+def verse_count(book: int, chapter: int) -> int:
+    """Get the number of verses in a chapter (0 if the chapter does not exist)"""
+    if 1 <= chapter <= chapter_count(book):
+        return VERSE_COUNTS[book - 1][chapter - 1]
+    return 0
+
+
+def verse_exists(book: int, chapter: int, verse: int) -> bool:
+    """Check whether a chapter:verse exists in a book"""
+    return 1 <= verse <= verse_count(book, chapter)
+
+
+# Minute index for the 12-hour clock face: slot (hour - 1) * 60 + minute
+# for display hours 1-12 and minutes 0-59, listing every book whose
+# chapter:verse (hour:minute) exists.
+MINUTE_SLOTS = 720
+
+
+def _build_minute_index() -> Tuple[Tuple[str, ...], ...]:
+    """Build the minute -> candidate books index from the verse counts"""
+    index: List[List[str]] = [[] for _ in range(MINUTE_SLOTS)]
+
+    for number, name in enumerate(BOOKS, start=1):
+        for chapter in range(1, min(12, chapter_count(number)) + 1):
+            for verse in range(1, min(59, verse_count(number, chapter)) + 1):
+                index[(chapter - 1) * 60 + verse].append(name)
+
+    return tuple(tuple(books) for books in index)
+
+
+MINUTE_INDEX = _build_minute_index()
+
+
+def books_for_time(display_hour: int, minute: int) -> Tuple[str, ...]:
+    """
+    Get every book that has chapter display_hour, verse minute
+
+    Args:
+        display_hour: Hour on the 12-hour clock face (1-12)
+        minute: Minute (0-59)
+
+    Returns:
+        Tuple of canonical book names in canonical order
+    """
+    if not (1 <= display_hour <= 12 and 0 <= minute <= 59):
+        return ()
+    return MINUTE_INDEX[(display_hour - 1) * 60 + minute]
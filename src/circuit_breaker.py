@@ -0,0 +1,134 @@
+"""
+Circuit Breaker and Retry Budget
+
+This module provides a circuit breaker for outbound API traffic and a
+retry budget that caps the retries made per display update. While the
+circuit is open no requests are made, and each failed half-open trial
+doubles the time before the next one.
+"""
+
+import threading
+import time
+from typing import Any, Dict
+
+
+class CircuitOpenError(Exception):
+    """Raised when a request is refused because the circuit is open"""
+
+
+class RetryBudgetExhausted(Exception):
+    """Raised when the current update has used all of its retries"""
+
+
+class CircuitBreaker:
+    """Closed / open / half-open circuit breaker with exponential backoff"""
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, failure_threshold: int = 3, reset_timeout: float = 30,
+                 max_reset_timeout: float = 900):
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self.max_reset_timeout = max(reset_timeout, max_reset_timeout)
+
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.current_timeout = reset_timeout
+        self.opened_at = 0.0
+        self._trial_thread = None  # Thread holding the half-open trial
+        self._lock = threading.Lock()
+
+        # Statistics
+        self.times_opened = 0
+        self.rejected_requests = 0
+
+    def allow_request(self) -> bool:
+        """Check whether a request may be sent now"""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+
+            if self.state == self.OPEN and time.monotonic() - self.opened_at >= self.current_timeout:
+                # Let a single trial request through
+                self.state = self.HALF_OPEN
+                self._trial_thread = threading.get_ident()
+                return True
+
+            self.rejected_requests += 1
+            return False
+
+    def release(self):
+        """
+        Give back a request allowed by allow_request() that was never sent
+
+        If it was the half-open trial, the circuit returns to open with the
+        trial due immediately, so the next request can take it.
+        """
+        with self._lock:
+            if self.state == self.HALF_OPEN and self._trial_thread == threading.get_ident():
+                self.state = self.OPEN
+                self._trial_thread = None
+
+    def record_success(self):
+        """Record a request that reached the service"""
+        with self._lock:
+            self.state = self.CLOSED
+            self.consecutive_failures = 0
+            self.current_timeout = self.reset_timeout
+
+    def record_failure(self):
+        """Record a request that failed because of the network or the service"""
+        with self._lock:
+            self.consecutive_failures += 1
+
+            if self.state == self.HALF_OPEN:
+                # Trial failed, back off exponentially
+                self.current_timeout = min(self.current_timeout * 2, self.max_reset_timeout)
+                self._open()
+            elif self.state == self.CLOSED and self.consecutive_failures >= self.failure_threshold:
+                self._open()
+
+    def _open(self):
+        """Open the circuit (lock must be held)"""
+        self.state = self.OPEN
+        self.opened_at = time.monotonic()
+        self.times_opened += 1
+
+    @property
+    def is_open(self) -> bool:
+        return self.state != self.CLOSED
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get circuit breaker statistics"""
+        with self._lock:
+            retry_in = None
+            if self.state == self.OPEN:
+                retry_in = max(0.0, self.current_timeout - (time.monotonic() - self.opened_at))
+
+            return {
+                'state': self.state,
+                'consecutive_failures': self.consecutive_failures,
+                'failure_threshold': self.failure_threshold,
+                'current_timeout': self.current_timeout,
+                'retry_in_seconds': retry_in,
+                'times_opened': self.times_opened,
+                'rejected_requests': self.rejected_requests
+            }
+
+
+class RetryBudget:
+    """Thread-safe count of retries left for one update"""
+
+    def __init__(self, attempts: int):
+        self.remaining = max(0, attempts)
+        self._lock = threading.Lock()
+
+    def consume(self) -> bool:
+        """Use one retry, returning False if none are left"""
+        with self._lock:
+            if self.remaining <= 0:
+                return False
+            self.remaining -= 1
+            return True
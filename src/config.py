@@ -9,7 +9,7 @@ import os
 import logging
 from pathlib import Path
 from typing import Optional, Dict, Any
-from dotenv import load_dotenv
+from dotenv import load_dotenv, find_dotenv, dotenv_values
 
 # Load environment variables from .env file
 load_dotenv()
@@ -34,11 +34,32 @@ class Config:
         self.BIBLE_API_URL = os.getenv('BIBLE_API_URL', 'https://bible-api.com')
         self.BIBLE_VERSION = os.getenv('BIBLE_VERSION', 'kjv')
         self.FALLBACK_ENABLED = os.getenv('FALLBACK_ENABLED', 'true').lower() == 'true'
+        self.VERSE_STORE_PATH = os.getenv('VERSE_STORE_PATH', 'data/bible')
+        self.VERSE_CACHE_PATH = os.getenv('VERSE_CACHE_PATH', 'data/cache/verses.db')
+        self.CACHE_SIZE = int(os.getenv('CACHE_SIZE', '100'))
+        self.CACHE_TTL = int(os.getenv('CACHE_TTL', '3600'))
+        self.BULK_FETCH = os.getenv('BULK_FETCH', 'true').lower() == 'true'
+        self.NEGATIVE_CACHE_TTL = int(os.getenv('NEGATIVE_CACHE_TTL', '2592000'))
+        self.PROBE_CONCURRENCY = int(os.getenv('PROBE_CONCURRENCY', '4'))
+        self.RETRY_BACKOFF = float(os.getenv('RETRY_BACKOFF', '0.5'))
+        self.CIRCUIT_FAILURE_THRESHOLD = int(os.getenv('CIRCUIT_FAILURE_THRESHOLD', '3'))
+        self.CIRCUIT_RESET_TIMEOUT = float(os.getenv('CIRCUIT_RESET_TIMEOUT', '30'))
+        self.CIRCUIT_MAX_RESET_TIMEOUT = float(os.getenv('CIRCUIT_MAX_RESET_TIMEOUT', '900'))
+        self.RATE_LIMIT = float(os.getenv('RATE_LIMIT', '0.3'))
+        self.RATE_BURST = int(os.getenv('RATE_BURST', '5'))
+        self.RATE_LIMIT_WAIT = float(os.getenv('RATE_LIMIT_WAIT', '5'))
         
         # Timing Configuration
         self.UPDATE_INTERVAL = int(os.getenv('UPDATE_INTERVAL', '60'))
         self.STARTUP_DELAY = int(os.getenv('STARTUP_DELAY', '30'))
         self.RETRY_ATTEMPTS = int(os.getenv('RETRY_ATTEMPTS', '3'))
+        self.PREFETCH_MINUTES = int(os.getenv('PREFETCH_MINUTES', '15'))
+        self.PREFETCH_WORKERS = int(os.getenv('PREFETCH_WORKERS', '2'))
+        self.PREFETCH_INTERVAL = float(os.getenv('PREFETCH_INTERVAL', '1.0'))
+        self.DAY_PLAN_ENABLED = os.getenv('DAY_PLAN_ENABLED', 'true').lower() == 'true'
+        self.DAY_PLAN_PATH = os.getenv('DAY_PLAN_PATH', 'data/cache/plans')
+        self.FLEET_SEED = os.getenv('FLEET_SEED', '')
+        self.TIME_RULES_PATH = os.getenv('TIME_RULES_PATH', 'data/time_rules.json')
         
         # Logging Configuration
         self.LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
@@ -62,6 +83,10 @@ class Config:
         self.FONT_PATH = os.getenv('FONT_PATH', 'data/fonts')
         self.DEFAULT_FONT_SIZE = int(os.getenv('DEFAULT_FONT_SIZE', '48'))
         self.TITLE_FONT_SIZE = int(os.getenv('TITLE_FONT_SIZE', '36'))
+        # Comma-separated; searched before assets/fonts and the system font directories
+        self.FONT_SEARCH_PATHS = [path.strip() for path in os.getenv('FONT_SEARCH_PATHS', '').split(',')
+                                  if path.strip()]
+        self.FONT_CACHE_SIZE = int(os.getenv('FONT_CACHE_SIZE', '16'))
         
         # Simulation Mode (for testing without hardware)
         self.SIMULATION_MODE = os.getenv('SIMULATION_MODE', 'false').lower() == 'true'
@@ -112,6 +137,11 @@ class Config:
         if self.UPDATE_INTERVAL < 10:
             validation_results['warnings'].append("Very short update interval may cause display issues")
             
+        # Validate cache configuration
+        if self.CACHE_SIZE <= 0:
+            validation_results['errors'].append(f"Invalid cache size: {self.CACHE_SIZE}")
+            validation_results['valid'] = False
+            
         # Validate paths
         if not self.SIMULATION_MODE:
             if not Path(self.DRIVER_PATH).exists():
@@ -144,6 +174,27 @@ class Config:
         if file_vcom:
             self.VCOM_VALUE = file_vcom
             self.logger.info(f"Updated VCOM value from file: {self.VCOM_VALUE}")
+    
+    def reload_runtime_settings(self) -> Dict[str, Any]:
+        """
+        Re-read the settings that can change while the clock is running
+        
+        The web interface saves settings to the .env file, so changes there
+        to BIBLE_VERSION are picked up without a restart.
+        
+        Returns:
+            Dict of the settings that changed, with their new values
+        """
+        changed = {}
+        env_file = find_dotenv()
+        values = dotenv_values(env_file) if env_file else {}
+        
+        version = (values.get('BIBLE_VERSION') or '').strip().lower()
+        if version and version != self.BIBLE_VERSION.lower():
+            self.BIBLE_VERSION = version
+            changed['BIBLE_VERSION'] = version
+        
+        return changed
 
 # Global configuration instance
 config = Config()
@@ -0,0 +1,185 @@
+"""
+Day Planner
+
+This module precomputes the verse schedule for a whole day. At startup and
+again after midnight the planner runs verse selection for all 1440 minutes
+with a random generator seeded from the date and a fleet seed, and persists
+the result as JSON. Clocks sharing a fleet seed agree on every minute's
+candidates, and the live path reads them with a list index instead of
+shuffling book lists each minute.
+"""
+
+import json
+import logging
+import os
+import random
+import threading
+from datetime import date, datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from canon import book_name, book_number
+from verse_store import resolve_data_path
+
+PLAN_FORMAT_VERSION = 1
+MINUTES_PER_DAY = 1440
+
+# One minute's candidates as (book, chapter, verse) in preference order,
+# plus how many leading candidates are special-time verses. A minute's
+# candidates all share one chapter:verse, so plans are persisted per minute
+# as [chapter, verse, special count, [book numbers]].
+PlanEntry = Tuple[Tuple[Tuple[str, int, int], ...], int]
+
+
+class DayPlanner:
+    """Builds, persists and serves seeded 1440-minute verse plans"""
+
+    def __init__(self, select: Callable[[int, int, random.Random, date], PlanEntry],
+                 plan_dir: str = "data/cache/plans", fleet_seed: str = "",
+                 rules: str = "", keep_days: int = 3):
+        """
+        Args:
+            select: Selection function taking (hour, minute, rng, day)
+            plan_dir: Directory holding persisted plans
+            fleet_seed: Seed shared by every clock that should stay in sync
+            rules: Fingerprint of the selection rules; plans built under
+                different rules are rebuilt
+            keep_days: Number of persisted plans to keep
+        """
+        self.select = select
+        self.plan_dir = resolve_data_path(plan_dir)
+        self.fleet_seed = fleet_seed
+        self.rules = rules
+        self.keep_days = max(2, keep_days)
+        self.logger = logging.getLogger(__name__)
+
+        self._plans: Dict[date, List[PlanEntry]] = {}
+        self._lock = threading.Lock()
+        self.plans_built = 0
+        self.plans_loaded = 0
+
+    def seed_for(self, day: date) -> str:
+        """Seed string for a day's plan"""
+        return f"{self.fleet_seed}:{day.isoformat()}"
+
+    def get_entry(self, when: datetime) -> PlanEntry:
+        """Get the planned candidates for one minute"""
+        return self.get_plan(when.date())[when.hour * 60 + when.minute]
+
+    def get_plan(self, day: date) -> List[PlanEntry]:
+        """Get a day's plan, loading or building it on first use"""
+        plan = self._plans.get(day)
+        if plan is not None:
+            return plan
+
+        with self._lock:
+            plan = self._plans.get(day)
+            if plan is None:
+                plan = self._load(day)
+                if plan is None:
+                    plan = self._build(day)
+                    self._save(day, plan)
+                self._plans[day] = plan
+        return plan
+
+    def ensure(self, now: Optional[datetime] = None):
+        """
+        Make sure today's and tomorrow's plans are ready
+
+        Called at startup and periodically by the scheduler, so the plan for
+        a new day is built ahead of midnight rather than on the first minute.
+        """
+        today = (now or datetime.now()).date()
+        for day in (today, today + timedelta(days=1)):
+            self.get_plan(day)
+
+        with self._lock:
+            for day in [d for d in self._plans if d < today - timedelta(days=1)]:
+                del self._plans[day]
+        self._prune(today)
+
+    def _build(self, day: date) -> List[PlanEntry]:
+        """Run selection for every minute of the day from the day's seed"""
+        rng = random.Random(self.seed_for(day))
+        plan = [self.select(hour, minute, rng, day) for hour in range(24) for minute in range(60)]
+        self.plans_built += 1
+        self.logger.info(f"Built verse plan for {day.isoformat()}")
+        return plan
+
+    def _plan_file(self, day: date):
+        return self.plan_dir / f"{day.isoformat()}.json"
+
+    def _load(self, day: date) -> Optional[List[PlanEntry]]:
+        """Load a persisted plan if it matches the current seed and rules"""
+        plan_file = self._plan_file(day)
+        if not plan_file.exists():
+            return None
+
+        try:
+            with open(plan_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+
+            if (data.get('format') != PLAN_FORMAT_VERSION or data.get('seed') != self.seed_for(day)
+                    or data.get('rules') != self.rules or len(data.get('minutes', [])) != MINUTES_PER_DAY):
+                self.logger.info(f"Verse plan for {day.isoformat()} is stale, rebuilding")
+                return None
+
+            plan = [(tuple((book_name(number), chapter, verse) for number in books), special)
+                    for chapter, verse, special, books in data['minutes']]
+
+            self.plans_loaded += 1
+            self.logger.info(f"Loaded verse plan for {day.isoformat()}")
+            return plan
+
+        except Exception as e:
+            self.logger.warning(f"Could not load verse plan {plan_file}: {e}")
+            return None
+
+    def _save(self, day: date, plan: List[PlanEntry]):
+        """Persist a plan atomically"""
+        data = {
+            'format': PLAN_FORMAT_VERSION,
+            'date': day.isoformat(),
+            'seed': self.seed_for(day),
+            'rules': self.rules,
+            'minutes': [_pack_entry(entry) for entry in plan]
+        }
+
+        try:
+            self.plan_dir.mkdir(parents=True, exist_ok=True)
+            temp_file = self._plan_file(day).with_suffix('.tmp')
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f, separators=(',', ':'))
+            os.replace(temp_file, self._plan_file(day))
+        except OSError as e:
+            self.logger.warning(f"Could not save verse plan for {day.isoformat()}: {e}")
+
+    def _prune(self, today: date):
+        """Remove persisted plans older than the retention window"""
+        if not self.plan_dir.exists():
+            return
+
+        oldest = today - timedelta(days=self.keep_days - 2)
+        for plan_file in self.plan_dir.glob('*.json'):
+            try:
+                if date.fromisoformat(plan_file.stem) < oldest:
+                    plan_file.unlink()
+            except (ValueError, OSError):
+                continue
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get planner statistics"""
+        with self._lock:
+            days = sorted(day.isoformat() for day in self._plans)
+        return {
+            'fleet_seed': self.fleet_seed,
+            'path': str(self.plan_dir),
+            'days': days,
+            'built': self.plans_built,
+            'loaded': self.plans_loaded
+        }
+
+
+def _pack_entry(entry: PlanEntry) -> List[Any]:
+    """Serialize a plan entry as [chapter, verse, special count, [book numbers]]"""
+    candidates, special = entry
+    chapter, verse = candidates[0][1:] if candidates else (0, 0)
+    return [chapter, verse, special, [book_number(book) for book, _, _ in candidates]]
@@ -9,7 +9,7 @@ import logging
 import gc
 import psutil
 import os
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
 from PIL import Image
 from config import config
 from waveshare_wrapper import OptimizedWaveshareIT8951
@@ -29,6 +29,10 @@ class DisplayManager:
         self.error_count = 0
         self.last_error = None
         
+        # Whether the panel shows the generator's previous verse frame, so
+        # its dirty regions describe what will change on screen
+        self.frame_in_sync = False
+        
         # Memory management
         self.memory_threshold = config.MEMORY_LIMIT_MB * 1024 * 1024  # Convert to bytes
         
@@ -41,7 +45,11 @@ class DisplayManager:
             self.image_generator = ImageGenerator(
                 width=config.DISPLAY_WIDTH,
                 height=config.DISPLAY_HEIGHT,
-                font_path=config.FONT_PATH
+                font_path=config.FONT_PATH,
+                font_size=config.DEFAULT_FONT_SIZE,
+                title_font_size=config.TITLE_FONT_SIZE,
+                font_search_paths=config.FONT_SEARCH_PATHS,
+                font_cache_size=config.FONT_CACHE_SIZE
             )
             self.logger.info("Image generator initialized")
             
@@ -101,21 +109,28 @@ class DisplayManager:
         try:
             self.logger.info(f"Displaying verse: {verse_data.get('reference', 'Unknown')}")
             
-            # Generate image
-            image = self.image_generator.generate_verse_image(verse_data)
+            # Generate image and the regions that changed since the last frame
+            image, dirty_regions = self.image_generator.render_verse_frame(verse_data)
+            self.logger.debug(f"Dirty regions: {dirty_regions}")
             
             if self.simulation_mode:
-                return self._simulate_display(image, verse_data)
+                success = self._simulate_display(image, verse_data)
             else:
-                return self._display_on_hardware(image, force_refresh)
+                success = self._display_on_hardware(
+                    image, force_refresh, dirty_regions if self.frame_in_sync else None)
+            
+            self.frame_in_sync = success
+            return success
                 
         except Exception as e:
             self.logger.error(f"Failed to display verse: {e}")
             self.last_error = str(e)
             self.error_count += 1
+            self.frame_in_sync = False
             return False
     
-    def _display_on_hardware(self, image: Image.Image, force_refresh: bool = False) -> bool:
+    def _display_on_hardware(self, image: Image.Image, force_refresh: bool = False,
+                             dirty_regions: Optional[List[Tuple[int, int, int, int]]] = None) -> bool:
         """Display image on hardware"""
         try:
             if not self.epd:
@@ -126,7 +141,7 @@ class DisplayManager:
             self._check_memory_usage()
             
             # Display image
-            success = self.epd.display(image, force_refresh)
+            success = self.epd.display(image, force_refresh, dirty_regions)
             
             if success:
                 self.display_count += 1
@@ -168,6 +183,7 @@ class DisplayManager:
             self.logger.warning(f"Displaying error message: {error_message}")
             
             # Generate error image
+            self.frame_in_sync = False
             image = self.image_generator.generate_error_image(error_message)
             
             if self.simulation_mode:
@@ -181,6 +197,7 @@ class DisplayManager:
     
     def clear_display(self) -> bool:
         """Clear the display"""
+        self.frame_in_sync = False
         try:
             if self.simulation_mode:
                 self.logger.info("Simulation: Display cleared")
@@ -243,6 +260,7 @@ class DisplayManager:
         if self.image_generator:
             try:
                 stats['font_info'] = self.image_generator.get_font_info()
+                stats['render_info'] = self.image_generator.get_render_stats()
             except Exception as e:
                 self.logger.warning(f"Failed to get font info: {e}")
         
@@ -0,0 +1,127 @@
+"""
+Font Registry
+
+This module finds the fonts available to the clock and opens them on
+demand. The search paths are scanned once for TrueType/OpenType files;
+faces are then loaded lazily per (file, size) and kept in a bounded LRU
+cache, so only the sizes actually drawn stay in memory.
+"""
+
+import logging
+import os
+import threading
+from typing import Any, Dict, Optional, Sequence
+from PIL import ImageFont
+from lru_cache import LRUCache
+from verse_store import resolve_data_path
+
+FONT_EXTENSIONS = ('.ttf', '.otf', '.ttc')
+
+# Searched after the configured font directory, in order
+DEFAULT_SEARCH_PATHS = (
+    'assets/fonts',                 # Fonts shipped with the clock
+    '/usr/share/fonts',
+    '/usr/local/share/fonts',
+    '~/.local/share/fonts',
+    '~/.fonts'
+)
+
+
+class FontRegistry:
+    """Discovers font files once and serves faces per (file, size) from a bounded cache"""
+
+    def __init__(self, search_paths: Sequence[str], cache_size: int = 16):
+        """
+        Args:
+            search_paths: Directories to scan (recursively); a font file name
+                found in an earlier directory shadows later ones
+            cache_size: Maximum number of (file, size) faces kept open
+        """
+        self.search_paths = [resolve_data_path(path) for path in search_paths]
+        self.logger = logging.getLogger(__name__)
+
+        self._files: Optional[Dict[str, str]] = None  # lower-case file name -> path
+        self._usable: Dict[str, bool] = {}  # path -> whether FreeType can open it
+        self._lock = threading.Lock()
+        self._faces = LRUCache(capacity=cache_size, ttl=0)
+        self.faces_loaded = 0
+
+    def _discover(self) -> Dict[str, str]:
+        """Index the font files under the search paths (first call only)"""
+        with self._lock:
+            if self._files is None:
+                files = {}
+                for directory in self.search_paths:
+                    if not directory.is_dir():
+                        continue
+                    for root, _, names in os.walk(directory):
+                        for name in sorted(names):
+                            if name.lower().endswith(FONT_EXTENSIONS):
+                                files.setdefault(name.lower(), os.path.join(root, name))
+
+                self.logger.info(f"Found {len(files)} font files in {len(self.search_paths)} search paths")
+                self._files = files
+            return self._files
+
+    def find(self, names: Sequence[str]) -> Optional[str]:
+        """Path of the first of the named font files that exists and opens, or None"""
+        files = self._discover()
+        for name in names:
+            path = files.get(name.lower())
+            if path and self._check(path):
+                return path
+        return None
+
+    def _check(self, path: str) -> bool:
+        """Whether a font file can be opened (checked once per file)"""
+        if path not in self._usable:
+            try:
+                ImageFont.truetype(path, 12)
+                self._usable[path] = True
+            except Exception as e:
+                self.logger.warning(f"Skipping unreadable font {path}: {e}")
+                self._usable[path] = False
+        return self._usable[path]
+
+    def get(self, path: Optional[str], size: int) -> ImageFont.ImageFont:
+        """
+        Get a face, opening it on first use
+
+        Args:
+            path: Font file from find(), or None for Pillow's built-in font
+            size: Size in pixels
+
+        Returns:
+            The font, or Pillow's built-in font if the file cannot be opened
+        """
+        key = (path, size)
+        face = self._faces.get(key)
+        if face is None:
+            face = self._load(path, size)
+            self._faces.put(key, face)
+            self.faces_loaded += 1
+        return face
+
+    def _load(self, path: Optional[str], size: int) -> ImageFont.ImageFont:
+        if path and self._usable.get(path, True):
+            try:
+                return ImageFont.truetype(path, size)
+            except Exception as e:
+                self.logger.warning(f"Failed to load font {path}: {e}")
+                self._usable[path] = False
+
+        try:
+            return ImageFont.load_default(size)
+        except TypeError:
+            # Pillow < 10.1 only has the fixed-size bitmap font
+            return ImageFont.load_default()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get registry statistics"""
+        return {
+            'search_paths': [str(path) for path in self.search_paths],
+            'fonts_found': len(self._files) if self._files is not None else None,
+            'unreadable_fonts': [path for path, usable in self._usable.items() if not usable],
+            'faces_loaded': self.faces_loaded,
+            'face_cache': self._faces.get_stats()
+        }
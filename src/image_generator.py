@@ -6,23 +6,128 @@ layouts, font management, and performance optimizations.
 """
 
 import logging
-from PIL import Image, ImageDraw, ImageFont
-from typing import Dict, Any, Tuple, Optional
+import math
+from PIL import Image, ImageChops, ImageDraw, ImageFont
+from typing import Dict, Any, List, Tuple, Optional
 from pathlib import Path
 import textwrap
 import os
+from lru_cache import LRUCache
+from font_registry import DEFAULT_SEARCH_PATHS, FontRegistry
+
+# Distinct (font, word) pairs whose widths are remembered
+WORD_CACHE_SIZE = 8192
+
+# Smallest verse font size; verse text is set at the largest size up to the
+# large font size that fits the box
+VERSE_MIN_FONT_SIZE = 18
+
+# Verse layouts remembered
+FIT_CACHE_SIZE = 256
+
+# A region of the frame as (left, top, right, bottom), right/bottom exclusive
+Box = Tuple[int, int, int, int]
+
+# Frame layers, bottom to top. The background holds the static border; the
+# others are stamped over it from their own cached rasters.
+LAYERS = ('background', 'time', 'date', 'reference', 'verse', 'footer')
+
+
+class _LayerRecorder:
+    """
+    Stand-in for ImageDraw that records a layer's draw calls
+    
+    The layout code measures and "draws" against a recorder, so a layer's
+    recorded calls double as its cache key: a layer whose calls match the
+    previous frame's is not rasterized again.
+    """
+    
+    def __init__(self, measure: ImageDraw.ImageDraw):
+        self.measure = measure
+        self.calls = []
+    
+    def textbbox(self, xy, text, font=None, **kwargs):
+        return self.measure.textbbox(xy, text, font=font, **kwargs)
+    
+    def textlength(self, text, font=None, **kwargs):
+        return self.measure.textlength(text, font=font, **kwargs)
+    
+    def text(self, xy, text, font=None, fill=None):
+        self.calls.append(('text', tuple(xy), text, font, fill))
+    
+    def rectangle(self, xy, outline=None, width=1, fill=None):
+        self.calls.append(('rectangle', tuple(xy), outline, width, fill))
+    
+    def key(self) -> tuple:
+        return tuple(self.calls)
+    
+    def bbox(self) -> Optional[Box]:
+        """Bounding box of everything the layer draws, or None if empty"""
+        boxes = []
+        for call in self.calls:
+            if call[0] == 'text':
+                _, xy, text, font, _ = call
+                boxes.append(self.measure.textbbox(xy, text, font=font))
+            else:
+                x0, y0, x1, y1 = call[1]
+                boxes.append((x0, y0, x1 + 1, y1 + 1))
+        
+        boxes = [box for box in boxes if box[2] > box[0] and box[3] > box[1]]
+        if not boxes:
+            return None
+        return (math.floor(min(box[0] for box in boxes)), math.floor(min(box[1] for box in boxes)),
+                math.ceil(max(box[2] for box in boxes)), math.ceil(max(box[3] for box in boxes)))
+    
+    def replay(self, draw: ImageDraw.ImageDraw, left: int = 0, top: int = 0):
+        """Draw the recorded calls, shifted so (left, top) lands at the origin"""
+        for call in self.calls:
+            if call[0] == 'text':
+                _, (x, y), text, font, fill = call
+                draw.text((x - left, y - top), text, font=font, fill=fill)
+            else:
+                _, (x0, y0, x1, y1), outline, width, fill = call
+                draw.rectangle([x0 - left, y0 - top, x1 - left, y1 - top],
+                               outline=outline, width=width, fill=fill)
+
 
 class ImageGenerator:
     """Enhanced image generator for e-ink display"""
     
-    def __init__(self, width: int = 1872, height: int = 1404, font_path: str = "data/fonts"):
+    def __init__(self, width: int = 1872, height: int = 1404, font_path: str = "data/fonts",
+                 font_size: int = 48, title_font_size: int = 36,
+                 font_search_paths: Optional[List[str]] = None, font_cache_size: int = 16):
         self.width = width
         self.height = height
         self.font_path = Path(font_path)
         self.logger = logging.getLogger(__name__)
         
-        # Font cache for performance
-        self.font_cache = {}
+        # Fonts are found once and opened lazily per (file, size); configured
+        # directories are searched before the bundled and system ones
+        search_paths = [font_path] + list(font_search_paths or []) + list(DEFAULT_SEARCH_PATHS)
+        self.fonts = FontRegistry(search_paths, cache_size=font_cache_size)
+        self.font_files = {}  # font type -> font file (None for the built-in font)
+        self.font_sizes = {
+            'large': font_size,         # Time; largest verse size
+            'medium': title_font_size,  # Reference; primary verse size
+            'small': max(1, round(title_font_size * 2 / 3))  # Date, footer
+        }
+        
+        # Word advance widths, measured on one shared scratch canvas
+        self._measure = ImageDraw.Draw(Image.new('L', (1, 1)))
+        self._word_widths = LRUCache(capacity=WORD_CACHE_SIZE, ttl=0)
+        
+        # Verse fit engine: line heights per size, layouts per verse
+        self._line_heights = {}  # (family, size) -> line height
+        self._fits = LRUCache(capacity=FIT_CACHE_SIZE, ttl=0)
+        
+        # Rasterized layers from the previous frame: name -> (key, box, image)
+        self._layers = {}
+        self.layers_rendered = 0
+        self.layers_reused = 0
+        
+        # Last frame produced, for dirty-region reporting
+        self._last_frame = None
+        self.last_dirty_regions = []
         
         # Layout configuration
         self.margins = {
@@ -32,6 +137,12 @@ class ImageGenerator:
             'right': 100
         }
         
+        # Vertical spacing between sections
+        self.spacing = {
+            'after_time': 40,
+            'after_reference': 30
+        }
+        
         # Color configuration for e-ink
         self.colors = {
             'background': 255,  # White
@@ -43,41 +154,28 @@ class ImageGenerator:
         self._load_default_fonts()
     
     def _load_default_fonts(self):
-        """Load default fonts with fallbacks"""
-        # Try to load custom fonts first
+        """Pick the font file for each font type, with fallbacks (faces open on first use)"""
+        # Try to load custom fonts first; RobotoMono ships with the clock
         font_files = {
-            'title': ['DejaVuSans-Bold.ttf', 'arial.ttf', 'helvetica.ttf'],
-            'verse': ['DejaVuSans.ttf', 'arial.ttf', 'helvetica.ttf'],
-            'reference': ['DejaVuSans-Bold.ttf', 'arial.ttf', 'helvetica.ttf'],
-            'time': ['DejaVuSans-Bold.ttf', 'arial.ttf', 'helvetica.ttf']
+            'title': ['DejaVuSans-Bold.ttf', 'arial.ttf', 'helvetica.ttf', 'RobotoMono-Regular.ttf'],
+            'verse': ['DejaVuSans.ttf', 'arial.ttf', 'helvetica.ttf', 'RobotoMono-Regular.ttf'],
+            'reference': ['DejaVuSans-Bold.ttf', 'arial.ttf', 'helvetica.ttf', 'RobotoMono-Regular.ttf'],
+            'time': ['DejaVuSans-Bold.ttf', 'arial.ttf', 'helvetica.ttf', 'RobotoMono-Regular.ttf']
         }
         
         for font_type, font_names in font_files.items():
-            font_loaded = False
+            self.font_files[font_type] = self.fonts.find(font_names)
             
-            for font_name in font_names:
-                font_file = self.font_path / font_name
-                if font_file.exists():
-                    try:
-                        # Load different sizes
-                        self.font_cache[f'{font_type}_large'] = ImageFont.truetype(str(font_file), 48)
-                        self.font_cache[f'{font_type}_medium'] = ImageFont.truetype(str(font_file), 36)
-                        self.font_cache[f'{font_type}_small'] = ImageFont.truetype(str(font_file), 24)
-                        font_loaded = True
-                        self.logger.info(f"Loaded font {font_name} for {font_type}")
-                        break
-                    except Exception as e:
-                        self.logger.warning(f"Failed to load font {font_name}: {e}")
-            
-            if not font_loaded:
+            if self.font_files[font_type]:
+                self.logger.info(f"Using font {self.font_files[font_type]} for {font_type}")
+            else:
                 # Use default font as fallback
-                try:
-                    self.font_cache[f'{font_type}_large'] = ImageFont.load_default()
-                    self.font_cache[f'{font_type}_medium'] = ImageFont.load_default()
-                    self.font_cache[f'{font_type}_small'] = ImageFont.load_default()
-                    self.logger.warning(f"Using default font for {font_type}")
-                except Exception as e:
-                    self.logger.error(f"Failed to load default font for {font_type}: {e}")
+                self.logger.warning(f"Using default font for {font_type}")
+    
+    def _get_font(self, name: str) -> ImageFont.ImageFont:
+        """Font for a '<type>_<size>' name such as 'time_large'"""
+        font_type, size = name.rsplit('_', 1)
+        return self.fonts.get(self.font_files.get(font_type), self.font_sizes[size])
     
     def generate_verse_image(self, verse_data: Dict[str, str]) -> Image.Image:
         """
@@ -89,38 +187,169 @@ class ImageGenerator:
         Returns:
             PIL Image ready for display
         """
-        # Create image with white background (255 = white for e-ink)
-        image = Image.new('L', (self.width, self.height), 255)  # 'L' mode for grayscale
-        draw = ImageDraw.Draw(image)
+        image, _ = self.render_verse_frame(verse_data)
+        return image
+    
+    def render_verse_frame(self, verse_data: Dict[str, str]) -> Tuple[Image.Image, List[Box]]:
+        """
+        Generate image for verse display along with what changed
         
+        Args:
+            verse_data: Formatted verse data with components
+            
+        Returns:
+            (image, dirty regions), where the regions cover every pixel that
+            differs from the previous frame (the whole frame when there is no
+            previous verse frame, an empty list when nothing changed)
+        """
         # Calculate layout areas
         layout = self._calculate_layout()
+        layers = {name: _LayerRecorder(self._measure) for name in LAYERS}
         
-        # Draw components
+        # Lay out components, each into its own layer
         current_y = layout['content_top']
         
         # Draw time and date
-        current_y = self._draw_time_section(draw, verse_data, layout, current_y)
+        if verse_data.get('time', ''):
+            current_y = self._draw_time(layers['time'], verse_data, layout, current_y)
+            current_y = self._draw_date(layers['date'], verse_data, layout, current_y)
         
         # Add spacing
-        current_y += 40
+        current_y += self.spacing['after_time']
         
         # Draw verse reference
-        current_y = self._draw_reference(draw, verse_data, layout, current_y)
+        current_y = self._draw_reference(layers['reference'], verse_data, layout, current_y)
         
         # Add spacing
-        current_y += 30
+        current_y += self.spacing['after_reference']
         
         # Draw verse text
-        current_y = self._draw_verse_text(draw, verse_data, layout, current_y)
+        current_y = self._draw_verse_text(layers['verse'], verse_data, layout, current_y)
         
         # Draw footer (translation, source info)
-        self._draw_footer(draw, verse_data, layout)
+        self._draw_footer(layers['footer'], verse_data, layout)
         
         # Add decorative elements if space allows
-        self._add_decorative_elements(draw, layout)
+        self._add_decorative_elements(layers['background'], layout)
+        
+        # Composite: copy the background, then stamp each layer over it.
+        # Taking the darker pixel keeps black-on-white layers that share
+        # rows from erasing each other.
+        full_frame = (0, 0, self.width, self.height)
+        invalidated = []
+        
+        for name in LAYERS:
+            previous = self._layers.get(name)
+            box, layer_image = self._render_layer(name, layers[name],
+                                                  full_frame if name == 'background' else None)
+            if self._layers[name] is not previous:
+                # Re-rasterized: both where it was and where it is now may change
+                invalidated.extend(b for b in (previous and previous[1], box) if b)
+            
+            if name == 'background':
+                image = layer_image.copy()
+            elif layer_image is not None:
+                image.paste(ImageChops.darker(image.crop(box), layer_image), box)
+        
+        if self._last_frame is None:
+            dirty = [full_frame]
+        else:
+            dirty = self._diff_regions(self._last_frame, image, invalidated)
+        
+        self._last_frame = image
+        self.last_dirty_regions = dirty
+        return image, dirty
+    
+    def _diff_regions(self, previous: Image.Image, current: Image.Image,
+                      candidates: List[Box]) -> List[Box]:
+        """
+        Regions where two frames differ
         
-        return image
+        Only the candidate boxes (invalidated layers) can have changed; each
+        merged candidate is narrowed to the bounding box of its differing
+        pixels.
+        """
+        regions = []
+        for left, top, right, bottom in _merge_boxes(candidates):
+            box = (left, top, right, bottom)
+            changed = ImageChops.difference(previous.crop(box), current.crop(box)).getbbox()
+            if changed:
+                regions.append((left + changed[0], top + changed[1],
+                                left + changed[2], top + changed[3]))
+        return regions
+    
+    def _render_layer(self, name: str, recorder: _LayerRecorder,
+                      box: Optional[Box] = None) -> Tuple[Optional[Box], Optional[Image.Image]]:
+        """
+        Rasterize a layer, reusing the previous frame's raster when its draw
+        calls are unchanged
+        
+        Args:
+            name: Layer name
+            recorder: The layer's recorded draw calls
+            box: Region to rasterize (defaults to the extent of the calls)
+            
+        Returns:
+            (box, image) for the layer, or (None, None) if it draws nothing
+        """
+        key = (recorder.key(), box, self.colors['background'])
+        cached = self._layers.get(name)
+        if cached is not None and cached[0] == key:
+            self.layers_reused += 1
+            return cached[1], cached[2]
+        
+        box = box or recorder.bbox()
+        if box is not None:
+            # Clip to the frame
+            box = (max(0, box[0]), max(0, box[1]), min(self.width, box[2]), min(self.height, box[3]))
+            if box[2] <= box[0] or box[3] <= box[1]:
+                box = None
+        
+        layer_image = None
+        if box is not None:
+            layer_image = Image.new('L', (box[2] - box[0], box[3] - box[1]), self.colors['background'])
+            recorder.replay(ImageDraw.Draw(layer_image), box[0], box[1])
+        
+        self._layers[name] = (key, box, layer_image)
+        self.layers_rendered += 1
+        return box, layer_image
+    
+    def estimate_verse_capacity(self) -> int:
+        """
+        Estimate how many characters of verse text fit at the primary verse size
+        
+        Lays out a worst-case time, date and reference on a scratch canvas to
+        find the space left for the verse, then divides it by the fit engine's
+        line height at the medium (title) size and the average character width
+        of typical verse text.
+        
+        Returns:
+            Approximate character capacity. _fit_verse sets shorter verses
+            larger, up to the large size, and longer ones smaller, down to
+            VERSE_MIN_FONT_SIZE; only text that overflows even then is cut off.
+        """
+        layout = self._calculate_layout()
+        draw = _LayerRecorder(self._measure)
+        sample = {
+            'time': '12:59 PM',
+            'date': 'Wednesday, September 30, 2026',
+            'reference': '1 Thessalonians 12:59'
+        }
+        
+        start_y = self._draw_time_section(draw, sample, layout, layout['content_top'])
+        start_y = self._draw_reference(draw, sample, layout, start_y + self.spacing['after_time'])
+        start_y += self.spacing['after_reference']
+        available_height = layout['content_bottom'] - start_y - 100  # Reserve space for footer
+        
+        font, line_height = self._verse_metrics(self.font_files.get('verse'), self.font_sizes['medium'])
+        
+        sample_text = ("And God said, Let there be light: and there was light. "
+                       "The Lord is my shepherd; I shall not want.")
+        char_width = draw.textlength(sample_text, font=font) / len(sample_text)
+        
+        # Word wrapping leaves part of each line empty
+        chars_per_line = int(layout['content_width'] / char_width * 0.9)
+        return max(0, available_height // line_height) * chars_per_line
     
     def _calculate_layout(self) -> Dict[str, int]:
         """Calculate layout dimensions"""
@@ -136,12 +365,19 @@ class ImageGenerator:
     def _draw_time_section(self, draw: ImageDraw.Draw, verse_data: Dict[str, str], 
                           layout: Dict[str, int], start_y: int) -> int:
         """Draw time and date section"""
+        if verse_data.get('time', ''):
+            current_y = self._draw_time(draw, verse_data, layout, start_y)
+            return self._draw_date(draw, verse_data, layout, current_y)
+        
+        return start_y
+    
+    def _draw_time(self, draw: ImageDraw.Draw, verse_data: Dict[str, str], 
+                   layout: Dict[str, int], start_y: int) -> int:
+        """Draw time (large)"""
         time_text = verse_data.get('time', '')
-        date_text = verse_data.get('date', '')
         
         if time_text:
-            # Draw time (large)
-            font = self.font_cache.get('time_large', ImageFont.load_default())
+            font = self._get_font('time_large')
             time_bbox = draw.textbbox((0, 0), time_text, font=font)
             time_width = time_bbox[2] - time_bbox[0]
             time_height = time_bbox[3] - time_bbox[1]
@@ -149,21 +385,25 @@ class ImageGenerator:
             time_x = layout['content_left'] + (layout['content_width'] - time_width) // 2
             draw.text((time_x, start_y), time_text, font=font, fill=self.colors['text'])
             
-            current_y = start_y + time_height + 10
+            return start_y + time_height + 10
+        
+        return start_y
+    
+    def _draw_date(self, draw: ImageDraw.Draw, verse_data: Dict[str, str], 
+                   layout: Dict[str, int], start_y: int) -> int:
+        """Draw date (smaller)"""
+        date_text = verse_data.get('date', '')
+        
+        if date_text:
+            font = self._get_font('time_small')
+            date_bbox = draw.textbbox((0, 0), date_text, font=font)
+            date_width = date_bbox[2] - date_bbox[0]
+            date_height = date_bbox[3] - date_bbox[1]
             
-            # Draw date (smaller)
-            if date_text:
-                font = self.font_cache.get('time_small', ImageFont.load_default())
-                date_bbox = draw.textbbox((0, 0), date_text, font=font)
-                date_width = date_bbox[2] - date_bbox[0]
-                date_height = date_bbox[3] - date_bbox[1]
-                
-                date_x = layout['content_left'] + (layout['content_width'] - date_width) // 2
-                draw.text((date_x, current_y), date_text, font=font, fill=self.colors['text'])
-                
-                current_y += date_height
+            date_x = layout['content_left'] + (layout['content_width'] - date_width) // 2
+            draw.text((date_x, start_y), date_text, font=font, fill=self.colors['text'])
             
-            return current_y
+            return start_y + date_height
         
         return start_y
     
@@ -173,7 +413,7 @@ class ImageGenerator:
         reference = verse_data.get('reference', '')
         
         if reference:
-            font = self.font_cache.get('reference_medium', ImageFont.load_default())
+            font = self._get_font('reference_medium')
             ref_bbox = draw.textbbox((0, 0), reference, font=font)
             ref_width = ref_bbox[2] - ref_bbox[0]
             ref_height = ref_bbox[3] - ref_bbox[1]
@@ -193,48 +433,98 @@ class ImageGenerator:
         if not text:
             return start_y
         
-        font = self.font_cache.get('verse_medium', ImageFont.load_default())
-        
         # Calculate available space
         available_width = layout['content_width']
         available_height = layout['content_bottom'] - start_y - 100  # Reserve space for footer
         
-        # Wrap text
-        wrapped_lines = self._wrap_text(text, font, available_width)
-        
-        # Calculate line height
-        line_bbox = draw.textbbox((0, 0), "Ay", font=font)
-        line_height = line_bbox[3] - line_bbox[1] + 8  # Add line spacing
-        
-        # Check if text fits
+        # Largest font at which the wrapped text fits
+        font, wrapped_lines, line_height = self._fit_verse(text, available_width, available_height)
         total_text_height = len(wrapped_lines) * line_height
         
-        if total_text_height > available_height:
-            # Try smaller font
-            font = self.font_cache.get('verse_small', ImageFont.load_default())
-            wrapped_lines = self._wrap_text(text, font, available_width)
-            line_bbox = draw.textbbox((0, 0), "Ay", font=font)
-            line_height = line_bbox[3] - line_bbox[1] + 6
-            total_text_height = len(wrapped_lines) * line_height
-        
         # Center text vertically in available space
         text_start_y = start_y + (available_height - total_text_height) // 2
         
         # Draw each line
         current_y = text_start_y
-        for line in wrapped_lines:
-            if current_y + line_height > layout['content_bottom'] - 50:
-                break  # Don't overflow into footer area
-            
-            line_bbox = draw.textbbox((0, 0), line, font=font)
-            line_width = line_bbox[2] - line_bbox[0]
-            line_x = layout['content_left'] + (layout['content_width'] - line_width) // 2
+        for line, line_width in wrapped_lines:
+            line_x = layout['content_left'] + int(layout['content_width'] - line_width) // 2
             
             draw.text((line_x, current_y), line, font=font, fill=self.colors['text'])
             current_y += line_height
         
         return current_y
     
+    def _fit_verse(self, text: str, max_width: int,
+                   max_height: int) -> Tuple[ImageFont.ImageFont, List[Tuple[str, float]], int]:
+        """
+        Find the largest verse font size at which the wrapped text fits a box
+        
+        Binary-searches sizes from VERSE_MIN_FONT_SIZE to the large font size.
+        Results are cached per (text, box, font family), so a verse shown
+        again is not wrapped again.
+        
+        Returns:
+            (font, wrapped (line, width) pairs, line height). Text that does
+            not fit even at the smallest size is cut after the last line that
+            fits and ends with an ellipsis.
+        """
+        family = self.font_files.get('verse')
+        key = (text, max_width, max_height, family)
+        fit = self._fits.get(key)
+        if fit is not None:
+            return fit
+        
+        low, high = VERSE_MIN_FONT_SIZE, max(VERSE_MIN_FONT_SIZE, self.font_sizes['large'])
+        while low <= high:
+            size = (low + high) // 2
+            font, line_height = self._verse_metrics(family, size)
+            lines = self._wrap_lines(text, font, max_width)
+            
+            if (len(lines) * line_height <= max_height
+                    and all(width <= max_width for _, width in lines)):
+                fit = (font, lines, line_height)
+                low = size + 1
+            else:
+                high = size - 1
+        
+        if fit is None:
+            font, line_height = self._verse_metrics(family, VERSE_MIN_FONT_SIZE)
+            lines = self._wrap_lines(text, font, max_width)
+            visible = max(0, max_height // line_height)
+            self.logger.warning(f"Verse text too long for the display, "
+                                f"showing {visible} of {len(lines)} lines")
+            fit = (font, self._ellipsize(lines[:visible], font, max_width), line_height)
+        
+        self._fits.put(key, fit)
+        return fit
+    
+    def _verse_metrics(self, family: Optional[str], size: int) -> Tuple[ImageFont.ImageFont, int]:
+        """Verse font and line height at a size"""
+        font = self.fonts.get(family, size)
+        
+        key = (family, size)
+        line_height = self._line_heights.get(key)
+        if line_height is None:
+            line_bbox = self._measure.textbbox((0, 0), "Ay", font=font)
+            line_height = line_bbox[3] - line_bbox[1] + round(size * 0.22)  # Line spacing, 8 px at 36
+            self._line_heights[key] = line_height
+        
+        return font, line_height
+    
+    def _ellipsize(self, lines: List[Tuple[str, float]], font: ImageFont.ImageFont,
+                   max_width: int) -> List[Tuple[str, float]]:
+        """Mark the last of the lines as cut off"""
+        if not lines:
+            return lines
+        
+        words = lines[-1][0].split()
+        while True:
+            line = ' '.join(words + ['\u2026'])
+            width = self._measure.textlength(line, font=font)
+            if width <= max_width or len(words) <= 1:
+                return lines[:-1] + [(line, width)]
+            words.pop()
+    
     def _draw_footer(self, draw: ImageDraw.Draw, verse_data: Dict[str, str], 
                     layout: Dict[str, int]):
         """Draw footer with translation and source info"""
@@ -245,13 +535,13 @@ class ImageGenerator:
         source = verse_data.get('source', '')
         
         footer_text = translation
-        if source and source != 'api':
+        if source and source not in ('api', 'local'):
             footer_text += f" ({source})"
         
         if verse_data.get('is_special', False):
             footer_text += " ★"
         
-        font = self.font_cache.get('reference_small', ImageFont.load_default())
+        font = self._get_font('reference_small')
         footer_bbox = draw.textbbox((0, 0), footer_text, font=font)
         footer_width = footer_bbox[2] - footer_bbox[0]
         
@@ -271,40 +561,62 @@ class ImageGenerator:
     
     def _wrap_text(self, text: str, font: ImageFont.ImageFont, max_width: int) -> list:
         """Wrap text to fit within specified width"""
-        words = text.split()
+        return [line for line, _ in self._wrap_lines(text, font, max_width)]
+    
+    def _wrap_lines(self, text: str, font: ImageFont.ImageFont,
+                    max_width: int) -> List[Tuple[str, float]]:
+        """
+        Greedy line breaking in one pass over cached word widths
+        
+        Returns:
+            List of (line, width in pixels) pairs
+        """
+        space_width = self._word_width(' ', font)
         lines = []
         current_line = []
+        current_width = 0.0
         
-        for word in words:
-            # Test if adding this word would exceed width
-            test_line = ' '.join(current_line + [word])
-            bbox = ImageDraw.Draw(Image.new('RGB', (1, 1))).textbbox((0, 0), test_line, font=font)
-            test_width = bbox[2] - bbox[0]
+        for word in text.split():
+            word_width = self._word_width(word, font)
             
-            if test_width <= max_width:
+            if not current_line:
+                # A single word wider than the line still gets a line of its own
+                current_line, current_width = [word], word_width
+            elif current_width + space_width + word_width <= max_width:
                 current_line.append(word)
+                current_width += space_width + word_width
             else:
-                if current_line:
-                    lines.append(' '.join(current_line))
-                    current_line = [word]
-                else:
-                    # Single word is too long, force it
-                    lines.append(word)
+                lines.append((' '.join(current_line), current_width))
+                current_line, current_width = [word], word_width
         
         if current_line:
-            lines.append(' '.join(current_line))
+            lines.append((' '.join(current_line), current_width))
         
         return lines
     
+    def _word_width(self, word: str, font: ImageFont.ImageFont) -> float:
+        """Advance width of a word, measured once per font"""
+        # Fonts are keyed by file and size, so a font reopened at the same
+        # size shares its widths
+        key = (getattr(font, 'path', font), getattr(font, 'size', None), word)
+        width = self._word_widths.get(key)
+        if width is None:
+            width = self._measure.textlength(word, font=font)
+            self._word_widths.put(key, width)
+        return width
+    
     def generate_error_image(self, error_message: str = "Unable to load verse") -> Image.Image:
         """Generate error image when verse cannot be loaded"""
+        # The next verse frame replaces this one completely
+        self._last_frame = None
+        
         image = Image.new('L', (self.width, self.height), 255)  # 'L' mode for grayscale
         draw = ImageDraw.Draw(image)
         
         layout = self._calculate_layout()
         
         # Draw error message
-        font = self.font_cache.get('verse_medium', ImageFont.load_default())
+        font = self._get_font('verse_medium')
         
         # Center the error message
         error_bbox = draw.textbbox((0, 0), error_message, font=font)
@@ -322,7 +634,37 @@ class ImageGenerator:
         """Get information about loaded fonts"""
         return {
             'font_path': str(self.font_path),
-            'loaded_fonts': list(self.font_cache.keys()),
-            'font_cache_size': len(self.font_cache)
+            'font_files': dict(self.font_files),
+            'font_sizes': dict(self.font_sizes),
+            'registry': self.fonts.get_stats(),
+            'cached_word_widths': len(self._word_widths),
+            'verse_font_sizes': sorted(size for _, size in self._line_heights)
         }
+    
+    def get_render_stats(self) -> Dict[str, Any]:
+        """Get layer cache statistics"""
+        return {
+            'layers': list(LAYERS),
+            'layers_rendered': self.layers_rendered,
+            'layers_reused': self.layers_reused,
+            'fit_cache': self._fits.get_stats(),
+            'last_dirty_regions': self.last_dirty_regions
+        }
+
+
+def _merge_boxes(boxes: List[Box]) -> List[Box]:
+    """Merge overlapping boxes until none overlap"""
+    merged = []
+    for box in boxes:
+        while True:
+            for other in merged:
+                if box[0] < other[2] and other[0] < box[2] and box[1] < other[3] and other[1] < box[3]:
+                    merged.remove(other)
+                    box = (min(box[0], other[0]), min(box[1], other[1]),
+                           max(box[2], other[2]), max(box[3], other[3]))
+                    break
+            else:
+                break
+        merged.append(box)
+    return merged
 
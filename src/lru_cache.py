@@ -0,0 +1,87 @@
+"""
+Bounded LRU Cache
+
+This module provides a thread-safe LRU cache with optional per-entry TTL.
+Get, put and eviction are O(1), and hit/miss/expiration/eviction counters
+are kept so the cache can be sized from real usage.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+
+class LRUCache:
+    """Thread-safe LRU cache with TTL and usage metrics"""
+
+    def __init__(self, capacity: int = 100, ttl: float = 3600):
+        self.capacity = max(1, capacity)
+        self.ttl = ttl  # Seconds; 0 or less disables expiry
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+        # Metrics
+        self.hits = 0
+        self.misses = 0
+        self.expirations = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Get a value, refreshing its recency, or None if absent or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            expires_at, value = entry
+            if expires_at is not None and time.monotonic() >= expires_at:
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any):
+        """Insert or replace a value, evicting the least recently used entry if full"""
+        expires_at = time.monotonic() + self.ttl if self.ttl > 0 else None
+
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+            self._entries[key] = (expires_at, value)
+
+            if len(self._entries) > self.capacity:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and (entry[0] is None or time.monotonic() < entry[0])
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self):
+        """Remove all entries (metrics are kept)"""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics"""
+        lookups = self.hits + self.misses
+        return {
+            'size': len(self._entries),
+            'capacity': self.capacity,
+            'ttl': self.ttl,
+            'hits': self.hits,
+            'misses': self.misses,
+            'expirations': self.expirations,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / lookups if lookups > 0 else 0
+        }
@@ -0,0 +1,175 @@
+"""
+API Rate Limiter
+
+This module provides the token bucket that every outbound Bible API
+request draws from. The bucket refills at a sustained rate up to a burst
+size. Requests for the minute on screen take priority over background work
+(prefetch, cache warming): background callers leave a token in reserve and
+yield while a foreground caller is waiting. A 429 response blocks the whole
+bucket for the Retry-After period.
+"""
+
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Optional
+
+# Block used when a 429 response carries no usable Retry-After header
+DEFAULT_RETRY_AFTER = 30.0
+
+# Longest a background request waits for a token before giving up
+BACKGROUND_MAX_WAIT = 60.0
+
+
+class RateLimited(Exception):
+    """Raised when a request cannot get a token within its wait limit"""
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header
+
+    Args:
+        value: Header value, either delay seconds or an HTTP date
+
+    Returns:
+        Seconds to wait, or None if the header is missing or malformed
+    """
+    if not value:
+        return None
+
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class TokenBucket:
+    """Thread-safe token bucket with foreground priority and server-imposed blocks"""
+
+    def __init__(self, rate: float = 0.3, burst: int = 5):
+        """
+        Args:
+            rate: Sustained requests per second (0 disables the limit, but
+                Retry-After blocks are still honoured)
+            burst: Maximum requests that may be sent back to back
+        """
+        self.rate = max(0.0, rate)
+        self.burst = max(1, burst)
+        # Background callers leave this many tokens for the foreground
+        self.reserve = 1 if self.burst > 1 else 0
+
+        self.tokens = float(self.burst)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self._cond = threading.Condition()
+        self._foreground_waiting = 0
+
+        # Statistics
+        self.granted_foreground = 0
+        self.granted_background = 0
+        self.rejected = 0
+        self.throttled = 0
+        self.total_wait = 0.0
+
+    def acquire(self, foreground: bool = True, timeout: Optional[float] = None) -> bool:
+        """
+        Take a token, waiting for one if necessary
+
+        Args:
+            foreground: Whether this request is for the minute on screen
+            timeout: Longest to wait in seconds (None waits indefinitely)
+
+        Returns:
+            True if a token was taken, False if none would be available in time
+        """
+        with self._cond:
+            start = time.monotonic()
+            deadline = start + timeout if timeout is not None else None
+            if foreground:
+                self._foreground_waiting += 1
+
+            try:
+                while True:
+                    now = time.monotonic()
+                    self._refill(now)
+                    delay = self._delay(now, foreground)
+
+                    if delay <= 0:
+                        self.tokens -= 1
+                        self.total_wait += now - start
+                        if foreground:
+                            self.granted_foreground += 1
+                        else:
+                            self.granted_background += 1
+                        return True
+
+                    if deadline is not None and now + delay > deadline:
+                        self.rejected += 1
+                        return False
+
+                    self._cond.wait(delay)
+            finally:
+                if foreground:
+                    self._foreground_waiting -= 1
+                    self._cond.notify_all()
+
+    def throttle(self, retry_after: float):
+        """Block every request for retry_after seconds after a 429 response"""
+        with self._cond:
+            now = time.monotonic()
+            self._refill(now)
+            self.blocked_until = max(self.blocked_until, now + retry_after)
+            # Start refilling from empty once the block ends
+            self.tokens = 0.0
+            self.updated = self.blocked_until
+            self.throttled += 1
+            self._cond.notify_all()
+
+    def _refill(self, now: float):
+        """Add tokens earned since the last refill (lock must be held)"""
+        if now > self.updated:
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+
+    def _delay(self, now: float, foreground: bool) -> float:
+        """Seconds until this caller may take a token (lock must be held)"""
+        if now < self.blocked_until:
+            return self.blocked_until - now
+        if self.rate <= 0:
+            self.tokens = float(self.burst)
+            return 0.0
+
+        needed = 1.0
+        if not foreground:
+            needed += self.reserve
+            if self._foreground_waiting:
+                # Let the waiting foreground request go first
+                return max(needed - self.tokens, 1.0) / self.rate
+
+        return max(0.0, (needed - self.tokens) / self.rate)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get rate limiter statistics"""
+        with self._cond:
+            now = time.monotonic()
+            self._refill(now)
+            return {
+                'rate': self.rate,
+                'burst': self.burst,
+                'tokens': round(self.tokens, 2),
+                'blocked_for': round(max(0.0, self.blocked_until - now), 1),
+                'granted_foreground': self.granted_foreground,
+                'granted_background': self.granted_background,
+                'rejected': self.rejected,
+                'throttled': self.throttled,
+                'total_wait': round(self.total_wait, 2)
+            }
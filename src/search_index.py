@@ -0,0 +1,289 @@
+"""
+Verse Search Index
+
+This module provides an inverted full-text index over one translation in
+the local verse store. The index is built offline into a single
+memory-mapped file (<version>.sdx next to the store) holding a document
+table, a sorted term table and postings lists stored as flat arrays, so a
+query costs a binary search per term plus a walk over that term's
+postings. Results are ranked with BM25 and returned a page at a time.
+"""
+
+import heapq
+import logging
+import math
+import re
+import struct
+import sys
+import threading
+from array import array
+from collections import Counter, defaultdict
+from typing import Dict, Any, List, Tuple
+from canon import book_name
+from verse_store import (VerseStore, resolve_data_path, split_key, map_store_file, write_store_file,
+                         FILE_HEADER, STORE_FORMAT_VERSION)
+
+SEARCH_MAGIC = b'BCSX'
+SEARCH_HEADER = struct.Struct('<IIf')    # term count, posting count, average document length
+TERM_RECORD = struct.Struct('<II')       # term text offset, first posting
+
+# Sections after the headers, all little-endian:
+#   document keys (uint32) and lengths in tokens (uint16), one per verse
+#   term records, one per term plus an end marker, sorted by term bytes
+#   posting document numbers (uint32) and term frequencies (uint16)
+#   term text
+
+# BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase alphanumeric tokens"""
+    return _TOKEN_PATTERN.findall(text.lower().replace("'", '').replace('’', ''))
+
+
+class SearchIndex:
+    """Read-only memory-mapped inverted index for one translation"""
+
+    def __init__(self, store_dir: str, version: str):
+        self.store_dir = resolve_data_path(store_dir)
+        self.version = version.lower()
+        self.index_file = self.store_dir / f"{self.version}.sdx"
+        self.logger = logging.getLogger(__name__)
+
+        self._data = None
+        self._opened = False
+        self._open_lock = threading.Lock()
+
+    def _open(self) -> bool:
+        """Open and memory-map the index file on first use"""
+        if self._opened:
+            return self._data is not None
+
+        with self._open_lock:
+            if not self._opened:
+                self._map_index()
+                self._opened = True
+        return self._data is not None
+
+    def _map_index(self):
+        """Memory-map the index and locate its sections"""
+        if not self.index_file.exists():
+            self.logger.info(f"No search index for {self.version} in {self.store_dir}")
+            return False
+
+        try:
+            mapped = map_store_file(self.index_file, SEARCH_MAGIC)
+            if mapped is None:
+                self.logger.error(f"Unsupported search index: {self.index_file}")
+                return False
+
+            data, self.doc_count = mapped
+            self.term_count, self.posting_count, self.avg_length = SEARCH_HEADER.unpack_from(
+                data, FILE_HEADER.size
+            )
+            keys_offset = FILE_HEADER.size + SEARCH_HEADER.size
+            lengths_offset = keys_offset + self.doc_count * 4
+            self.terms_offset = lengths_offset + self.doc_count * 2
+            self.documents_offset = self.terms_offset + (self.term_count + 1) * TERM_RECORD.size
+            self.frequencies_offset = self.documents_offset + self.posting_count * 4
+            self.text_offset = self.frequencies_offset + self.posting_count * 2
+
+            # Per-document tables are small, so read them once
+            self.doc_keys = _read_array('I', data, keys_offset, self.doc_count)
+            avg_length = self.avg_length or 1.0
+            self.doc_norms = [BM25_K1 * (1 - BM25_B + BM25_B * length / avg_length)
+                              for length in _read_array('H', data, lengths_offset, self.doc_count)]
+            self._data = data
+
+            self.logger.info(f"Opened search index for {self.version} "
+                             f"({self.doc_count} verses, {self.term_count} terms)")
+            return True
+
+        except Exception as e:
+            self.logger.error(f"Error opening search index {self.index_file}: {e}")
+            return False
+
+    @property
+    def available(self) -> bool:
+        """Whether the index file exists and could be opened"""
+        return self._open()
+
+    def _term_at(self, number: int) -> Tuple[bytes, int, int]:
+        """Get a term's text and its postings range"""
+        record = self.terms_offset + number * TERM_RECORD.size
+        text_start, first = TERM_RECORD.unpack_from(self._data, record)
+        text_end, last = TERM_RECORD.unpack_from(self._data, record + TERM_RECORD.size)
+        start = self.text_offset + text_start
+        return self._data[start:self.text_offset + text_end], first, last
+
+    def _postings(self, term: str) -> Tuple[array, array]:
+        """Binary search the term table and return its document and frequency arrays"""
+        target = term.encode('utf-8')
+        lo, hi = 0, self.term_count
+
+        while lo < hi:
+            mid = (lo + hi) // 2
+            mid_term, first, last = self._term_at(mid)
+            if mid_term < target:
+                lo = mid + 1
+            elif mid_term > target:
+                hi = mid
+            else:
+                return (_read_array('I', self._data, self.documents_offset + first * 4, last - first),
+                        _read_array('H', self._data, self.frequencies_offset + first * 2, last - first))
+
+        return array('I'), array('H')
+
+    def search(self, query: str, page: int = 1, per_page: int = 20) -> Dict[str, Any]:
+        """
+        Find verses containing every query term, ranked by BM25
+
+        Args:
+            query: Free-text query
+            page: 1-based page number
+            per_page: Results per page
+
+        Returns:
+            Dict with the total match count and one page of results, each
+            holding the reference, book, chapter, verse and score
+        """
+        results = {'query': query, 'page': page, 'per_page': per_page, 'total': 0, 'results': []}
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms or not self._open():
+            return results
+
+        # Rarest term first keeps the candidate set small
+        postings = sorted((self._postings(term) for term in terms), key=lambda p: len(p[0]))
+        if not postings[0][0]:
+            return results
+
+        norms = self.doc_norms
+        scores = None
+        for documents, frequencies in postings:
+            idf = math.log(1 + (self.doc_count - len(documents) + 0.5) / (len(documents) + 0.5))
+            weight = idf * (BM25_K1 + 1)
+            term_scores = {}
+            for document, frequency in zip(documents, frequencies):
+                if scores is None or document in scores:
+                    term_scores[document] = weight * frequency / (frequency + norms[document])
+
+            if scores is None:
+                scores = term_scores
+            else:
+                scores = {document: scores[document] + score for document, score in term_scores.items()}
+            if not scores:
+                return results
+
+        # Highest score first, canonical order among ties
+        start = (max(1, page) - 1) * per_page
+        ranked = heapq.nsmallest(start + per_page, scores.items(), key=lambda item: (-item[1], item[0]))
+        results['total'] = len(scores)
+
+        for document, score in ranked[start:]:
+            book, chapter, verse = split_key(self.doc_keys[document])
+            results['results'].append({
+                'reference': f"{book_name(book)} {chapter}:{verse}",
+                'book': book_name(book),
+                'chapter': chapter,
+                'verse': verse,
+                'score': round(score, 4)
+            })
+
+        return results
+
+    def close(self):
+        """Release the memory map"""
+        with self._open_lock:
+            if self._data is not None:
+                self._data.close()
+            self._data = None
+            self._opened = False
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get index statistics"""
+        available = self.available
+        return {
+            'version': self.version,
+            'path': str(self.index_file),
+            'available': available,
+            'verses': self.doc_count if available else 0,
+            'terms': self.term_count if available else 0
+        }
+
+
+def _read_array(typecode: str, data, offset: int, count: int) -> array:
+    """Copy a little-endian array of fixed-size integers out of the index"""
+    values = array(typecode)
+    values.frombytes(data[offset:offset + count * values.itemsize])
+    if sys.byteorder == 'big':
+        values.byteswap()
+    return values
+
+
+def _pack_array(typecode: str, values) -> bytes:
+    """Serialize integers as a little-endian array"""
+    packed = array(typecode, values)
+    if sys.byteorder == 'big':
+        packed.byteswap()
+    return packed.tobytes()
+
+
+def build_search_index(store_dir: str, version: str) -> Tuple[int, int]:
+    """
+    Build the search index for a translation in the local verse store
+
+    Args:
+        store_dir: Verse store directory (the index is written next to it)
+        version: Translation identifier (e.g., "kjv")
+
+    Returns:
+        Tuple of (verses indexed, distinct terms)
+    """
+    target = resolve_data_path(store_dir)
+    version = version.lower()
+
+    documents = []
+    index = defaultdict(list)
+    total_length = 0
+
+    store = VerseStore(str(target), version)
+    for key, text in store.iter_verses(version):
+        tokens = tokenize(text)
+        number = len(documents)
+        documents.append((key, min(len(tokens), 0xFFFF)))
+        total_length += len(tokens)
+        for term, frequency in Counter(tokens).items():
+            index[term].append((number, min(frequency, 0xFFFF)))
+    store.close()
+
+    terms = sorted(index, key=lambda term: term.encode('utf-8'))
+    term_records = []
+    posting_documents = []
+    posting_frequencies = []
+    text_blob = bytearray()
+    for term in terms:
+        term_records.append(TERM_RECORD.pack(len(text_blob), len(posting_documents)))
+        text_blob += term.encode('utf-8')
+        for document, frequency in index[term]:
+            posting_documents.append(document)
+            posting_frequencies.append(frequency)
+    term_records.append(TERM_RECORD.pack(len(text_blob), len(posting_documents)))
+
+    avg_length = total_length / len(documents) if documents else 0.0
+
+    write_store_file(target / f"{version}.sdx", [
+        FILE_HEADER.pack(SEARCH_MAGIC, STORE_FORMAT_VERSION, 0, len(documents)),
+        SEARCH_HEADER.pack(len(terms), len(posting_documents), avg_length),
+        _pack_array('I', (key for key, _ in documents)),
+        _pack_array('H', (length for _, length in documents)),
+        b''.join(term_records),
+        _pack_array('I', posting_documents),
+        _pack_array('H', posting_frequencies),
+        bytes(text_blob)
+    ])
+
+    return len(documents), len(terms)
@@ -0,0 +1,263 @@
+"""
+Time Rules
+
+This module loads the verse selection rules (special minutes, time-of-day
+book preferences with weights, and date overrides) from a JSON or YAML file
+and compiles them into a flat table of 1440 minute slots. Each slot holds
+the special books and a weighted alias-method sampler over the preferred
+books that contain that minute's chapter:verse, so per-minute selection is
+a table index plus one O(1) draw however many rules there are.
+"""
+
+import copy
+import hashlib
+import json
+import logging
+import random
+from datetime import date
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
+from canon import book_number, canonical_book, verse_exists
+from verse_store import resolve_data_path
+
+MINUTES_PER_DAY = 1440
+
+# Rules used when no rule file is available
+DEFAULT_RULES = {
+    'special_times': [
+        {'time': '3:16', 'books': ['John']},                  # 3:16 - most famous verse
+        {'time': '1:01', 'books': ['Genesis', 'John']},       # 1:1 - In the beginning
+        {'time': '12:00', 'books': ['Ecclesiastes']},         # 12:00 - Remember your Creator
+        {'time': '6:00', 'books': ['Psalm']},                 # 6:00 AM - Morning prayer
+        {'time': '21:00', 'books': ['Psalm']}                 # 9:00 PM - Evening prayer
+    ],
+    'day_parts': [
+        {'name': 'morning', 'start': '05:00', 'end': '12:00',
+         'books': ['Psalm', 'Proverbs', 'Ecclesiastes']},
+        {'name': 'afternoon', 'start': '12:00', 'end': '17:00',
+         'books': ['Matthew', 'Mark', 'Luke', 'John']},
+        {'name': 'evening', 'start': '17:00', 'end': '21:00',
+         'books': ['Psalm', 'Romans', 'Ephesians']},
+        {'name': 'night', 'start': '21:00', 'end': '05:00',
+         'books': ['Psalm', '1 Peter', 'Philippians']}
+    ],
+    'overrides': []
+}
+
+
+class AliasSampler:
+    """Walker/Vose alias table for O(1) weighted sampling"""
+
+    def __init__(self, items: Sequence[Any], weights: Sequence[float]):
+        self.items = tuple(items)
+        count = len(self.items)
+        total = float(sum(weights))
+        scaled = [weight * count / total for weight in weights]
+
+        self.probability = [1.0] * count
+        self.alias = list(range(count))
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+
+        while small and large:
+            less, more = small.pop(), large.pop()
+            self.probability[less] = scaled[less]
+            self.alias[less] = more
+            scaled[more] -= 1.0 - scaled[less]
+            (small if scaled[more] < 1.0 else large).append(more)
+
+    def sample(self, rng: random.Random) -> Any:
+        """Draw one item in proportion to its weight"""
+        column = int(rng.random() * len(self.items))
+        if rng.random() < self.probability[column]:
+            return self.items[column]
+        return self.items[self.alias[column]]
+
+
+class TimeSlot(NamedTuple):
+    """Compiled rules for one minute of the day"""
+    special: Tuple[str, ...]           # Special-time books, in listed order
+    preferred: Tuple[str, ...]         # Time-of-day books containing this chapter:verse
+    sampler: Optional[AliasSampler]    # Weighted draw over preferred
+    day_part: Optional[str]            # Name of the matching day part
+
+
+def load_rules(path: str) -> Dict[str, Any]:
+    """
+    Read a rule file
+
+    Args:
+        path: JSON file, or YAML file (.yaml/.yml, requires PyYAML)
+
+    Returns:
+        Rule dict with special_times, day_parts and overrides
+    """
+    rule_file = resolve_data_path(path)
+    with open(rule_file, 'r', encoding='utf-8') as f:
+        if rule_file.suffix.lower() in ('.yaml', '.yml'):
+            try:
+                import yaml
+            except ImportError:
+                raise ValueError("PyYAML is required for YAML rule files (pip install PyYAML)")
+            return yaml.safe_load(f) or {}
+        return json.load(f)
+
+
+def _parse_time(value: str) -> Tuple[int, int]:
+    """Parse "H:MM" into (hour, minute)"""
+    hour, minute = (int(part) for part in str(value).split(':'))
+    if not (0 <= hour <= 24 and 0 <= minute <= 59):
+        raise ValueError(f"Invalid time: {value}")
+    return hour, minute
+
+
+def _special_slots(value: str) -> List[int]:
+    """
+    Slots a special time applies to
+
+    Hours 1-12 name a clock-face time and match both AM and PM; hours 0
+    and 13-23 match only that 24-hour minute.
+    """
+    hour, minute = _parse_time(value)
+    if 1 <= hour <= 12:
+        hours = (hour % 12, hour % 12 + 12)
+    else:
+        hours = (hour % 24,)
+    return [h * 60 + minute for h in hours]
+
+
+def _parse_books(books: Any) -> List[Tuple[str, float]]:
+    """Normalize a book list or {book: weight} mapping to canonical (book, weight) pairs"""
+    pairs = books.items() if isinstance(books, dict) else ((book, 1) for book in books or [])
+
+    parsed = []
+    for book, weight in pairs:
+        name = canonical_book(str(book))
+        if name is None:
+            raise ValueError(f"Unknown book: {book}")
+        if float(weight) <= 0:
+            raise ValueError(f"Weight for {book} must be positive")
+        parsed.append((name, float(weight)))
+    return parsed
+
+
+def _date_matches(pattern: str, day: date) -> bool:
+    """Match "MM-DD" (every year) or "YYYY-MM-DD" against a date"""
+    pattern = str(pattern)
+    if len(pattern) == 5:
+        return pattern == day.strftime('%m-%d')
+    return pattern == day.isoformat()
+
+
+class TimeRules:
+    """Compiled per-minute selection rules"""
+
+    def __init__(self, rules: Optional[Dict[str, Any]] = None, source: str = "defaults"):
+        self.rules = rules if rules is not None else copy.deepcopy(DEFAULT_RULES)
+        self.source = source
+        self._samplers = {}  # (books, weights) -> shared AliasSampler
+
+        self.fingerprint = hashlib.sha1(
+            json.dumps(self.rules, sort_keys=True).encode('utf-8')
+        ).hexdigest()[:12]
+
+        special = self.rules.get('special_times', [])
+        day_parts = self.rules.get('day_parts', [])
+        self.table = self._compile(special, day_parts)
+
+        # Each override is compiled ahead of its base rules
+        self.overrides = []
+        for override in self.rules.get('overrides', []):
+            dates = override.get('dates') or [override['date']]
+            table = self._compile(override.get('special_times', []) + special,
+                                  override.get('day_parts', []) + day_parts)
+            self.overrides.append((tuple(str(d) for d in dates), override.get('name', ''), table))
+
+    @classmethod
+    def from_file(cls, path: Optional[str]) -> 'TimeRules':
+        """Load and compile a rule file, falling back to the built-in rules"""
+        logger = logging.getLogger(__name__)
+        if path and resolve_data_path(path).exists():
+            try:
+                return cls(load_rules(path), source=str(resolve_data_path(path)))
+            except Exception as e:
+                logger.error(f"Invalid time rule file {path}, using built-in rules: {e}")
+        elif path:
+            logger.info(f"No time rule file at {path}, using built-in rules")
+        return cls()
+
+    def _compile(self, special_times: List[Dict[str, Any]],
+                 day_parts: List[Dict[str, Any]]) -> Tuple[TimeSlot, ...]:
+        """Build the 1440-slot table from special times and day parts"""
+        special = {}
+        for rule in special_times:
+            books = tuple(book for book, _ in _parse_books(rule.get('books')))
+            for slot in _special_slots(rule['time']):
+                # First rule listed for a minute wins
+                special.setdefault(slot, books)
+
+        # First day part covering a minute wins; parts may wrap past midnight
+        part_for_slot = [None] * MINUTES_PER_DAY
+        for part in day_parts:
+            start = _parse_time(part['start'])
+            end = _parse_time(part['end'])
+            start, end = start[0] * 60 + start[1], end[0] * 60 + end[1]
+            books = _parse_books(part.get('books'))
+            for slot in range(MINUTES_PER_DAY):
+                covered = start <= slot < end if start < end else (slot >= start or slot < end)
+                if covered and part_for_slot[slot] is None:
+                    part_for_slot[slot] = (part.get('name'), books)
+
+        table = []
+        for slot in range(MINUTES_PER_DAY):
+            hour, minute = divmod(slot, 60)
+            chapter = hour % 12 or 12
+            name, books = part_for_slot[slot] or (None, [])
+
+            existing = [(book, weight) for book, weight in books
+                        if verse_exists(book_number(book), chapter, minute)]
+            special_books = tuple(book for book in special.get(slot, ())
+                                  if verse_exists(book_number(book), chapter, minute))
+
+            table.append(TimeSlot(special_books, tuple(book for book, _ in existing),
+                                  self._sampler(existing), name))
+
+        return tuple(table)
+
+    def _sampler(self, books: List[Tuple[str, float]]) -> Optional[AliasSampler]:
+        """Share one sampler between slots with the same weighted books"""
+        if not books:
+            return None
+
+        key = tuple(books)
+        if key not in self._samplers:
+            self._samplers[key] = AliasSampler([book for book, _ in books],
+                                               [weight for _, weight in books])
+        return self._samplers[key]
+
+    def slot(self, hour: int, minute: int, day: Optional[date] = None) -> TimeSlot:
+        """Get the compiled rules for a minute, applying any date override"""
+        table = self.table
+        if day is not None:
+            for dates, _, override_table in self.overrides:
+                if any(_date_matches(pattern, day) for pattern in dates):
+                    table = override_table
+                    break
+        return table[hour * 60 + minute]
+
+    def override_name(self, day: date) -> Optional[str]:
+        """Name of the override in effect on a date, if any"""
+        for dates, name, _ in self.overrides:
+            if any(_date_matches(pattern, day) for pattern in dates):
+                return name or dates[0]
+        return None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get rule statistics"""
+        return {
+            'source': self.source,
+            'fingerprint': self.fingerprint,
+            'special_times': len(self.rules.get('special_times', [])),
+            'day_parts': len(self.rules.get('day_parts', [])),
+            'overrides': len(self.overrides),
+            'samplers': len(self._samplers)
+        }
@@ -0,0 +1,292 @@
+"""
+Persistent Verse Cache
+
+This module provides an on-disk verse cache backed by SQLite in WAL mode.
+Scripture text is immutable, so entries never expire. References known not
+to exist are recorded in a negative cache in the same database. The
+database is opened lazily and can be shared between the clock service and
+the web backend.
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from typing import Optional, Dict, Any
+from verse_store import resolve_data_path
+
+
+def _text_length(verse_data: Dict[str, Any]) -> Optional[int]:
+    """Length of a verse's text in characters, or None if it has none"""
+    text = verse_data.get('text')
+    return len(text) if text else None
+
+
+class PersistentVerseCache:
+    """SQLite-backed verse cache keyed by translation and reference"""
+
+    def __init__(self, cache_path: str = "data/cache/verses.db", negative_ttl: float = 2592000):
+        self.cache_path = resolve_data_path(cache_path)
+        self.negative_ttl = negative_ttl  # Seconds; 0 or less keeps misses forever
+        self.logger = logging.getLogger(__name__)
+
+        self._conn = None
+        self._disabled = False
+        self._lock = threading.Lock()
+
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.negative_hits = 0
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        """Open the database on first use"""
+        if self._conn is not None or self._disabled:
+            return self._conn
+
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.cache_path), timeout=5, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS verses ("
+                " translation TEXT NOT NULL,"
+                " reference TEXT NOT NULL,"
+                " data TEXT NOT NULL,"
+                " fetched_at REAL NOT NULL,"
+                " text_length INTEGER,"
+                " PRIMARY KEY (translation, reference)"
+                ") WITHOUT ROWID"
+            )
+            columns = [row[1] for row in conn.execute("PRAGMA table_info(verses)")]
+            if 'text_length' not in columns:
+                # Caches written before lengths were stored; old rows read as NULL
+                conn.execute("ALTER TABLE verses ADD COLUMN text_length INTEGER")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS missing ("
+                " translation TEXT NOT NULL,"
+                " reference TEXT NOT NULL,"
+                " recorded_at REAL NOT NULL,"
+                " PRIMARY KEY (translation, reference)"
+                ") WITHOUT ROWID"
+            )
+            conn.commit()
+            self._conn = conn
+            self.logger.info(f"Opened persistent verse cache: {self.cache_path}")
+
+        except Exception as e:
+            self.logger.error(f"Persistent verse cache unavailable ({self.cache_path}): {e}")
+            self._disabled = True
+
+        return self._conn
+
+    def get(self, translation: str, reference: str) -> Optional[Dict[str, Any]]:
+        """Get cached verse data or None"""
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return None
+
+            try:
+                row = conn.execute(
+                    "SELECT data FROM verses WHERE translation = ? AND reference = ?",
+                    (translation.lower(), reference)
+                ).fetchone()
+            except sqlite3.Error as e:
+                self.logger.warning(f"Persistent cache read failed for {reference}: {e}")
+                return None
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            return json.loads(row[0])
+
+    def contains(self, translation: str, reference: str) -> bool:
+        """Check whether a verse is cached without counting a lookup"""
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return False
+
+            try:
+                return conn.execute(
+                    "SELECT 1 FROM verses WHERE translation = ? AND reference = ?",
+                    (translation.lower(), reference)
+                ).fetchone() is not None
+            except sqlite3.Error as e:
+                self.logger.warning(f"Persistent cache read failed for {reference}: {e}")
+                return False
+
+    def get_length(self, translation: str, reference: str) -> Optional[int]:
+        """Get a cached verse's text length in characters, or None if it is not cached"""
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return None
+
+            try:
+                row = conn.execute(
+                    "SELECT text_length, data FROM verses WHERE translation = ? AND reference = ?",
+                    (translation.lower(), reference)
+                ).fetchone()
+            except sqlite3.Error as e:
+                self.logger.warning(f"Persistent cache read failed for {reference}: {e}")
+                return None
+
+        if row is None:
+            return None
+        if row[0] is not None:
+            return row[0]
+        return _text_length(json.loads(row[1]))
+
+    def put(self, translation: str, reference: str, verse_data: Dict[str, Any]):
+        """Store verse data"""
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return
+
+            try:
+                conn.execute(
+                    "INSERT OR REPLACE INTO verses (translation, reference, data, fetched_at, text_length) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (translation.lower(), reference, json.dumps(verse_data), time.time(),
+                     _text_length(verse_data))
+                )
+                conn.commit()
+                self.writes += 1
+            except sqlite3.Error as e:
+                self.logger.warning(f"Persistent cache write failed for {reference}: {e}")
+
+    def put_many(self, translation: str, entries: Dict[str, Dict[str, Any]]) -> bool:
+        """
+        Store several verses in a single transaction
+
+        Returns:
+            True if the entries were stored (or there were none), False if the
+            cache is unavailable or the write failed
+        """
+        if not entries:
+            return True
+
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return False
+
+            now = time.time()
+            try:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO verses (translation, reference, data, fetched_at, text_length) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    [(translation.lower(), reference, json.dumps(verse_data), now, _text_length(verse_data))
+                     for reference, verse_data in entries.items()]
+                )
+                conn.commit()
+                self.writes += len(entries)
+                return True
+            except sqlite3.Error as e:
+                self.logger.warning(f"Persistent cache bulk write failed: {e}")
+                return False
+
+    def is_missing(self, translation: str, reference: str) -> bool:
+        """Check whether a reference is recorded as not existing"""
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return False
+
+            try:
+                row = conn.execute(
+                    "SELECT recorded_at FROM missing WHERE translation = ? AND reference = ?",
+                    (translation.lower(), reference)
+                ).fetchone()
+            except sqlite3.Error as e:
+                self.logger.warning(f"Negative cache read failed for {reference}: {e}")
+                return False
+
+            if row is None:
+                return False
+
+            if self.negative_ttl > 0 and time.time() - row[0] > self.negative_ttl:
+                return False
+
+            self.negative_hits += 1
+            return True
+
+    def mark_missing(self, translation: str, reference: str):
+        """Record that a reference does not exist"""
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return
+
+            try:
+                conn.execute(
+                    "INSERT OR REPLACE INTO missing (translation, reference, recorded_at) "
+                    "VALUES (?, ?, ?)",
+                    (translation.lower(), reference, time.time())
+                )
+                conn.commit()
+            except sqlite3.Error as e:
+                self.logger.warning(f"Negative cache write failed for {reference}: {e}")
+
+    def count_missing(self) -> int:
+        """Count references recorded as not existing"""
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return 0
+
+            try:
+                return conn.execute("SELECT COUNT(*) FROM missing").fetchone()[0]
+            except sqlite3.Error as e:
+                self.logger.warning(f"Negative cache count failed: {e}")
+                return 0
+
+    def count(self, translation: Optional[str] = None) -> int:
+        """Count cached verses, optionally for a single translation"""
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return 0
+
+            try:
+                if translation:
+                    row = conn.execute(
+                        "SELECT COUNT(*) FROM verses WHERE translation = ?",
+                        (translation.lower(),)
+                    ).fetchone()
+                else:
+                    row = conn.execute("SELECT COUNT(*) FROM verses").fetchone()
+                return row[0]
+            except sqlite3.Error as e:
+                self.logger.warning(f"Persistent cache count failed: {e}")
+                return 0
+
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics"""
+        lookups = self.hits + self.misses
+        return {
+            'path': str(self.cache_path),
+            'enabled': not self._disabled,
+            'entries': self.count(),
+            'hits': self.hits,
+            'misses': self.misses,
+            'writes': self.writes,
+            'missing_entries': self.count_missing(),
+            'negative_hits': self.negative_hits,
+            'hit_rate': self.hits / lookups if lookups > 0 else 0
+        }
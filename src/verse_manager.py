@@ -7,71 +7,170 @@ and verse formatting for display.
 
 import logging
 import random
-from datetime import datetime, time
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
 from typing import Optional, Dict, Any, List, Tuple
 from bible_api import BibleAPI
+from canon import books_for_time
+from day_planner import DayPlanner, PlanEntry
+from time_rules import TimeRules
 
 class VerseManager:
     """Enhanced verse manager with intelligent verse selection"""
     
-    def __init__(self, bible_api: BibleAPI):
+    def __init__(self, bible_api: BibleAPI, plan_dir: Optional[str] = None, fleet_seed: str = "",
+                 text_capacity: Optional[int] = None, rules_path: Optional[str] = None):
         self.bible_api = bible_api
         self.logger = logging.getLogger(__name__)
         
-        # Special time mappings for significant verses
-        self.special_times = {
-            (3, 16): ["John"],  # 3:16 - most famous verse
-            (23, 1): ["Psalm"],  # 23:1 - The Lord is my shepherd
-            (1, 1): ["Genesis", "John"],  # 1:1 - In the beginning
-            (12, 0): ["Ecclesiastes"],  # 12:00 - Remember your Creator
-            (6, 0): ["Psalm"],  # 6:00 AM - Morning prayer
-            (21, 0): ["Psalm"],  # 9:00 PM - Evening prayer
-        }
+        # Characters that fit the panel at the primary font; longer verses are
+        # tried after ones that fit
+        self.text_capacity = text_capacity
+        self._fits = {}  # (version, book, chapter, verse) -> fits at the primary font, once known
         
-        # Book preferences for different times of day
-        self.time_preferences = {
-            'morning': ["Psalm", "Proverbs", "Ecclesiastes"],
-            'afternoon': ["Matthew", "Mark", "Luke", "John"],
-            'evening': ["Psalm", "Romans", "Ephesians"],
-            'night': ["Psalm", "1 Peter", "Philippians"]
-        }
+        # Special times and time-of-day book preferences, compiled per minute
+        self.time_rules = TimeRules.from_file(rules_path)
+        
+        # Seeded day plan; without one, selection is shuffled live each minute
+        self.day_planner = None
+        if plan_dir:
+            self.day_planner = DayPlanner(self.plan_minute, plan_dir=plan_dir,
+                                          fleet_seed=fleet_seed, rules=self._rules_fingerprint())
     
     def get_verse_for_current_time(self) -> Optional[Dict[str, Any]]:
         """Get verse for current time"""
         now = datetime.now()
-        return self.get_verse_for_time(now.hour, now.minute)
+        return self.get_verse_for_time(now.hour, now.minute, now.date())
     
-    def get_verse_for_time(self, hour: int, minute: int) -> Optional[Dict[str, Any]]:
+    def get_verse_for_time(self, hour: int, minute: int, day: Optional[date] = None,
+                           foreground: bool = True) -> Optional[Dict[str, Any]]:
         """
         Get verse for specific time with intelligent selection
         
         Args:
             hour: Hour (0-23)
             minute: Minute (0-59)
+            day: Date whose plan to use (default: today)
+            foreground: Whether the verse is needed now rather than prefetched;
+                foreground lookups get API rate limit priority
             
         Returns:
             Dict containing verse data or None if not found
         """
         self.logger.info(f"Getting verse for {hour:02d}:{minute:02d}")
         
-        # Convert to 12-hour format for verse matching
-        display_hour = self._convert_to_12_hour(hour)
+        # Each update gets a fresh API retry budget
+        self.bible_api.begin_update(foreground)
         
-        # Check for special time mappings first
-        verse_data = self._get_special_verse(display_hour, minute)
-        if verse_data:
-            return verse_data
+        candidates, special = self._get_plan_entry(hour, minute, day)
         
-        # Get time-appropriate books
-        preferred_books = self._get_time_appropriate_books(hour)
+        # Special-time verses are resolved on their own first, so they get a
+        # full probe window; then time-of-day books, then every match, each
+        # strictly in planned order so every clock shows the same verse
+        if special:
+            verse_data = self.bible_api.get_first_verse(candidates[:special])
+            if verse_data:
+                self.logger.info(f"Found special verse: {verse_data.get('reference')}")
+                return dict(verse_data, special=True)
         
-        # Try to find verse with preferred books first
-        verse_data = self._find_verse_with_books(display_hour, minute, preferred_books)
+        verse_data = self.bible_api.get_first_verse(candidates[special:])
         if verse_data:
             return verse_data
         
-        # Fall back to any available verse
-        return self.bible_api.get_random_verse_for_time(hour, minute)
+        return self.bible_api.get_fallback_verse_for_time(hour, minute)
+    
+    def _get_plan_entry(self, hour: int, minute: int, day: Optional[date]) -> PlanEntry:
+        """Read a minute's candidates from the day plan, or select them live"""
+        if self.day_planner:
+            try:
+                when = datetime.combine(day or date.today(), datetime.min.time())
+                return self.day_planner.get_entry(when.replace(hour=hour, minute=minute))
+            except Exception as e:
+                self.logger.warning(f"Day plan unavailable, selecting live: {e}")
+        
+        return self.plan_minute(hour, minute, day=day)
+    
+    def plan_minute(self, hour: int, minute: int, rng: Optional[random.Random] = None,
+                    day: Optional[date] = None) -> PlanEntry:
+        """
+        Select the candidate verses for one minute
+        
+        Args:
+            hour: Hour (0-23)
+            minute: Minute (0-59)
+            rng: Random generator to draw with (default: the module's)
+            day: Date, for rule overrides (default: today)
+            
+        Returns:
+            Tuple of (candidates in preference order, number of special candidates)
+        """
+        rng = rng or random
+        
+        # Convert to 12-hour format for verse matching
+        display_hour = self._convert_to_12_hour(hour)
+        
+        # Special books keep their listed order; a weighted draw picks the
+        # leading time-of-day book and the rest follow in random order
+        slot = self.time_rules.slot(hour, minute, day or date.today())
+        special = list(slot.special)
+        preferred = list(slot.preferred)
+        if slot.sampler:
+            lead = slot.sampler.sample(rng)
+            preferred.remove(lead)
+            rng.shuffle(preferred)
+            preferred.insert(0, lead)
+        
+        # Every book with this chapter:verse, or with the closest verse if none has it
+        books, verse = self._nearest_books(display_hour, minute)
+        rng.shuffle(books)
+        
+        candidates = [(book, display_hour, minute) for book in special]
+        others = [(book, display_hour, minute) for book in preferred]
+        others += [(book, display_hour, verse) for book in books]
+        candidates += self._prefer_fitting(others)
+        return tuple(dict.fromkeys(candidates)), len(special)
+    
+    def _prefer_fitting(self, candidates: List[Tuple[str, int, int]]) -> List[Tuple[str, int, int]]:
+        """Move verses known to overflow the primary font behind the rest, keeping order"""
+        if not self.text_capacity:
+            return candidates
+        
+        return sorted(candidates, key=lambda candidate: not self._fits_primary_font(*candidate))
+    
+    def _fits_primary_font(self, book: str, chapter: int, verse: int) -> bool:
+        """Whether a verse fits at the primary font (unknown lengths count as fitting)"""
+        key = (self.bible_api.version, book, chapter, verse)
+        fits = self._fits.get(key)
+        if fits is None:
+            length = self.bible_api.get_text_length(book, chapter, verse)
+            if length is None:
+                # Not held locally yet; judge it again once its text arrives
+                return True
+            fits = self._fits[key] = length <= self.text_capacity
+        return fits
+    
+    def _nearest_books(self, chapter: int, verse: int) -> Tuple[List[str], int]:
+        """Books containing chapter:verse, walking outwards to the closest verse that exists"""
+        books = books_for_time(chapter, verse)
+        distance = 0
+        while not books and distance < 59:
+            distance += 1
+            for try_verse in (verse - distance, verse + distance):
+                books = books_for_time(chapter, try_verse)
+                if books:
+                    return list(books), try_verse
+        return list(books), verse
+    
+    def prepare_day_plan(self, now: Optional[datetime] = None):
+        """Build today's and tomorrow's plans ahead of use"""
+        if self.day_planner:
+            self.day_planner.ensure(now)
+    
+    def _rules_fingerprint(self) -> str:
+        """Hash of the selection rules, so persisted plans follow rule changes"""
+        return f"{self.time_rules.fingerprint}:{self.text_capacity or 0}"
     
     def _convert_to_12_hour(self, hour: int) -> int:
         """Convert 24-hour to 12-hour format"""
@@ -82,50 +181,6 @@ class VerseManager:
         else:
             return hour - 12
     
-    def _get_special_verse(self, chapter: int, verse: int) -> Optional[Dict[str, Any]]:
-        """Get special verse for significant times"""
-        time_key = (chapter, verse)
-        
-        if time_key in self.special_times:
-            preferred_books = self.special_times[time_key]
-            
-            for book in preferred_books:
-                verse_data = self.bible_api.get_verse(book, chapter, verse)
-                if verse_data:
-                    verse_data['special'] = True
-                    self.logger.info(f"Found special verse: {book} {chapter}:{verse}")
-                    return verse_data
-        
-        return None
-    
-    def _get_time_appropriate_books(self, hour: int) -> List[str]:
-        """Get books appropriate for time of day"""
-        if 5 <= hour < 12:
-            time_period = 'morning'
-        elif 12 <= hour < 17:
-            time_period = 'afternoon'
-        elif 17 <= hour < 21:
-            time_period = 'evening'
-        else:
-            time_period = 'night'
-        
-        return self.time_preferences.get(time_period, [])
-    
-    def _find_verse_with_books(self, chapter: int, verse: int, 
-                              preferred_books: List[str]) -> Optional[Dict[str, Any]]:
-        """Find verse using preferred books"""
-        # Shuffle to add randomness
-        books_to_try = preferred_books.copy()
-        random.shuffle(books_to_try)
-        
-        for book in books_to_try:
-            verse_data = self.bible_api.get_verse(book, chapter, verse)
-            if verse_data and verse_data.get('text'):
-                self.logger.debug(f"Found verse with preferred book: {book} {chapter}:{verse}")
-                return verse_data
-        
-        return None
-    
     def format_verse_for_display(self, verse_data: Dict[str, Any], 
                                 current_time: Optional[datetime] = None) -> Dict[str, str]:
         """
@@ -188,8 +243,14 @@ class VerseManager:
         
         return {
             'cache_stats': cache_stats,
-            'special_times_count': len(self.special_times),
-            'time_preferences_count': len(self.time_preferences)
+            'cache_hits': cache_stats['memory_cache']['hits'],
+            'cache_misses': cache_stats['memory_cache']['misses'],
+            'cache_expirations': cache_stats['memory_cache']['expirations'],
+            'cache_evictions': cache_stats['memory_cache']['evictions'],
+            'cache_hit_rate': cache_stats['memory_cache']['hit_rate'],
+            'time_rules': self.time_rules.get_stats(),
+            'text_capacity': self.text_capacity,
+            'day_plan': self.day_planner.get_stats() if self.day_planner else None
         }
     
     def validate_verse_availability(self, hour: int, minute: int) -> Dict[str, Any]:
@@ -204,12 +265,14 @@ class VerseManager:
             Dict with validation results
         """
         display_hour = self._convert_to_12_hour(hour)
+        slot = self.time_rules.slot(hour, minute, date.today())
         
         validation = {
             'time': f"{hour:02d}:{minute:02d}",
             'display_time': f"{display_hour}:{minute:02d}",
-            'has_special_verse': (display_hour, minute) in self.special_times,
-            'preferred_books': self._get_time_appropriate_books(hour),
+            'has_special_verse': bool(slot.special),
+            'day_part': slot.day_part,
+            'preferred_books': list(slot.preferred),
             'verse_found': False,
             'verse_source': None
         }
@@ -227,11 +290,27 @@ class VerseManager:
 class VerseScheduler:
     """Handles verse scheduling and rotation"""
     
-    def __init__(self, verse_manager: VerseManager):
+    def __init__(self, verse_manager: VerseManager, prefetch_minutes: int = 0,
+                 prefetch_workers: int = 2, prefetch_interval: float = 1.0):
         self.verse_manager = verse_manager
         self.logger = logging.getLogger(__name__)
         self.last_update_time = None
         self.current_verse = None
+        
+        # Rolling prefetch of upcoming minutes
+        self.prefetch_minutes = prefetch_minutes
+        self.prefetch_workers = max(1, prefetch_workers)
+        self.prefetch_interval = prefetch_interval  # Minimum seconds between prefetch lookups
+        self.prefetched = {}  # Minute (datetime) -> (translation, resolved verse data)
+        self.prefetch_pending = set()
+        self.prefetch_lock = threading.Lock()
+        self.prefetch_stop = threading.Event()
+        self.prefetch_thread = None
+        self.prefetch_executor = None
+        self.prefetch_hits = 0
+        self.prefetch_misses = 0
+        self._pace_lock = threading.Lock()
+        self._next_prefetch_start = 0.0
     
     def should_update_verse(self, current_time: datetime) -> bool:
         """Check if verse should be updated"""
@@ -251,7 +330,9 @@ class VerseScheduler:
         
         if force_update or self.should_update_verse(current_time):
             self.logger.info("Updating verse for new time")
-            verse_data = self.verse_manager.get_verse_for_current_time()
+            verse_data = self._take_prefetched(current_time.replace(second=0, microsecond=0))
+            if verse_data is None:
+                verse_data = self.verse_manager.get_verse_for_current_time()
             
             if verse_data:
                 self.current_verse = self.verse_manager.format_verse_for_display(
@@ -264,6 +345,137 @@ class VerseScheduler:
         
         return self.current_verse
     
+    def start_prefetch(self) -> bool:
+        """Start the background worker that resolves upcoming minutes ahead of time"""
+        if self.prefetch_minutes <= 0:
+            return False
+        
+        if self.prefetch_thread and self.prefetch_thread.is_alive():
+            return True
+        
+        self.prefetch_stop.clear()
+        self.prefetch_executor = ThreadPoolExecutor(
+            max_workers=self.prefetch_workers, thread_name_prefix='verse-prefetch'
+        )
+        self.prefetch_thread = threading.Thread(target=self._prefetch_loop, daemon=True)
+        self.prefetch_thread.start()
+        
+        self.logger.info(f"Verse prefetch started ({self.prefetch_minutes} minutes ahead, "
+                         f"{self.prefetch_workers} workers)")
+        return True
+    
+    def stop_prefetch(self):
+        """Stop the background prefetch worker"""
+        self.prefetch_stop.set()
+        
+        if self.prefetch_thread and self.prefetch_thread.is_alive():
+            self.prefetch_thread.join(timeout=5)
+        
+        if self.prefetch_executor:
+            self.prefetch_executor.shutdown(wait=False, cancel_futures=True)
+            self.prefetch_executor = None
+        
+        self.logger.info("Verse prefetch stopped")
+    
+    def _prefetch_loop(self):
+        """Keep the prefetch window topped up until stopped"""
+        while not self.prefetch_stop.is_set():
+            try:
+                self._schedule_prefetch()
+            except Exception as e:
+                self.logger.warning(f"Prefetch scheduling error: {e}")
+            
+            self.prefetch_stop.wait(5)
+    
+    def _schedule_prefetch(self):
+        """Submit lookups for upcoming minutes that are not resolved yet"""
+        now_minute = datetime.now().replace(second=0, microsecond=0)
+        
+        # Tomorrow's plan is built here well before midnight
+        self.verse_manager.prepare_day_plan(now_minute)
+        
+        upcoming = [now_minute + timedelta(minutes=i) for i in range(1, self.prefetch_minutes + 1)]
+        
+        with self.prefetch_lock:
+            # Drop minutes that have already passed
+            for minute in [m for m in self.prefetched if m < now_minute]:
+                del self.prefetched[minute]
+            
+            to_fetch = [m for m in upcoming 
+                        if m not in self.prefetched and m not in self.prefetch_pending]
+            self.prefetch_pending.update(to_fetch)
+        
+        for minute in to_fetch:
+            self.prefetch_executor.submit(self._prefetch_minute, minute)
+    
+    def _prefetch_minute(self, minute: datetime):
+        """Resolve the verse for one upcoming minute"""
+        try:
+            if not self._pace():
+                return
+            
+            version = self.verse_manager.bible_api.version
+            verse_data = self.verse_manager.get_verse_for_time(minute.hour, minute.minute, minute.date(),
+                                                               foreground=False)
+            if verse_data and verse_data.get('source') == 'fallback':
+                # Don't hold an outage fallback; the minute is retried on the next pass
+                self.logger.debug(f"Not prefetching fallback verse for {minute.strftime('%H:%M')}")
+            elif verse_data:
+                with self.prefetch_lock:
+                    self.prefetched[minute] = (version, verse_data)
+                self.logger.debug(f"Prefetched {minute.strftime('%H:%M')}: "
+                                  f"{verse_data.get('reference', 'Unknown')}")
+        except Exception as e:
+            self.logger.warning(f"Prefetch failed for {minute.strftime('%H:%M')}: {e}")
+        finally:
+            with self.prefetch_lock:
+                self.prefetch_pending.discard(minute)
+    
+    def _pace(self) -> bool:
+        """Space out prefetch lookups to stay under API rate limits"""
+        with self._pace_lock:
+            now = time.monotonic()
+            start_at = max(now, self._next_prefetch_start)
+            self._next_prefetch_start = start_at + self.prefetch_interval
+        
+        # Returns False if stopped while waiting
+        return not self.prefetch_stop.wait(start_at - now)
+    
+    def _take_prefetched(self, minute: datetime) -> Optional[Dict[str, Any]]:
+        """Take the prefetched verse for a minute, if one is ready"""
+        if self.prefetch_minutes <= 0:
+            return None
+        
+        with self.prefetch_lock:
+            entry = self.prefetched.pop(minute, None)
+        
+        # Discard verses prefetched before a translation switch
+        verse_data = None
+        if entry is not None and entry[0] == self.verse_manager.bible_api.version:
+            verse_data = entry[1]
+        
+        if verse_data is None:
+            self.prefetch_misses += 1
+        else:
+            self.prefetch_hits += 1
+        return verse_data
+    
+    def get_prefetch_stats(self) -> Dict[str, Any]:
+        """Get prefetch statistics"""
+        with self.prefetch_lock:
+            ready = len(self.prefetched)
+            pending = len(self.prefetch_pending)
+        
+        return {
+            'enabled': bool(self.prefetch_thread and self.prefetch_thread.is_alive()),
+            'window_minutes': self.prefetch_minutes,
+            'workers': self.prefetch_workers,
+            'ready': ready,
+            'pending': pending,
+            'hits': self.prefetch_hits,
+            'misses': self.prefetch_misses
+        }
+    
     def get_next_update_time(self) -> Optional[datetime]:
         """Get the time when the next update should occur"""
         if not self.last_update_time:
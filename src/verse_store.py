@@ -0,0 +1,493 @@
+"""
+Local Verse Store
+
+This module provides a compact on-disk verse store holding one or more Bible
+translations side by side. A single sorted (book, chapter, verse) reference
+index is shared by every translation, and each translation adds either an
+offset table and a UTF-8 text blob, or a single file of zlib-compressed
+verse blocks for space-constrained SD cards. All files are memory-mapped, so
+lookups cost a binary search over the shared index (plus one block
+decompression for compressed translations), resident memory stays flat and
+switching translation needs no extra index memory.
+"""
+
+import logging
+import mmap
+import os
+import struct
+import threading
+import zlib
+from pathlib import Path
+from typing import Optional, Dict, Any, Iterable, Iterator, List, Tuple
+from lru_cache import LRUCache
+
+# Project root (the directory containing src/, data/ and bin/)
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+STORE_FORMAT_VERSION = 2
+REFS_MAGIC = b'BCRI'
+OFFSETS_MAGIC = b'BCVO'
+BLOCKS_MAGIC = b'BCVZ'
+FILE_HEADER = struct.Struct('<4sHHI')    # magic, format version, reserved, count
+BLOCK_HEADER = struct.Struct('<II')      # verses per block, block count
+KEY_FORMAT = struct.Struct('<I')         # packed (book, chapter, verse) key
+OFFSET_PAIR = struct.Struct('<II')       # offset of this verse and the next
+
+REFS_FILE = 'refs.idx'
+DEFAULT_BLOCK_SIZE = 64
+BLOCK_CACHE_SIZE = 8
+
+
+def resolve_data_path(path: str) -> Path:
+    """Resolve a data path relative to the project root unless absolute"""
+    resolved = Path(path).expanduser()
+    if not resolved.is_absolute():
+        resolved = PROJECT_ROOT / resolved
+    return resolved
+
+
+def make_key(book: int, chapter: int, verse: int) -> int:
+    """Pack a (book, chapter, verse) triple into a sortable integer key"""
+    return (book << 24) | (chapter << 16) | verse
+
+
+def split_key(key: int) -> Tuple[int, int, int]:
+    """Unpack an integer key into its (book, chapter, verse) triple"""
+    return key >> 24, (key >> 16) & 0xFF, key & 0xFFFF
+
+
+def map_store_file(path: Path, magic: bytes) -> Optional[Tuple[mmap.mmap, int]]:
+    """Memory-map a store file and validate its header"""
+    with open(path, 'rb') as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    file_magic, format_version, _, count = FILE_HEADER.unpack_from(mapped, 0)
+    if file_magic != magic or format_version != STORE_FORMAT_VERSION:
+        mapped.close()
+        return None
+
+    return mapped, count
+
+
+def _char_length(data: bytes) -> int:
+    """Number of characters in UTF-8 text, decoding only if it is not ASCII"""
+    return len(data) if data.isascii() else len(data.decode('utf-8'))
+
+
+class _PlainTranslation:
+    """Offset table plus uncompressed text blob"""
+
+    compressed = False
+
+    def __init__(self, offsets: mmap.mmap, text_file: Path):
+        self.offsets = offsets
+        with open(text_file, 'rb') as f:
+            self.text = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if os.fstat(f.fileno()).st_size else b''
+
+    def get(self, position: int) -> Optional[str]:
+        start, end = OFFSET_PAIR.unpack_from(self.offsets, FILE_HEADER.size + position * KEY_FORMAT.size)
+        if start == end:
+            # Verse not present in this translation
+            return None
+        return self.text[start:end].decode('utf-8')
+
+    def length(self, position: int) -> Optional[int]:
+        start, end = OFFSET_PAIR.unpack_from(self.offsets, FILE_HEADER.size + position * KEY_FORMAT.size)
+        return _char_length(self.text[start:end]) if start != end else None
+
+    def close(self):
+        self.offsets.close()
+        if isinstance(self.text, mmap.mmap):
+            self.text.close()
+
+
+class _CompressedTranslation:
+    """
+    Independently compressed blocks of consecutive verses
+
+    File layout after the header: verses per block and block count, a table
+    of block start offsets (one extra entry marks the end), then the zlib
+    blocks. Each block decompresses to a table of verse offsets followed by
+    the verse text, so reading a verse inflates only its own block.
+    """
+
+    compressed = True
+
+    def __init__(self, blocks: mmap.mmap):
+        self.blocks = blocks
+        self.block_size, self.block_count = BLOCK_HEADER.unpack_from(blocks, FILE_HEADER.size)
+        self.table_offset = FILE_HEADER.size + BLOCK_HEADER.size
+        self.cache = LRUCache(capacity=BLOCK_CACHE_SIZE, ttl=0)
+
+    def _block(self, number: int) -> bytes:
+        """Get a decompressed block, keeping the most recent few in memory"""
+        block = self.cache.get(number)
+        if block is None:
+            start, end = OFFSET_PAIR.unpack_from(self.blocks, self.table_offset + number * KEY_FORMAT.size)
+            block = zlib.decompress(self.blocks[start:end])
+            self.cache.put(number, block)
+        return block
+
+    def _span(self, position: int) -> Tuple[Optional[bytes], int, int]:
+        """Find a verse's decompressed block and its byte range within it"""
+        number, slot = divmod(position, self.block_size)
+        if number >= self.block_count:
+            return None, 0, 0
+
+        block = self._block(number)
+        start, end = OFFSET_PAIR.unpack_from(block, slot * KEY_FORMAT.size)
+        return block, start, end
+
+    def get(self, position: int) -> Optional[str]:
+        block, start, end = self._span(position)
+        if start == end:
+            return None
+        return block[start:end].decode('utf-8')
+
+    def length(self, position: int) -> Optional[int]:
+        block, start, end = self._span(position)
+        return _char_length(block[start:end]) if start != end else None
+
+    def close(self):
+        self.blocks.close()
+        self.cache.clear()
+
+
+class VerseStore:
+    """Read-only memory-mapped verse store for one or more translations"""
+
+    def __init__(self, store_dir: str, version: str):
+        self.store_dir = resolve_data_path(store_dir)
+        self.version = version.lower()
+        self.index_file = self.store_dir / REFS_FILE
+        self.logger = logging.getLogger(__name__)
+
+        self._index = None
+        self._count = 0
+        self._opened = False
+        self._translations = {}  # version -> translation reader or None
+        self._open_lock = threading.Lock()
+
+    def _open(self) -> bool:
+        """Open and memory-map the shared reference index on first use"""
+        if self._opened:
+            return self._index is not None
+
+        with self._open_lock:
+            if not self._opened:
+                self._map_index()
+                self._opened = True
+        return self._index is not None
+
+    def _map_index(self):
+        """Memory-map the reference index if present and valid"""
+        if not self.index_file.exists():
+            self.logger.info(f"No local verse store in {self.store_dir}")
+            return False
+
+        try:
+            mapped = map_store_file(self.index_file, REFS_MAGIC)
+            if mapped is None:
+                self.logger.error(f"Unsupported verse store index: {self.index_file}")
+                return False
+
+            self._index, self._count = mapped
+            self.logger.info(f"Opened local verse store index ({self._count} references)")
+            return True
+
+        except Exception as e:
+            self.logger.error(f"Error opening verse store {self.index_file}: {e}")
+            return False
+
+    def _translation(self, version: str):
+        """Get the reader for a translation, opening it on first use"""
+        if version in self._translations:
+            return self._translations[version]
+
+        with self._open_lock:
+            if version not in self._translations:
+                self._translations[version] = self._map_translation(version)
+        return self._translations[version]
+
+    def _map_translation(self, version: str):
+        """Memory-map a translation in whichever format it was built"""
+        blocks_file = self.store_dir / f"{version}.vcz"
+        offsets_file = self.store_dir / f"{version}.off"
+        text_file = self.store_dir / f"{version}.txt"
+
+        if blocks_file.exists():
+            path, magic = blocks_file, BLOCKS_MAGIC
+        elif offsets_file.exists() and text_file.exists():
+            path, magic = offsets_file, OFFSETS_MAGIC
+        else:
+            self.logger.info(f"No local verse store for {version} in {self.store_dir}")
+            return None
+
+        try:
+            mapped = map_store_file(path, magic)
+            if mapped is None or mapped[1] != self._count:
+                if mapped is not None:
+                    mapped[0].close()
+                self.logger.error(f"Verse store file does not match the index: {path}")
+                return None
+
+            if magic == BLOCKS_MAGIC:
+                translation = _CompressedTranslation(mapped[0])
+            else:
+                translation = _PlainTranslation(mapped[0], text_file)
+
+            self.logger.info(f"Opened local verse store for {version}"
+                             f"{' (compressed)' if translation.compressed else ''}")
+            return translation
+
+        except Exception as e:
+            self.logger.error(f"Error opening verse store {path}: {e}")
+            return None
+
+    @property
+    def available(self) -> bool:
+        """Whether the store holds the current translation"""
+        return self._open() and self._translation(self.version) is not None
+
+    def set_version(self, version: str):
+        """Switch the default translation used by get_text"""
+        self.version = version.lower()
+
+    def translations(self) -> List[str]:
+        """List the translations present in the store directory"""
+        if not self.store_dir.exists():
+            return []
+        return sorted({path.stem for pattern in ('*.off', '*.vcz')
+                       for path in self.store_dir.glob(pattern)})
+
+    def is_compressed(self, version: str) -> bool:
+        """Whether a translation is stored as compressed blocks"""
+        return (self.store_dir / f"{version.lower()}.vcz").exists()
+
+    def __len__(self) -> int:
+        return self._count if self._open() else 0
+
+    def _find(self, key: int) -> Optional[int]:
+        """Binary search the shared index for a key's position"""
+        index = self._index
+        lo, hi = 0, self._count
+
+        while lo < hi:
+            mid = (lo + hi) // 2
+            mid_key = KEY_FORMAT.unpack_from(index, FILE_HEADER.size + mid * KEY_FORMAT.size)[0]
+            if mid_key < key:
+                lo = mid + 1
+            elif mid_key > key:
+                hi = mid
+            else:
+                return mid
+
+        return None
+
+    def get_text(self, book: int, chapter: int, verse: int,
+                 version: Optional[str] = None) -> Optional[str]:
+        """
+        Look up verse text by canonical book number, chapter and verse
+
+        Args:
+            book: Canonical book number
+            chapter: Chapter number
+            verse: Verse number
+            version: Translation to read (defaults to the store's current one)
+
+        Returns:
+            Verse text or None if the verse is not in the store
+        """
+        translation, position = self._locate(book, chapter, verse, version)
+        if position is None:
+            return None
+
+        return translation.get(position)
+
+    def get_length(self, book: int, chapter: int, verse: int,
+                   version: Optional[str] = None) -> Optional[int]:
+        """
+        Get a verse's text length in characters
+
+        ASCII text is measured without decoding it. Returns None if the verse
+        is not in the store.
+        """
+        translation, position = self._locate(book, chapter, verse, version)
+        if position is None:
+            return None
+
+        return translation.length(position)
+
+    def _locate(self, book: int, chapter: int, verse: int, version: Optional[str]):
+        """Get the translation reader and index position for a verse"""
+        if not self._open():
+            return None, None
+
+        translation = self._translation(version.lower() if version else self.version)
+        if translation is None:
+            return None, None
+
+        return translation, self._find(make_key(book, chapter, verse))
+
+    def iter_verses(self, version: Optional[str] = None) -> Iterator[Tuple[int, str]]:
+        """Yield (key, text) for every verse in a translation"""
+        if not self._open():
+            return
+
+        translation = self._translation(version.lower() if version else self.version)
+        if translation is None:
+            return
+
+        for position in range(self._count):
+            text = translation.get(position)
+            if text:
+                yield KEY_FORMAT.unpack_from(self._index, FILE_HEADER.size + position * KEY_FORMAT.size)[0], text
+
+    def close(self):
+        """Release the memory maps"""
+        with self._open_lock:
+            for translation in self._translations.values():
+                if translation is not None:
+                    translation.close()
+            self._translations = {}
+
+            if self._index is not None:
+                self._index.close()
+            self._index = None
+            self._count = 0
+            self._opened = False
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get store statistics"""
+        return {
+            'version': self.version,
+            'path': str(self.store_dir),
+            'available': self.available,
+            'compressed': self.is_compressed(self.version),
+            'verses': len(self),
+            'translations': self.translations()
+        }
+
+
+def write_store_file(path: Path, data: Iterable[bytes]):
+    """Write a store file atomically so running readers never see it half-written"""
+    temp_path = path.with_name(path.name + '.tmp')
+    with open(temp_path, 'wb') as f:
+        for chunk in data:
+            f.write(chunk)
+    os.replace(temp_path, path)
+
+
+def _remove_file(path: Path):
+    """Remove a file left over from the other storage format"""
+    if path.exists():
+        path.unlink()
+
+
+def _encode_texts(texts: Dict[int, str], keys: List[int]) -> Tuple[List[int], bytes]:
+    """Concatenate texts in key order; zero-length entries mark missing verses"""
+    bounds = [0]
+    blob = bytearray()
+    for key in keys:
+        text = texts.get(key)
+        if text:
+            blob += text.encode('utf-8')
+        bounds.append(len(blob))
+    return bounds, bytes(blob)
+
+
+def _write_plain(target: Path, version: str, texts: Dict[int, str], keys: List[int]):
+    """Write a translation as an offset table and text blob"""
+    bounds, blob = _encode_texts(texts, keys)
+    write_store_file(target / f"{version}.txt", [blob])
+    write_store_file(target / f"{version}.off", [
+        FILE_HEADER.pack(OFFSETS_MAGIC, STORE_FORMAT_VERSION, 0, len(keys)),
+        struct.pack(f'<{len(bounds)}I', *bounds)
+    ])
+    _remove_file(target / f"{version}.vcz")
+
+
+def _write_compressed(target: Path, version: str, texts: Dict[int, str], keys: List[int],
+                      block_size: int):
+    """Write a translation as independently compressed blocks of verses"""
+    blocks = []
+    for first in range(0, len(keys), block_size):
+        block_keys = keys[first:first + block_size]
+        bounds, blob = _encode_texts(texts, block_keys)
+        # Offsets inside the block are relative to its start, after the offset table
+        table_size = len(bounds) * KEY_FORMAT.size
+        table = struct.pack(f'<{len(bounds)}I', *(table_size + bound for bound in bounds))
+        blocks.append(zlib.compress(table + blob, 9))
+
+    # Absolute file offsets of each block, plus the end of the last one
+    position = FILE_HEADER.size + BLOCK_HEADER.size + (len(blocks) + 1) * KEY_FORMAT.size
+    starts = []
+    for block in blocks:
+        starts.append(position)
+        position += len(block)
+    starts.append(position)
+
+    write_store_file(target / f"{version}.vcz", [
+        FILE_HEADER.pack(BLOCKS_MAGIC, STORE_FORMAT_VERSION, 0, len(keys)),
+        BLOCK_HEADER.pack(block_size, len(blocks)),
+        struct.pack(f'<{len(starts)}I', *starts)
+    ] + blocks)
+    _remove_file(target / f"{version}.off")
+    _remove_file(target / f"{version}.txt")
+
+
+def build_store(store_dir: str, version: str,
+                verses: Iterable[Tuple[int, int, int, str]],
+                compress: bool = False, block_size: int = DEFAULT_BLOCK_SIZE) -> int:
+    """
+    Write or replace one translation in a verse store
+
+    Translations already in the store are kept in their existing format; the
+    shared reference index is extended with any references the new
+    translation adds.
+
+    Args:
+        store_dir: Directory to write the store files into
+        version: Translation identifier (e.g., "kjv")
+        verses: Iterable of (book number, chapter, verse, text)
+        compress: Store the translation as compressed verse blocks
+        block_size: Verses per compressed block
+
+    Returns:
+        Number of verses written for the translation
+    """
+    target = resolve_data_path(store_dir)
+    target.mkdir(parents=True, exist_ok=True)
+    version = version.lower()
+
+    # Normalize whitespace and drop duplicates (last one wins)
+    entries = {}
+    for book, chapter, verse, text in verses:
+        entries[make_key(book, chapter, verse)] = ' '.join(text.split())
+
+    # Keep every other translation already in the store
+    translations = {}
+    formats = {}
+    existing = VerseStore(str(target), version)
+    for other in existing.translations():
+        if other != version:
+            translations[other] = dict(existing.iter_verses(other))
+            formats[other] = existing.is_compressed(other)
+    existing.close()
+    translations[version] = entries
+    formats[version] = compress
+
+    keys = sorted(set().union(*translations.values()))
+
+    for name, texts in translations.items():
+        if formats[name]:
+            _write_compressed(target, name, texts, keys, max(1, block_size))
+        else:
+            _write_plain(target, name, texts, keys)
+
+    write_store_file(target / REFS_FILE, [
+        FILE_HEADER.pack(REFS_MAGIC, STORE_FORMAT_VERSION, 0, len(keys)),
+        struct.pack(f'<{len(keys)}I', *keys)
+    ])
+
+    return len(entries)
@@ -11,7 +11,7 @@ import tempfile
 import hashlib
 import logging
 from PIL import Image
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 from pathlib import Path
 
 class WaveshareIT8951:
@@ -29,6 +29,9 @@ class WaveshareIT8951:
         self.refresh_count = 0
         self.full_refresh_interval = 10
         
+        # Regions reported changed for the last refresh (None when unknown)
+        self.last_dirty_regions = None
+        
         # Validate driver availability
         if not Path(self.driver_path).exists():
             raise FileNotFoundError(f"Driver not found: {self.driver_path}")
@@ -60,23 +63,34 @@ class WaveshareIT8951:
             self.logger.error(f"Display initialization failed: {e}")
             return False
     
-    def display(self, image: Image.Image, force_refresh: bool = False) -> bool:
+    def display(self, image: Image.Image, force_refresh: bool = False,
+                dirty_regions: Optional[List[Tuple[int, int, int, int]]] = None) -> bool:
         """
         Display an image on the e-ink screen with optimization
         
         Args:
             image: PIL Image to display
             force_refresh: Force full refresh regardless of optimization
+            dirty_regions: Rectangles (left, top, right, bottom) that differ
+                from the image currently on screen, or None if unknown
             
         Returns:
             bool: True if successful, False otherwise
         """
         try:
+            if image.size != (self.width, self.height):
+                dirty_regions = None  # Regions don't survive resizing
+            
+            # Nothing changed - no need to convert or hash the frame
+            if not force_refresh and dirty_regions is not None and not dirty_regions:
+                self.logger.debug("Skipping refresh - no dirty regions")
+                return True
+            
             # Prepare image
             processed_image = self._prepare_image(image)
             
             # Check if image has changed (optimization)
-            if not force_refresh and self._should_skip_refresh(processed_image):
+            if not force_refresh and dirty_regions is None and self._should_skip_refresh(processed_image):
                 self.logger.debug("Skipping refresh - image unchanged")
                 return True
             
@@ -90,6 +104,10 @@ class WaveshareIT8951:
                     processed_image.save(tmp_file.name, 'BMP')
                     tmp_file.flush()
                     
+                    # The driver CLI always takes a whole frame; the regions
+                    # are kept for region-limited refresh modes
+                    self.last_dirty_regions = None if force_refresh else dirty_regions
+                    
                     # Call driver to display image
                     result = subprocess.run(
                         [self.driver_path, self.vcom_value, refresh_mode, tmp_file.name], 
@@ -188,7 +206,10 @@ class WaveshareIT8951:
             'vcom_value': self.vcom_value,
             'driver_path': self.driver_path,
             'refresh_count': self.refresh_count,
-            'last_hash': self.last_image_hash[:8] if self.last_image_hash else None
+            'last_hash': self.last_image_hash[:8] if self.last_image_hash else None,
+            'last_dirty_regions': self.last_dirty_regions,
+            'last_dirty_area': (sum((r - l) * (b - t) for l, t, r, b in self.last_dirty_regions)
+                                if self.last_dirty_regions is not None else None)
         }
 
 
@@ -205,7 +226,8 @@ class OptimizedWaveshareIT8951(WaveshareIT8951):
         self.display_times = []
         self.skipped_refreshes = 0
         
-    def display(self, image: Image.Image, force_refresh: bool = False) -> bool:
+    def display(self, image: Image.Image, force_refresh: bool = False,
+                dirty_regions: Optional[List[Tuple[int, int, int, int]]] = None) -> bool:
         """Enhanced display method with performance tracking"""
         import time
         
@@ -213,13 +235,21 @@ class OptimizedWaveshareIT8951(WaveshareIT8951):
         
         # Use change detection if enabled
         if self.enable_change_detection and not force_refresh:
-            if self._should_skip_refresh(self._prepare_image(image)):
+            if dirty_regions is not None and image.size == (self.width, self.height):
+                unchanged = not dirty_regions
+            else:
+                unchanged = self._should_skip_refresh(self._prepare_image(image))
+            
+            if unchanged:
                 self.skipped_refreshes += 1
                 self.logger.debug(f"Skipped refresh #{self.skipped_refreshes}")
                 return True
+        elif not force_refresh:
+            # Change detection disabled - refresh even if nothing changed
+            dirty_regions = None
         
         # Call parent display method
-        result = super().display(image, force_refresh)
+        result = super().display(image, force_refresh, dirty_regions)
         
         # Track performance
         display_time = time.time() - start_time